@@ -47,3 +47,6 @@ DATA_PATH = (
 print("DATA_PATH: ", DATA_PATH)
 
 DATE_COLUMN = DATA_CONFIG.get("date_column", "Date")
+
+# In-process parsed dataset cache budget (MB)
+DATASET_CACHE_MAX_MB = DATA_CONFIG.get("cache_max_mb", 512)
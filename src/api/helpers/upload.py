@@ -0,0 +1,115 @@
+#api/helpers/upload.py
+from typing import List, Optional
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+
+class MultipartFileStream:
+    """
+    Incremental multipart/form-data parser for one file field.
+
+    Feed it the raw request body chunk by chunk with `write`; each call
+    returns the bytes of the `field` file part found in that chunk, so
+    the upload never has to be spooled whole. `filename` is set once the
+    part's headers have been read. Other form fields are ignored.
+
+    Raises ValueError for a non-multipart request, a missing boundary,
+    malformed or truncated multipart data, or a form without the file
+    field.
+    """
+
+    def __init__(self, content_type: Optional[str], field: str = "file"):
+        media_type, params = parse_options_header(content_type or "")
+        if media_type != b"multipart/form-data":
+            raise ValueError("Expected a multipart/form-data upload")
+        if b"boundary" not in params:
+            raise ValueError("Missing boundary in multipart upload")
+
+        self.field = field
+        self.filename: Optional[str] = None
+
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._in_file = False
+        self._seen_file = False
+        self._ended = False
+        self._data: List[bytes] = []
+
+        self._parser = MultipartParser(
+            params[b"boundary"],
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_end": self._on_end,
+            },
+        )
+
+    # --------------------------------------------
+    # Parser callbacks
+    # --------------------------------------------
+
+    def _on_part_begin(self) -> None:
+        self._disposition = b""
+        self._in_file = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+
+        if name == self.field and b"filename" in options and not self._seen_file:
+            self.filename = options[b"filename"].decode("utf-8", "replace")
+            self._in_file = self._seen_file = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._data.append(data[start:end])
+
+    def _on_end(self) -> None:
+        self._ended = True
+
+    # --------------------------------------------
+    # Public
+    # --------------------------------------------
+
+    def write(self, chunk: bytes) -> bytes:
+        """
+        Parse the next body chunk; returns its file-part bytes.
+        """
+        try:
+            self._parser.write(chunk)
+        except Exception as e:
+            raise ValueError(f"Invalid multipart data: {e}") from e
+
+        data, self._data = b"".join(self._data), []
+        return data
+
+    def finalize(self) -> None:
+        """
+        Check the body ended with a complete form holding the file field.
+        """
+        try:
+            self._parser.finalize()
+        except Exception as e:
+            raise ValueError(f"Invalid multipart data: {e}") from e
+
+        if not self._ended:
+            raise ValueError("Incomplete multipart upload")
+        if not self._seen_file:
+            raise ValueError(f"Form has no '{self.field}' file")
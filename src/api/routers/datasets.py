@@ -1,13 +1,20 @@
 # from fastapi import FastAPI
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 import os
 import uuid
-import shutil
+from pathlib import Path
+from typing import Any, Dict, List
+import pandas as pd
 from pydantic import BaseModel
 
-from api.config import DATA_PATH
-from var_engine.data_loader.csv_loader import CSVPriceLoader
+from api.config import DATA_PATH, DATE_COLUMN, DATASET_CACHE_MAX_MB
+from api.services.dataset_catalog import CATALOG, catalog_entry
+from api.services.market_data import MARKET_DATA
+from api.helpers.upload import MultipartFileStream
+from var_engine.data_loader.csv_loader import DataLoaderError, DATASET_CACHE
+from var_engine.data_loader.binary_store import StreamingStoreWriter, append_prices
 
 # app = FastAPI()
 router = APIRouter()
@@ -17,59 +24,147 @@ print("DATA_DIR: ", DATA_DIR)
 # DATA_DIR = "data"
 os.makedirs(DATA_DIR, exist_ok=True)
 
+DATASET_CACHE.resize(DATASET_CACHE_MAX_MB * 1024 ** 2)
+
 @router.get("/datasets")
 def list_sample_files():
-    files = os.listdir(DATA_DIR)
-    # Filter only CSV or allowed extensions, if needed
-    sample_files = [f for f in files if f.endswith(".csv")]
-    return {"files": sample_files}
+    return {"files": CATALOG.list()}
+
+@router.post("/datasets/rescan")
+def rescan_datasets():
+    """
+    Sync the catalog with files added or removed outside the API.
+    """
+    CATALOG.refresh()
+    return {"files": CATALOG.list()}
+
+@router.get("/datasets/cache/stats")
+def dataset_cache_stats():
+    return {
+        "datasets": DATASET_CACHE.stats(),
+        "market_data": MARKET_DATA.stats(),
+    }
 
 @router.get("/datasets/{filename}")
 def get_sample_file(filename: str):
-    filepath = os.path.join(DATA_DIR, filename)
+    try:
+        filepath = CATALOG.dataset_path(filename)
+    except DataLoaderError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not os.path.exists(filepath):
         return {"error": "File not found"}
     return FileResponse(filepath, media_type="text/csv", filename=filename)
 
 @router.post("/datasets/upload")
-def upload_dataset(file: UploadFile = File(...)):
-    if not file.filename.endswith(".csv"):
-        raise HTTPException(status_code=400, detail="Only CSV files are allowed")
+async def upload_dataset(request: Request):
+    """
+    Stream an uploaded CSV (multipart form, `file` field) to disk while
+    validating rows and building its binary store and catalog entry in
+    the same pass.
+
+    The form is parsed incrementally as the body arrives and the file
+    part's bytes go straight to the store writer, so memory stays
+    bounded by the writer's parse batch rather than the upload size.
+    Blocking work (disk writes, parsing) runs in the thread pool, so the
+    event loop is never held for the duration of a large upload.
+    """
+    try:
+        form = MultipartFileStream(request.headers.get("content-type"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    unique_name = f"{uuid.uuid4().hex}_{file.filename}"
-    target_path = os.path.join(DATA_DIR, unique_name)
+    writer = None
 
-    with open(target_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    try:
+        async for chunk in request.stream():
+            data = form.write(chunk)
+
+            if writer is None and form.filename is not None:
+                writer = await run_in_threadpool(_upload_writer, form.filename)
+            if data:
+                await run_in_threadpool(writer.feed, data)
+
+        form.finalize()
+        summary = await run_in_threadpool(writer.close)
+    except DataLoaderError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid dataset: {str(e)}")
+    except ValueError as e:
+        if writer is not None:
+            await run_in_threadpool(writer.abort)
+        raise HTTPException(status_code=400, detail=str(e))
+    except BaseException:
+        if writer is not None:
+            await run_in_threadpool(writer.abort)
+        raise
+
+    entry = await run_in_threadpool(CATALOG.register, writer.csv_path.name, summary["checksum"])
+
+    return {
+        "filename": writer.csv_path.name,
+        "binary": "error" not in entry,
+        "rows": summary["rows"],
+        "assets": summary["columns"],
+    }
+
+def _upload_writer(filename: str) -> StreamingStoreWriter:
+    """
+    Store writer for an uploaded file under a unique dataset name.
+    """
+    if not filename.endswith(".csv"):
+        raise HTTPException(status_code=400, detail="Only CSV files are allowed")
 
-    return {"filename": unique_name}
+    unique_name = f"{uuid.uuid4().hex}_{filename}"
+    try:
+        target_path = CATALOG.dataset_path(unique_name)
+    except DataLoaderError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-class InspectRequest(BaseModel):
-    dataset_name: str
+    return StreamingStoreWriter(target_path, DATE_COLUMN)
 
-@router.post("/datasets/inspect")
-def inspect_dataset(request: InspectRequest):
-    file_path = f"{DATA_DIR}/{request.dataset_name}"
-    print(file_path)
+class AppendRequest(BaseModel):
+    rows: List[Dict[str, Any]]
+
+@router.post("/datasets/{filename}/append")
+def append_dataset(filename: str, request: AppendRequest):
+    """
+    Append new dated price rows (e.g. today's close) to a dataset.
 
+    The CSV is appended to and the binary store rewritten from its old
+    arrays without re-parsing (only the new days' returns are computed);
+    cached market snapshots roll their window statistics forward
+    incrementally.
+    """
     try:
-        loader = CSVPriceLoader(path=file_path)
-        df = loader.load_prices()  # Use load_prices here to get prices, not returns
-        if df.empty:
-            raise HTTPException(status_code=400, detail="Price data is empty")
+        file_path = CATALOG.dataset_path(filename)
+    except DataLoaderError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        asset_columns = [c for c in df.columns if c.lower() != "date"]
+    if not file_path.exists():
+        raise HTTPException(status_code=400, detail=f"Dataset not found: {filename}")
 
-        # Get last available prices as dict
-        spot_prices = df.iloc[-1].to_dict()
+    try:
+        appended = append_prices(file_path, pd.DataFrame(request.rows), DATE_COLUMN)
+    except DataLoaderError as e:
+        raise HTTPException(status_code=400, detail=f"Append failed: {str(e)}")
 
-        return {
-            "assets": asset_columns,
-            "spot_prices": spot_prices,
-        }
+    MARKET_DATA.advance(file_path)
+    entry = CATALOG.register(filename)
 
-    except Exception as e:
-        print(f"Error retrieving asset names and spot prices: {e}")
-        raise HTTPException(status_code=400, detail=f"Data load failed: {str(e)}")
+    return {
+        "filename": filename,
+        "rows_appended": appended,
+        "rows": entry["rows"],
+        "end_date": entry["end_date"],
+    }
 
+class InspectRequest(BaseModel):
+    dataset_name: str
+
+@router.post("/datasets/inspect")
+def inspect_dataset(request: InspectRequest):
+    entry = catalog_entry(request.dataset_name)
 
+    return {
+        "assets": entry["tickers"],
+        "spot_prices": entry["spot_prices"],
+    }
@@ -1,19 +1,20 @@
+import math
 from fastapi import APIRouter, HTTPException
 from pathlib import Path
 from typing import Dict, Any
 
 from api.helpers.portfolio import build_portfolio_from_request
 from api.config import DATA_PATH
-from var_engine.data_loader.csv_loader import CSVPriceLoader
+from api.services.market_data import MARKET_DATA
 from var_engine.risk_models.greeks_model import GreeksService
+from var_engine.risk_models.ladder import DEFAULT_SPOT_SHOCKS, DEFAULT_VOL_SHOCKS
 
 router = APIRouter(prefix="/greeks", tags=["Greeks"])
 
 DATA_DIR = DATA_PATH
 
 
-@router.post("/calculate")
-def calculate_greeks(request: dict):
+def _portfolio_and_market_data(request: dict):
 
     dataset_name = request.get("dataset_name")
     if not dataset_name:
@@ -23,18 +24,6 @@ def calculate_greeks(request: dict):
     if not csv_path.exists():
         raise HTTPException(400, f"Dataset not found: {dataset_name}")
 
-    try:
-        loader = CSVPriceLoader(
-            path=csv_path,
-            asof_date=request.get("asof_date")
-        )
-
-        market_data: Dict[str, Any] = loader.build_market_data(
-            estimation_window_days=request.get("estimation_window_days")
-        )
-    except Exception as e:
-        raise HTTPException(400, f"Failed to load market data: {e}")
-
     products = request.get("products")
     if not products:
         raise HTTPException(400, "Products required")
@@ -44,6 +33,26 @@ def calculate_greeks(request: dict):
     except Exception as e:
         raise HTTPException(400, f"Failed to build portfolio: {e}")
 
+    try:
+        snapshot = MARKET_DATA.snapshot(
+            csv_path,
+            asof_date=request.get("asof_date"),
+            window=request.get("estimation_window_days"),
+            columns=portfolio.tickers or None,
+        )
+
+        market_data: Dict[str, Any] = snapshot.to_market_data()
+    except Exception as e:
+        raise HTTPException(400, f"Failed to load market data: {e}")
+
+    return portfolio, market_data
+
+
+@router.post("/calculate")
+def calculate_greeks(request: dict):
+
+    portfolio, market_data = _portfolio_and_market_data(request)
+
     try:
         service = GreeksService(
             portfolio,
@@ -56,3 +65,48 @@ def calculate_greeks(request: dict):
         raise HTTPException(500, f"Greeks calculation failed: {e}")
 
     return results
+
+
+@router.post("/ladder")
+def greeks_ladder(request: dict):
+    """
+    Portfolio and position P&L over a (spot shock x vol shock) grid per
+    underlying. Shocks are relative moves, e.g. spot_shocks=[-0.2, ..., 0.2].
+    """
+    portfolio, market_data = _portfolio_and_market_data(request)
+
+    try:
+        spot_shocks = [float(s) for s in request.get("spot_shocks") or DEFAULT_SPOT_SHOCKS]
+        vol_shocks = [float(v) for v in request.get("vol_shocks") or DEFAULT_VOL_SHOCKS]
+    except (TypeError, ValueError):
+        raise HTTPException(400, "Shocks must be lists of numbers")
+
+    if not all(math.isfinite(x) for x in spot_shocks + vol_shocks):
+        raise HTTPException(400, "Shocks must be finite numbers")
+
+    if any(s <= -1.0 for s in spot_shocks) or any(v <= -1.0 for v in vol_shocks):
+        raise HTTPException(400, "Shocks must be greater than -1 (-100%)")
+
+    underlyings = request.get("underlyings")
+    if underlyings:
+        missing = [u for u in underlyings if u not in market_data["spot"]]
+        if missing:
+            raise HTTPException(400, f"Underlyings not in dataset: {missing}")
+
+    try:
+        service = GreeksService(
+            portfolio,
+            rate=request.get("rate", 0.05),
+        )
+
+        results = service.ladder(
+            market_data=market_data,
+            spot_shocks=spot_shocks,
+            vol_shocks=vol_shocks,
+            underlyings=underlyings,
+        )
+
+    except Exception as e:
+        raise HTTPException(500, f"Ladder calculation failed: {e}")
+
+    return results
@@ -7,7 +7,8 @@ from typing import Dict, Any
 
 from api.config import DATA_PATH
 from api.schemas.var import HistSimRequest, HistSimResponse
-from var_engine.data_loader.csv_loader import CSVPriceLoader
+from api.services.market_data import load_market_data
+from var_engine.data_loader.csv_loader import DataLoaderError
 from api.helpers.portfolio import build_portfolio_from_request
 from var_engine.risk_models.historical_simulation import HistSimVaR
 
@@ -21,7 +22,7 @@ def calculate_histsim(request: HistSimRequest):
     Calculate Historical Simulation VaR using proper product structure.
     """
     # -------------------------------------------------
-    # 1. Load dataset
+    # 1. Locate dataset
     # -------------------------------------------------
     print("Loading dataset.")
     dataset_name = request.dataset_name
@@ -35,43 +36,9 @@ def calculate_histsim(request: HistSimRequest):
     if not csv_path.exists():
         raise HTTPException(400, f"Dataset not found: {dataset_name}")
 
-    loader = CSVPriceLoader(path=csv_path)
-    prices = loader.load_prices()
-    returns = loader.load_returns()
-
-    if prices.empty or returns.empty:
-        raise HTTPException(400, "Insufficient data")
-
-    if request.estimation_window_days:
-        returns = returns.tail(request.estimation_window_days)
-
-    # Get latest prices (spot)
-    latest_prices = prices.iloc[-1]
-
-    spot: Dict[str, float] = {
-        k: float(v) for k, v in latest_prices.to_dict().items()
-    }
-
-    # Estimate covariance from returns
-
-    cov = returns.cov()
-
-    market_data: Dict[str, Any] = {
-        "spot": spot,
-        "returns": returns,
-        "cov": cov,
-        "horizon": 1.0 / 252,
-    }
-    # df = pd.read_csv(csv_path)
-
-    # if DATE_COLUMN not in df.columns:
-    #     raise HTTPException(400, f"Missing {DATE_COLUMN}")
-
-    # df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN])
-    # df = df.set_index(DATE_COLUMN).sort_index()
-
     # -------------------------------------------------
     # 2. Build portfolio from products
+    #    (its tickers select the dataset columns to load)
     # -------------------------------------------------
     products = request.products
     print("products: ", products)
@@ -88,12 +55,40 @@ def calculate_histsim(request: HistSimRequest):
         # portfolio = build_portfolio_from_request(products_dicts)
     except Exception as e:
         raise HTTPException(400, f"Failed to build portfolio: {str(e)}")
+
+    # -------------------------------------------------
+    # 3. Load market data for the portfolio's tickers
+    # -------------------------------------------------
+    try:
+        market_data: Dict[str, Any] = load_market_data(
+            csv_path,
+            asof_date=None,
+            window=request.estimation_window_days,
+            columns=portfolio.tickers or None,
+            factor_sources=request.factor_sources,
+        )
+    except DataLoaderError as e:
+        raise HTTPException(400, f"Failed to load market data: {e}")
+    # df = pd.read_csv(csv_path)
+
+    # if DATE_COLUMN not in df.columns:
+    #     raise HTTPException(400, f"Missing {DATE_COLUMN}")
+
+    # df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN])
+    # df = df.set_index(DATE_COLUMN).sort_index()
+
     print("Portfolio: ", portfolio)
 
 
     model = HistSimVaR(
         confidence_level=request.confidence_level,
-        hist_data_window_days = request.estimation_window_days
+        hist_data_window_days = request.estimation_window_days,
+        horizon_days=request.horizon_days,
+        dtype=request.dtype,
+        vol_filter=request.vol_filter,
+        ewma_lambda=request.ewma_lambda,
+        confidence_levels=request.confidence_levels,
+        horizons_days=request.horizons_days,
     )
 
     results = model.run(portfolio, market_data=market_data)
@@ -104,6 +99,7 @@ def calculate_histsim(request: HistSimRequest):
         portfolio_value=results.portfolio_value,
         var_dollar=results.var_dollar,
         var_percent=results.var_percent,
+        var_table=results.var_table,
         diagnostics=results.metadata,
     )
 
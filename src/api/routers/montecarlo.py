@@ -5,15 +5,28 @@ import pandas as pd
 from typing import Dict, Any
 
 from api.config import DATA_PATH
+from api.services.dataset_catalog import catalog_entry
 from api.schemas.var import MonteCarloRequest, MonteCarloResponse
-from var_engine.data_loader.csv_loader import CSVPriceLoader
+from api.services.market_data import load_market_data
+from var_engine.data_loader.csv_loader import DataLoaderError
 from api.helpers.portfolio import build_portfolio_from_request
 from var_engine.risk_models.monte_carlo import MonteCarloVaR
+from var_engine.scenarios import (
+    GBMScenarioGenerator,
+    BlockBootstrapGenerator,
+    StudentTScenarioGenerator,
+)
 
 
 router = APIRouter(prefix="/montecarlo", tags=["Monte Carlo Simulation"])
 DATA_DIR = DATA_PATH
 
+GENERATORS = {
+    "gbm": GBMScenarioGenerator,
+    "block_bootstrap": BlockBootstrapGenerator,
+    "student_t": StudentTScenarioGenerator,
+    "t_copula": StudentTScenarioGenerator,
+}
 
 class InspectRequest(BaseModel):
     dataset_name: str
@@ -24,7 +37,7 @@ def calculate_montecarlo_var(request: MonteCarloRequest):
     Calculate Monte Carlo Simulation VaR.
     """
     # -------------------------------------------------
-    # 1. Load dataset
+    # 1. Locate dataset
     # -------------------------------------------------
     dataset_name = request.dataset_name
     if not dataset_name:
@@ -34,36 +47,9 @@ def calculate_montecarlo_var(request: MonteCarloRequest):
     if not csv_path.exists():
         raise HTTPException(400, f"Dataset not found: {dataset_name}")
 
-    loader = CSVPriceLoader(path=csv_path)
-    prices = loader.load_prices()
-    returns = loader.load_returns()
-
-    if prices.empty or returns.empty:
-        raise HTTPException(400, "Insufficient data")
-
-    if request.estimation_window_days:
-        returns = returns.tail(request.estimation_window_days)
-
-    # Get latest prices (spots)
-    latest_prices = prices.iloc[-1]
-
-    spot: Dict[str, float] = {
-        k: float(v) for k, v in latest_prices.to_dict().items()
-    }
-
-    # Estimate covariance from returns
-
-    cov = returns.cov()
-
-    market_data: Dict[str, Any] = {
-        "spot": spot,
-        "returns": returns,
-        "cov": cov,
-        "horizon": 1.0 / 252,
-    }
-
     # -------------------------------------------------
     # 2. Build portfolio from products
+    #    (its tickers select the dataset columns to load)
     # -------------------------------------------------
     products = request.products
     print("products: ", products)
@@ -76,12 +62,41 @@ def calculate_montecarlo_var(request: MonteCarloRequest):
     except Exception as e:
         raise HTTPException(400, f"Failed to build portfolio: {str(e)}")
 
+    # -------------------------------------------------
+    # 3. Load market data for the portfolio's tickers
+    # -------------------------------------------------
+    try:
+        market_data: Dict[str, Any] = load_market_data(
+            csv_path,
+            asof_date=None,
+            window=request.estimation_window_days,
+            columns=portfolio.tickers or None,
+            factor_sources=request.factor_sources,
+        )
+    except DataLoaderError as e:
+        raise HTTPException(400, f"Failed to load market data: {e}")
+
+
+
+    generator_kwargs: Dict[str, Any] = {}
+
+    if request.generator == "block_bootstrap":
+        generator_kwargs["block_length"] = request.block_length
+        generator_kwargs["method"] = request.bootstrap_method
+    elif request.generator in ("student_t", "t_copula"):
+        generator_kwargs["dof"] = request.dof
+        generator_kwargs["copula"] = request.generator == "t_copula"
 
     model = MonteCarloVaR(
         confidence_level=request.confidence_level,
         n_sims=request.n_sims,
         random_seed=request.random_seed,
-        vol_of_vol=request.vol_of_vol
+        vol_of_vol=request.vol_of_vol,
+        dtype=request.dtype,
+        generator=GENERATORS[request.generator],
+        generator_kwargs=generator_kwargs,
+        confidence_levels=request.confidence_levels,
+        horizons_days=request.horizons_days,
     )
 
     results = model.run(portfolio, market_data=market_data)
@@ -92,6 +107,7 @@ def calculate_montecarlo_var(request: MonteCarloRequest):
         portfolio_value=results.portfolio_value,
         var_dollar=results.var_dollar,
         var_percent=results.var_percent,
+        var_table=results.var_table,
         diagnostics=results.metadata,
     )
 
@@ -100,17 +116,8 @@ def calculate_montecarlo_var(request: MonteCarloRequest):
     
 @router.post("/inspect")
 def inspect_dataset(request: InspectRequest):
-    file_path = f"{DATA_DIR}/{request.dataset_name}"
-
-    try:
-        loader = CSVPriceLoader(path=file_path)
-        df = loader.load_returns()
-    except Exception as e:
-        print(f"Error retreiving asset names: {e}")
-        raise HTTPException(status_code=400, detail=f"Data load failed: {str(e)}")
-    
-    asset_columns = [c for c in df.columns if c.lower() != "date"]
+    entry = catalog_entry(request.dataset_name)
 
     return {
-        "assets": asset_columns
+        "assets": entry["tickers"]
     }
@@ -5,10 +5,21 @@ import pandas as pd
 from typing import Dict, Any
 
 from api.config import DATA_PATH
-from api.schemas.var import ParametricRequest, ParametricResponse
-from var_engine.data_loader.csv_loader import CSVPriceLoader
+from api.services.dataset_catalog import catalog_entry
+from api.schemas.var import (
+    ParametricRequest,
+    ParametricResponse,
+    ParametricBatchRequest,
+    ParametricBatchResponse,
+)
+from api.services.market_data import load_market_data
+from api.services.artifacts import ARTIFACTS
+from var_engine.data_loader.csv_loader import DataLoaderError
 from api.helpers.portfolio import build_portfolio_from_request
 from var_engine.risk_models.parametric import ParametricVaR
+from var_engine.risk_models.delta_gamma import DeltaGammaVaR
+from var_engine.time_series.rolling import ewma_cov_estimator
+from var_engine.time_series.factor_covariance import pca_cov_estimator
 
 
 # import os
@@ -25,6 +36,14 @@ DATA_DIR = DATA_PATH
 class InspectRequest(BaseModel):
     dataset_name: str
 
+
+def _cov_estimator(request: ParametricRequest, market_data: Dict[str, Any]):
+    if request.cov_model == "ewma":
+        return ewma_cov_estimator(request.ewma_lambda, cached=market_data.get("ewma_cov"))
+    if request.cov_model == "pca":
+        return pca_cov_estimator(request.n_factors)
+    return None
+
 # @router.post("/parametric/calculate")
 @router.post("/calculate")
 # @router.post("/parametric/calculate", response_model=ParametricResponse)
@@ -34,7 +53,7 @@ def calculate_parametric_var(request: ParametricRequest):
     """
     print("request: ", request)
     # -------------------------------------------------
-    # 1. Load dataset
+    # 1. Locate dataset
     # -------------------------------------------------
     # print("Loading dataset.")
     dataset_name = request.dataset_name
@@ -48,39 +67,9 @@ def calculate_parametric_var(request: ParametricRequest):
     if not csv_path.exists():
         raise HTTPException(400, f"Dataset not found: {dataset_name}")
 
-    loader = CSVPriceLoader(
-        path=csv_path,
-        asof_date=request.asof_date
-    )
-    prices = loader.load_prices()
-    returns = loader.load_returns()
-
-    if prices.empty or returns.empty:
-        raise HTTPException(400, "Insufficient data")
-
-    if request.estimation_window_days:
-        returns = returns.tail(request.estimation_window_days)
-
-    # Get latest prices (spots)
-    latest_prices = prices.iloc[-1]
-
-    spot: Dict[str, float] = {
-        k: float(v) for k, v in latest_prices.to_dict().items()
-    }
-
-    # Estimate covariance from returns
-
-    cov = returns.cov()
-
-    market_data: Dict[str, Any] = {
-        "spot": spot,
-        "returns": returns,
-        "cov": cov,
-        "horizon": 1.0 / 252,
-    }
-
     # -------------------------------------------------
     # 2. Build portfolio from products
+    #    (its tickers select the dataset columns to load)
     # -------------------------------------------------
     products = request.products
     print("products: ", products)
@@ -92,11 +81,34 @@ def calculate_parametric_var(request: ParametricRequest):
 
     except Exception as e:
         raise HTTPException(400, f"Failed to build portfolio: {str(e)}")
+
+    # -------------------------------------------------
+    # 3. Load market data for the portfolio's tickers
+    # -------------------------------------------------
+    try:
+        market_data: Dict[str, Any] = load_market_data(
+            csv_path,
+            asof_date=request.asof_date,
+            window=request.estimation_window_days,
+            columns=portfolio.tickers or None,
+            factor_sources=request.factor_sources,
+            # Covariance comes from cov_estimator over the returns
+            dense_cov=False,
+        )
+    except DataLoaderError as e:
+        raise HTTPException(400, f"Failed to load market data: {e}")
+
     # print("Portfolio: ", portfolio)
 
-    model = ParametricVaR(
+    model_cls = DeltaGammaVaR if request.method == "delta_gamma" else ParametricVaR
+
+    model = model_cls(
         confidence_level=request.confidence_level,
         cov_window_days=request.estimation_window_days,
+        cov_estimator=_cov_estimator(request, market_data),
+        confidence_levels=request.confidence_levels,
+        horizons_days=request.horizons_days,
+        artifacts=ARTIFACTS,
     )
 
 
@@ -108,6 +120,7 @@ def calculate_parametric_var(request: ParametricRequest):
         portfolio_value=results.portfolio_value,
         var_dollar=results.var_dollar,
         var_percent=results.var_percent,
+        var_table=results.var_table,
         # volatility_percent=results.volatility,            
         # correlation_matrix=results.metadata["correlation_matrix"],
         diagnostics=results.metadata,
@@ -117,31 +130,107 @@ def calculate_parametric_var(request: ParametricRequest):
 
     return response
 
-    
-# @router.post("/parameric/inspect")
-@router.post("/inspect")
-def inspect_dataset(request: InspectRequest):
-    file_path = f"{DATA_DIR}/{request.dataset_name}"
-    print(file_path)
 
+@router.get("/artifacts/{run_id}/{name}")
+def get_artifact(run_id: str, name: str):
+    """
+    Heavy output of a /calculate run ("pnls", "correlation_matrix"),
+    built on first request.
+    """
     try:
-        loader = CSVPriceLoader(path=file_path)
-        df = loader.load_prices()  # Use load_prices here to get prices, not returns
-        if df.empty:
-            raise HTTPException(status_code=400, detail="Price data is empty")
+        value = ARTIFACTS.get(run_id, name)
+    except KeyError:
+        raise HTTPException(404, f"Artifact not found: {run_id}/{name}")
 
-        asset_columns = [c for c in df.columns if c.lower() != "date"]
+    return {"run_id": run_id, "name": name, "value": value}
 
-        # Get last available prices as dict
-        spot_prices = df.iloc[-1].to_dict()
 
-        return {
-            "assets": asset_columns,
-            "spot_prices": spot_prices,
-        }
+@router.post("/calculate_batch")
+def calculate_parametric_var_batch(request: ParametricBatchRequest):
+    """
+    Parametric VaR for many portfolios against one dataset and window:
+    market data and covariance are built once and every portfolio's
+    variance comes from one diag(W Sigma W') pass.
+    """
+    # -------------------------------------------------
+    # 1. Locate dataset
+    # -------------------------------------------------
+    dataset_name = request.dataset_name
+    if not dataset_name:
+        raise HTTPException(400, "Dataset name required")
 
-    except Exception as e:
-        print(f"Error retrieving asset names and spot prices: {e}")
-        raise HTTPException(status_code=400, detail=f"Data load failed: {str(e)}")
+    csv_path = Path(DATA_DIR) / dataset_name
+    if not csv_path.exists():
+        raise HTTPException(400, f"Dataset not found: {dataset_name}")
 
+    # -------------------------------------------------
+    # 2. Build portfolios
+    # -------------------------------------------------
+    if not request.portfolios:
+        raise HTTPException(400, "Portfolios required")
+    if request.method != "delta":
+        raise HTTPException(400, "Batch mode supports method='delta' only")
+
+    portfolios = {}
+    for name, products in request.portfolios.items():
+        if not products:
+            raise HTTPException(400, f"Products required for portfolio: {name}")
+        try:
+            portfolios[name] = build_portfolio_from_request(products)
+        except Exception as e:
+            raise HTTPException(400, f"Failed to build portfolio {name}: {str(e)}")
+
+    tickers = list(dict.fromkeys(t for p in portfolios.values() for t in p.tickers))
 
+    # -------------------------------------------------
+    # 3. Load market data for the union of tickers
+    # -------------------------------------------------
+    try:
+        market_data: Dict[str, Any] = load_market_data(
+            csv_path,
+            asof_date=request.asof_date,
+            window=request.estimation_window_days,
+            columns=tickers or None,
+            factor_sources=request.factor_sources,
+            # run_batch estimates the covariance with cov_estimator
+            dense_cov=False,
+        )
+    except DataLoaderError as e:
+        raise HTTPException(400, f"Failed to load market data: {e}")
+
+    model = ParametricVaR(
+        confidence_level=request.confidence_level,
+        cov_window_days=request.estimation_window_days,
+        cov_estimator=_cov_estimator(request, market_data),
+        confidence_levels=request.confidence_levels,
+        horizons_days=request.horizons_days,
+    )
+
+    try:
+        results = model.run_batch(portfolios, market_data=market_data)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    return ParametricBatchResponse(
+        results={
+            name: ParametricResponse(
+                portfolio_value=r.portfolio_value,
+                var_dollar=r.var_dollar,
+                var_percent=r.var_percent,
+                var_table=r.var_table,
+                diagnostics=r.metadata,
+            )
+            for name, r in results.items()
+        }
+    )
+
+    
+# @router.post("/parameric/inspect")
+@router.post("/inspect")
+def inspect_dataset(request: InspectRequest):
+    entry = catalog_entry(request.dataset_name)
+
+    return {
+        "assets": entry["tickers"],
+        "spot_prices": entry["spot_prices"],
+    }
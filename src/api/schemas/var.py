@@ -1,4 +1,4 @@
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Literal, Annotated
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
 
@@ -26,6 +26,10 @@ class BaseVaRRequest(BaseModel):
     confidence_level: float = Field(0.01, gt=0, lt=1)
     estimation_window_days: Optional[int] = Field(252, ge=1)
 
+    # VaR term structure: one result row per (horizon, level)
+    confidence_levels: Optional[List[Annotated[float, Field(gt=0, lt=1)]]] = None
+    horizons_days: Optional[List[Annotated[int, Field(ge=1)]]] = None
+
     asof_date: Optional[str] = Field(
         None, description="End date for data window (YYYY-MM-DD)"
     )
@@ -33,19 +37,45 @@ class BaseVaRRequest(BaseModel):
     # ✅ NEW — allow frontend factor overrides
     factors: Optional[FactorInputs] = None
 
+    factor_sources: Optional[Dict[Literal["vol", "rate"], str]] = Field(
+        None,
+        description=(
+            "Extra vol / rate datasets aligned onto dataset_name's calendar; "
+            "a rate dataset with several tenor columns (3M, 1Y, 10Y, ...) is "
+            "used as a zero curve"
+        ),
+    )
+
 
 class ParametricRequest(BaseVaRRequest):
-    pass
+    method: Literal["delta", "delta_gamma"] = "delta"
+    cov_model: Literal["sample", "ewma", "pca"] = "sample"
+    ewma_lambda: float = Field(0.94, gt=0, lt=1)
+    n_factors: int = Field(10, ge=1, description="Number of PCA factors for cov_model='pca'")
+
+
+class ParametricBatchRequest(ParametricRequest):
+    portfolios: Dict[str, List[Dict[str, Any]]] = Field(
+        ..., description="Products per portfolio name, all run against one covariance"
+    )
 
 
 class MonteCarloRequest(BaseVaRRequest):
     n_sims: int = Field(10_000, gt=0)
     random_seed: Optional[int] = None
     vol_of_vol: Optional[float] = None
+    dtype: Literal["float32", "float64"] = "float64"
+    generator: Literal["gbm", "block_bootstrap", "student_t", "t_copula"] = "gbm"
+    block_length: int = Field(5, ge=1)
+    bootstrap_method: Literal["stationary", "moving"] = "stationary"
+    dof: Optional[float] = Field(None, gt=2, description="Student-t degrees of freedom; fitted from returns if omitted")
 
 
 class HistSimRequest(BaseVaRRequest):
-    pass
+    horizon_days: int = Field(1, ge=1)
+    dtype: Literal["float32", "float64"] = "float64"
+    vol_filter: Optional[Literal["ewma", "garch"]] = None
+    ewma_lambda: float = Field(0.94, gt=0, lt=1)
 
 
 # ===============================
@@ -56,6 +86,7 @@ class BaseVaRResponse(BaseModel):
     portfolio_value: float
     var_dollar: float
     var_percent: float
+    var_table: Optional[List[Dict[str, float]]] = None
     diagnostics: Optional[Dict[str, Any]] = None
 
 
@@ -63,6 +94,10 @@ class ParametricResponse(BaseVaRResponse):
     pass
 
 
+class ParametricBatchResponse(BaseModel):
+    results: Dict[str, ParametricResponse]
+
+
 class MonteCarloResponse(BaseVaRResponse):
     pass
 
@@ -0,0 +1,5 @@
+from var_engine.risk_models.artifacts import ArtifactStore
+
+
+# Heavy per-run outputs (P&L grids, correlation matrices), fetched by run id
+ARTIFACTS = ArtifactStore()
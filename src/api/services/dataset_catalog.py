@@ -0,0 +1,29 @@
+import os
+from fastapi import HTTPException
+
+from api.config import DATA_PATH, DATE_COLUMN
+from var_engine.data_loader.catalog import DatasetCatalog
+from var_engine.data_loader.csv_loader import DataLoaderError
+
+
+os.makedirs(DATA_PATH, exist_ok=True)
+
+# Built (or synced with the files on disk) once at startup
+CATALOG = DatasetCatalog(DATA_PATH, date_column=DATE_COLUMN)
+CATALOG.refresh()
+
+
+def catalog_entry(dataset_name: str) -> dict:
+    """
+    Catalog entry for an inspectable dataset, or a 400 error.
+    """
+    try:
+        entry = CATALOG.get(dataset_name)
+    except DataLoaderError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if entry is None:
+        raise HTTPException(status_code=400, detail=f"Dataset not found: {dataset_name}")
+    if "error" in entry:
+        raise HTTPException(status_code=400, detail=f"Data load failed: {entry['error']}")
+    return entry
@@ -0,0 +1,39 @@
+from pathlib import Path
+from typing import Optional, Dict, Any, Sequence
+
+from api.config import DATA_PATH, DATE_COLUMN
+from var_engine.data_loader.market_data import MarketDataService
+from var_engine.data_loader.panel import MarketDataPanel
+
+
+# Shared by every VaR and Greeks router
+MARKET_DATA = MarketDataService(date_column=DATE_COLUMN)
+
+# Multi-source (spot + vol / rate) panels aligned on the spot calendar
+MARKET_PANEL = MarketDataPanel(date_column=DATE_COLUMN)
+
+
+def load_market_data(
+    csv_path: Path,
+    asof_date: Optional[str],
+    window: Optional[int],
+    columns: Optional[Sequence[str]],
+    factor_sources: Optional[Dict[str, str]] = None,
+    dense_cov: bool = True,
+) -> Dict[str, Any]:
+    """
+    market_data for a request: a cached snapshot of one dataset, or an
+    aligned panel when extra vol / rate datasets are given.
+
+    dense_cov=False skips the sample covariance of a snapshot for
+    models that estimate their own.
+    """
+    if not factor_sources:
+        snapshot = MARKET_DATA.snapshot(csv_path, asof_date=asof_date, window=window, columns=columns)
+        return snapshot.to_market_data(dense_cov=dense_cov)
+
+    names = [MARKET_PANEL.register(f"spot:{csv_path.name}", csv_path, "spot").name]
+    for kind, dataset_name in factor_sources.items():
+        names.append(MARKET_PANEL.register(f"{kind}:{dataset_name}", Path(DATA_PATH) / dataset_name, kind).name)
+
+    return MARKET_PANEL.market_data(names, asof_date=asof_date, window=window, columns=columns)
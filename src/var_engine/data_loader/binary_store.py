@@ -0,0 +1,697 @@
+import csv
+import hashlib
+import io
+import json
+import os
+import threading
+import uuid
+import warnings
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Dict, Any, Sequence, Tuple
+
+from var_engine.data_loader.csv_loader import (
+    CSVPriceLoader,
+    DataLoaderError,
+    DatasetCache,
+    DATASET_CACHE,
+)
+
+
+# Binary stores live next to their CSV: <data_dir>/.binary/<csv name>/
+BINARY_DIR_NAME = ".binary"
+
+# Bumped whenever the on-disk layout changes; older stores are rebuilt
+STORE_VERSION = 2
+
+# Serialises appends (CSV + store rewrite) across requests
+_APPEND_LOCK = threading.Lock()
+
+# Held while a store's files are swapped in and while a reader opens
+# them, so a reader always sees one complete version
+_STORE_LOCK = threading.Lock()
+
+STORE_ARRAYS = ("prices", "dates", "returns")
+
+
+def binary_store_path(csv_path: str | Path) -> Path:
+    csv_path = Path(csv_path)
+    return csv_path.parent / BINARY_DIR_NAME / csv_path.name
+
+
+def _source_stamp(csv_path: Path) -> Dict[str, int]:
+    st = csv_path.stat()
+    return {"source_mtime_ns": st.st_mtime_ns, "source_size": st.st_size}
+
+
+def _read_meta(store: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(store / "meta.json", "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def is_binary_store_fresh(csv_path: str | Path, date_column: str = "Date") -> bool:
+    """
+    True if the binary store exists and was built from the current CSV.
+    """
+    csv_path = Path(csv_path)
+    meta = _read_meta(binary_store_path(csv_path))
+    if meta is None:
+        return False
+
+    stamp = _source_stamp(csv_path)
+    return (
+        meta.get("version") == STORE_VERSION
+        and meta.get("date_column") == date_column
+        and meta.get("source_mtime_ns") == stamp["source_mtime_ns"]
+        and meta.get("source_size") == stamp["source_size"]
+    )
+
+
+def _commit_store(store: Path, files: Dict[str, Path], meta: Dict[str, Any]) -> None:
+    """
+    Move fully written temporary files into place under the store lock.
+
+    meta.json is replaced, never removed, so a reader always finds one;
+    readers opening under the same lock (`_open_store`) see either the
+    old or the new version as a whole. Already open memory maps keep
+    the replaced files alive.
+    """
+    tmp = store / f"meta.{uuid.uuid4().hex}.json"
+    with open(tmp, "w") as f:
+        json.dump(meta, f)
+
+    with _STORE_LOCK:
+        for name, path in files.items():
+            os.replace(path, store / f"{name}.npy")
+        os.replace(tmp, store / "meta.json")
+
+
+def _open_store(store: Path) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Metadata and memory-mapped arrays of one consistent store version.
+    """
+    with _STORE_LOCK:
+        meta = _read_meta(store)
+        if meta is None:
+            raise DataLoaderError(f"Binary store is missing or incomplete: {store}")
+        try:
+            arrays = {name: np.load(store / f"{name}.npy", mmap_mode="r") for name in STORE_ARRAYS}
+        except (FileNotFoundError, ValueError) as e:
+            raise DataLoaderError(f"Binary store is missing or incomplete: {store}") from e
+
+    # Another process may have rewritten the store between the reads
+    T, n = arrays["prices"].shape
+    if (
+        n != len(meta.get("columns", ()))
+        or len(arrays["dates"]) != T
+        or arrays["returns"].shape != (max(T - 1, 0), n)
+    ):
+        raise DataLoaderError(f"Binary store is inconsistent, retry: {store}")
+
+    return meta, arrays
+
+
+def _write_store(store: Path, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> None:
+    token = uuid.uuid4().hex
+    files = {}
+    for name, arr in arrays.items():
+        files[name] = store / f"{name}.{token}.npy"
+        np.save(files[name], arr)
+
+    _commit_store(store, files, meta)
+
+
+def convert_csv_to_binary(
+    csv_path: str | Path,
+    date_column: str = "Date",
+    prices: Optional[pd.DataFrame] = None,
+) -> Path:
+    """
+    Convert a price CSV once into a columnar binary store:
+
+        prices.npy        (T, n) float64 price matrix
+        dates.npy         (T,) datetime64 sorted date index
+        returns.npy       (T - 1, n) float64 log returns; row t is the
+                          return into date t + 1 (NaN where missing)
+        meta.json         columns, date column and source CSV stamp
+
+    Matrices are stored column-major, so projecting a few tickers only
+    touches their own pages. Arrays are written first and meta.json
+    last, so a store is only considered valid once it is complete.
+
+    Parameters
+    ----------
+    csv_path : str | Path
+        Source CSV.
+    date_column : str
+        Name of the date column.
+    prices : Optional[pd.DataFrame]
+        Already parsed prices (date-indexed), to avoid re-reading the CSV.
+
+    Returns
+    -------
+    Path
+        Store directory.
+    """
+    csv_path = Path(csv_path)
+    store = binary_store_path(csv_path)
+    store.mkdir(parents=True, exist_ok=True)
+
+    stamp = _source_stamp(csv_path)
+
+    if prices is None:
+        prices = CSVPriceLoader(csv_path, date_column=date_column, cache=None).load_prices()
+
+    values = prices.to_numpy(dtype=np.float64)
+
+    arrays = {
+        "prices": np.asfortranarray(values),
+        "dates": prices.index.to_numpy(),
+        "returns": np.asfortranarray(np.log(values[1:] / values[:-1])),
+    }
+
+    _write_store(
+        store,
+        arrays,
+        {
+            "version": STORE_VERSION,
+            "columns": [str(c) for c in prices.columns],
+            "date_column": date_column,
+            **stamp,
+        },
+    )
+
+    return store
+
+
+def append_prices(
+    csv_path: str | Path,
+    rows: pd.DataFrame,
+    date_column: str = "Date",
+) -> int:
+    """
+    Append new dated price rows to a dataset without re-parsing it.
+
+    Rows are validated against the stored data (same columns, finite
+    positive prices, strictly increasing dates after the last stored
+    date) and appended to the CSV. The CSV is not re-parsed and only the
+    log returns of the new days are computed, but the binary store's
+    arrays are rewritten: the stored rows are copied block-wise from
+    their memory maps into new files, so an append costs O(T n) disk
+    I/O with bounded memory, and readers keep the old version until the
+    new one is committed.
+
+    Parameters
+    ----------
+    csv_path : str | Path
+        Dataset CSV.
+    rows : pd.DataFrame
+        New prices, with the date either as `date_column` or the index.
+    date_column : str
+        Name of the date column.
+
+    Returns
+    -------
+    int
+        Number of rows appended.
+    """
+    csv_path = Path(csv_path)
+
+    if date_column in rows.columns:
+        rows = rows.set_index(date_column)
+
+    if rows.empty:
+        raise DataLoaderError("No rows to append")
+
+    with _APPEND_LOCK:
+        if not is_binary_store_fresh(csv_path, date_column):
+            convert_csv_to_binary(csv_path, date_column)
+
+        store = binary_store_path(csv_path)
+        meta, old = _open_store(store)
+        columns = meta["columns"]
+
+        missing = [c for c in columns if c not in rows.columns]
+        unexpected = [c for c in rows.columns if c not in columns]
+        if missing or unexpected:
+            raise DataLoaderError(
+                f"Appended rows must have the dataset columns "
+                f"(missing: {missing}, unexpected: {unexpected})"
+            )
+
+        try:
+            dates = pd.DatetimeIndex(pd.to_datetime(rows.index))
+            values = rows[columns].to_numpy(dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise DataLoaderError(f"Invalid rows to append: {e}") from e
+
+        # Log returns need strictly positive prices
+        if not (np.isfinite(values) & (values > 0)).all():
+            raise DataLoaderError("Appended prices must be finite and positive")
+
+        if not dates.is_monotonic_increasing or dates.has_duplicates:
+            raise DataLoaderError("Appended dates must be strictly increasing")
+
+        old_prices, old_dates, old_returns = old["prices"], old["dates"], old["returns"]
+
+        last = pd.Timestamp(old_dates[-1])
+        if dates[0] <= last:
+            raise DataLoaderError(
+                f"Appended dates must be after the last stored date {last.date()}"
+            )
+
+        # CSV first: if the store update fails it is merely stale and is
+        # rebuilt from the CSV on next use
+        header = list(pd.read_csv(csv_path, nrows=0).columns)
+        out = pd.DataFrame(values, columns=columns)
+        out[date_column] = (
+            dates.strftime("%Y-%m-%d") if (dates == dates.normalize()).all()
+            else dates.astype(str)
+        )
+
+        with open(csv_path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(-1, os.SEEK_END)
+            needs_newline = size > 0 and f.read(1) != b"\n"
+
+        with open(csv_path, "a", newline="") as f:
+            if needs_newline:
+                f.write("\n")
+            out.to_csv(f, header=False, index=False, columns=header)
+
+        # New rows' returns; the previous day is the last stored price
+        previous = np.vstack([old_prices[-1:], values[:-1]])
+        new_returns = np.log(values / previous)
+
+        token = uuid.uuid4().hex
+        files = {name: store / f"{name}.{token}.npy" for name in STORE_ARRAYS}
+
+        _extend_array(files["prices"], old_prices, values)
+        _extend_array(files["returns"], old_returns, new_returns)
+        np.save(files["dates"], np.concatenate([old_dates, dates.to_numpy().astype(old_dates.dtype)]))
+
+        _commit_store(store, files, {**meta, **_source_stamp(csv_path)})
+
+    return len(values)
+
+
+def _extend_array(path: Path, old: np.ndarray, new_rows: np.ndarray) -> None:
+    """
+    Write old rows followed by new_rows as a column-major .npy file.
+    The old (memory-mapped) rows are copied in column blocks of ~64 MB,
+    so memory stays bounded whatever the store size.
+    """
+    T, n = old.shape
+    out = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float64, shape=(T + len(new_rows), n), fortran_order=True
+    )
+
+    step = max(1, (64 << 20) // (8 * max(T, 1)))
+    for j in range(0, n, step):
+        out[:T, j:j + step] = old[:, j:j + step]
+    out[T:] = new_rows
+
+    out.flush()
+    del out
+
+
+class StreamingStoreWriter:
+    """
+    Write a dataset CSV and build its binary store in one pass over a
+    byte stream (e.g. an upload), validating rows as they arrive.
+
+    Fed bytes are written to the CSV and hashed immediately. Complete
+    lines are parsed in batches of about `batch_bytes`: price columns
+    must be numeric and dates strictly increasing across the whole file.
+    Parsed prices go row-major to a scratch file; `close` copies them
+    block-wise into the column-major store and computes returns, so the
+    CSV is never read back.
+
+    Malformed input (bad encoding, unparsable CSV, invalid values) raises
+    DataLoaderError, which leaves no CSV or store behind.
+    """
+
+    def __init__(
+        self,
+        csv_path: str | Path,
+        date_column: str = "Date",
+        batch_bytes: int = 32 << 20,
+    ):
+        self.csv_path = Path(csv_path)
+        self.date_column = date_column
+        self.batch_bytes = int(batch_bytes)
+
+        self.store = binary_store_path(self.csv_path)
+        self.store.mkdir(parents=True, exist_ok=True)
+        self._token = uuid.uuid4().hex
+        self._scratch_path = self.store / f"prices.{self._token}.rows"
+
+        self._csv = open(self.csv_path, "wb")
+        self._scratch = open(self._scratch_path, "wb")
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._pending = bytearray()
+
+        self.header: Optional[list] = None
+        self.columns: Optional[list] = None
+        self.rows = 0
+        self._dates: list = []
+
+    # --------------------------------------------
+    # Incremental parsing
+    # --------------------------------------------
+
+    def _parse_header(self, line: bytes) -> None:
+        try:
+            header = next(csv.reader([line.decode("utf-8-sig").strip()]), [])
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise DataLoaderError(f"Invalid CSV header: {e}") from e
+
+        if self.date_column not in header:
+            raise DataLoaderError(f"Date column '{self.date_column}' not found in CSV")
+        if len(set(header)) != len(header):
+            raise DataLoaderError("Duplicate column names in CSV header")
+
+        self.header = header
+        self.columns = [c for c in header if c != self.date_column]
+        if not self.columns:
+            raise DataLoaderError("CSV has no price columns")
+
+    def _parse_rows(self, data: bytes) -> None:
+        if self.header is None:
+            nl = data.find(b"\n")
+            line, data = (data, b"") if nl < 0 else (data[:nl], data[nl + 1:])
+            self._parse_header(line)
+
+        if not data.strip():
+            return
+
+        try:
+            with warnings.catch_warnings():
+                # Rows with extra fields would otherwise be silently truncated
+                warnings.simplefilter("error", pd.errors.ParserWarning)
+                df = pd.read_csv(
+                    io.BytesIO(data),
+                    header=None,
+                    names=self.header,
+                    index_col=False,
+                )
+            dates = pd.to_datetime(df.pop(self.date_column)).to_numpy()
+        except (ValueError, csv.Error, pd.errors.ParserError, pd.errors.ParserWarning) as e:
+            # ValueError covers UnicodeDecodeError (non-UTF-8 bytes)
+            raise DataLoaderError(f"Invalid rows after data row {self.rows}: {e}") from e
+
+        non_numeric = [c for c, dtype in df.dtypes.items() if not pd.api.types.is_numeric_dtype(dtype)]
+        if non_numeric:
+            raise DataLoaderError(
+                f"All price columns must be numeric (after data row {self.rows}: {non_numeric[:5]})"
+            )
+
+        if len(dates) == 0:
+            return
+
+        if np.isnat(dates).any():
+            raise DataLoaderError(f"Missing dates after data row {self.rows}")
+
+        if self._dates:
+            dates = dates.astype(self._dates[0].dtype)
+            previous = self._dates[-1][-1]
+        else:
+            previous = None
+
+        if (np.diff(dates) <= np.timedelta64(0)).any() or (previous is not None and dates[0] <= previous):
+            raise DataLoaderError(f"Dates must be strictly increasing (after data row {self.rows})")
+
+        values = df.to_numpy(dtype=np.float64)
+        self._scratch.write(np.ascontiguousarray(values).tobytes())
+        self._dates.append(dates)
+        self.rows += len(dates)
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Consume the next chunk of the CSV byte stream.
+        """
+        try:
+            self._csv.write(chunk)
+            self._hash.update(chunk)
+            self._pending += chunk
+
+            if len(self._pending) >= self.batch_bytes:
+                cut = self._pending.rfind(b"\n") + 1
+                if cut:
+                    self._parse_rows(bytes(self._pending[:cut]))
+                    del self._pending[:cut]
+        except DataLoaderError:
+            self.abort()
+            raise
+
+    # --------------------------------------------
+    # Finalisation
+    # --------------------------------------------
+
+    def _build_store(self) -> None:
+        T, n = self.rows, len(self.columns)
+        files = {name: self.store / f"{name}.{self._token}.npy" for name in ("prices", "dates", "returns")}
+
+        scratch = np.memmap(self._scratch_path, dtype=np.float64, mode="r", shape=(T, n))
+        prices = np.lib.format.open_memmap(
+            files["prices"], mode="w+", dtype=np.float64, shape=(T, n), fortran_order=True
+        )
+
+        if T > 1:
+            returns = np.lib.format.open_memmap(
+                files["returns"], mode="w+", dtype=np.float64, shape=(T - 1, n), fortran_order=True
+            )
+        else:
+            np.save(files["returns"], np.empty((0, n), dtype=np.float64, order="F"))
+            returns = None
+
+        # ~64 MB row blocks
+        step = max(1, (64 << 20) // (8 * n))
+        for i in range(0, T, step):
+            j = min(i + step, T)
+            prices[i:j] = scratch[i:j]
+
+            lo, hi = max(i, 1) - 1, j - 1
+            if returns is not None and hi > lo:
+                returns[lo:hi] = np.log(scratch[lo + 1:hi + 1] / scratch[lo:hi])
+
+        prices.flush()
+        if returns is not None:
+            returns.flush()
+        del prices, returns, scratch
+
+        np.save(files["dates"], np.concatenate(self._dates))
+        self._scratch_path.unlink()
+
+        _commit_store(
+            self.store,
+            files,
+            {
+                "version": STORE_VERSION,
+                "columns": self.columns,
+                "date_column": self.date_column,
+                **_source_stamp(self.csv_path),
+            },
+        )
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Parse the remaining bytes and commit the binary store.
+
+        Returns
+        -------
+        dict
+            columns, rows and checksum (blake2b of the CSV bytes).
+        """
+        try:
+            if self._pending.strip():
+                self._parse_rows(bytes(self._pending))
+            self._pending.clear()
+
+            self._csv.close()
+            self._scratch.close()
+
+            if self.header is None:
+                raise DataLoaderError("CSV is empty")
+            if self.rows == 0:
+                raise DataLoaderError("CSV has no data rows")
+
+            self._build_store()
+        except DataLoaderError:
+            self.abort()
+            raise
+
+        return {
+            "columns": self.columns,
+            "rows": self.rows,
+            "checksum": self._hash.hexdigest(),
+        }
+
+    def abort(self) -> None:
+        """
+        Discard the partial CSV and store files.
+        """
+        self._csv.close()
+        self._scratch.close()
+        self.csv_path.unlink(missing_ok=True)
+        for tmp in self.store.glob(f"*.{self._token}.*"):
+            tmp.unlink(missing_ok=True)
+        if not any(self.store.iterdir()):
+            self.store.rmdir()
+
+
+class BinaryPriceLoader(CSVPriceLoader):
+    """
+    Price loader backed by the columnar binary store of a CSV.
+
+    Arrays are opened memory-mapped, so prices and returns are served as
+    zero-copy views and only the pages actually touched are read. asof
+    slicing is a binary search on the sorted date index, and `columns`
+    projects the column-major matrices onto the requested tickers.
+    Returns are precomputed at conversion time; rows with missing data
+    in the loaded columns are dropped as in CSVPriceLoader.
+
+    With a `cache`, the projected prices and NaN-filtered returns are
+    built once per (CSV version, date column, columns) and shared
+    through the DatasetCache like parsed CSVs; asof requests slice the
+    cached frames.
+
+    The store is (re)built from the CSV on first use if it is missing or
+    older than the CSV. Its arrays are opened once, so a loader keeps
+    serving one store version while appends commit newer ones.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        date_column: str = "Date",
+        asof_date: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        cache: Optional[DatasetCache] = DATASET_CACHE,
+    ):
+        super().__init__(
+            path,
+            date_column=date_column,
+            asof_date=asof_date,
+            cache=cache,
+            columns=columns,
+        )
+
+        if not is_binary_store_fresh(self.path, date_column):
+            convert_csv_to_binary(self.path, date_column)
+
+        self.store = binary_store_path(self.path)
+        self._meta, self._arrays = _open_store(self.store)
+        stored = self._meta["columns"]
+
+        if self.columns is None:
+            self.columns = stored
+            self._col_idx = None
+        else:
+            position = {c: i for i, c in enumerate(stored)}
+            missing = [c for c in self.columns if c not in position]
+            if missing:
+                raise DataLoaderError(f"Columns not found in dataset: {missing}")
+            self._col_idx = np.array([position[c] for c in self.columns], dtype=np.intp)
+
+    def append(self, rows: pd.DataFrame) -> int:
+        """
+        Append new dated rows to this dataset; see `append_prices`.
+        """
+        return append_prices(self.path, rows, self.date_column)
+
+    def _open(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def _cache_key(self):
+        # Key on the CSV version the opened arrays were built from, not
+        # the file's current stat, so a concurrent append cannot file
+        # old arrays under the new version
+        columns = tuple(self.columns) if self.columns is not None else None
+        return (
+            str(self.path.resolve()),
+            self._meta["source_mtime_ns"],
+            self._meta["source_size"],
+            self.date_column,
+            columns,
+        )
+
+    def _asof_rows(self, dates: np.ndarray, asof_date: Optional[str]) -> int:
+        effective_asof = self._effective_asof(asof_date)
+        if effective_asof is None:
+            return len(dates)
+
+        return int(np.searchsorted(dates, effective_asof.to_datetime64(), side="right"))
+
+    def _project(self, values: np.ndarray, rows: int) -> np.ndarray:
+        if self._col_idx is None:
+            return values[:rows]
+        return values[:rows, self._col_idx]
+
+    def _frame(self, values: np.ndarray, dates: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(
+            values,
+            index=pd.DatetimeIndex(dates, name=self.date_column),
+            columns=self.columns,
+            copy=False,
+        )
+
+    # --------------------------------------------
+    # Full-history frames (cached via CSVPriceLoader._dataset)
+    # --------------------------------------------
+
+    def _read_prices(self) -> pd.DataFrame:
+        dates = self._open("dates")
+        return self._frame(self._project(self._open("prices"), len(dates)), dates)
+
+    def _read_returns(self) -> pd.DataFrame:
+        dates = self._open("dates")
+        values = self._project(self._open("returns"), len(dates) - 1)
+        dates = dates[1:]
+
+        # Drop days with missing data in any loaded column
+        missing = np.isnan(values).any(axis=1)
+        if missing.any():
+            values = values[~missing]
+            dates = dates[~missing]
+
+        return self._frame(values, dates)
+
+    def load_prices(self, asof_date: Optional[str] = None) -> pd.DataFrame:
+        _, entry = self._dataset()
+        prices = entry.prices
+        rows = self._asof_rows(prices.index.to_numpy(), asof_date)
+
+        if rows == 0:
+            raise DataLoaderError(
+                f"No data available on or before asof_date={self._effective_asof(asof_date).date()}"
+            )
+
+        return prices.iloc[:rows]
+
+    def load_returns(self, asof_date: Optional[str] = None) -> pd.DataFrame:
+        key, entry = self._dataset()
+
+        if entry.returns is None:
+            old_nbytes = entry.nbytes
+            entry.returns = self._read_returns()
+            if key is not None:
+                self.cache.update_size(key, old_nbytes)
+
+        if self._asof_rows(entry.prices.index.to_numpy(), asof_date) == 0:
+            raise DataLoaderError(
+                f"No data available on or before asof_date={self._effective_asof(asof_date).date()}"
+            )
+
+        returns = entry.returns
+        returns = returns.iloc[:self._asof_rows(returns.index.to_numpy(), asof_date)]
+
+        if returns.empty:
+            raise DataLoaderError("Return DataFrame is empty after processing")
+
+        return returns
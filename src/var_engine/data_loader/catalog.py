@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from var_engine.data_loader.csv_loader import DataLoaderError
+from var_engine.data_loader.binary_store import (
+    BINARY_DIR_NAME,
+    BinaryPriceLoader,
+    binary_store_path,
+)
+
+
+CATALOG_FILE = "catalog.json"
+
+
+def file_checksum(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class DatasetCatalog:
+    """
+    JSON index of the price datasets in a data directory.
+
+    Each entry stores tickers, date range, row count, last spot prices,
+    a checksum of the CSV and a pointer to its binary store, so listing
+    and inspect requests are dictionary lookups instead of CSV parses.
+
+    Entries are built from the memory-mapped binary store (converting the
+    CSV if needed) and re-registered when the CSV's mtime or size
+    changes. Datasets that fail validation are kept with an "error".
+    """
+
+    def __init__(self, data_dir: str | Path, date_column: str = "Date"):
+        self.data_dir = Path(data_dir)
+        self.date_column = date_column
+        self.path = self.data_dir / BINARY_DIR_NAME / CATALOG_FILE
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    # --------------------------------------------
+    # Persistence
+    # --------------------------------------------
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{CATALOG_FILE}.{uuid.uuid4().hex}")
+        with open(tmp, "w") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp, self.path)
+
+    # --------------------------------------------
+    # Entries
+    # --------------------------------------------
+
+    def dataset_path(self, filename: str) -> Path:
+        """
+        Path of a dataset in the data directory. Raises DataLoaderError
+        for names that are not a plain file name inside it (separators,
+        "..", hidden files, symlinks leading out).
+        """
+        if not filename or Path(filename).name != filename or filename.startswith("."):
+            raise DataLoaderError(f"Invalid dataset name: {filename!r}")
+
+        path = (self.data_dir / filename).resolve()
+        if path.parent != self.data_dir.resolve():
+            raise DataLoaderError(f"Invalid dataset name: {filename!r}")
+
+        return path
+
+    def _is_current(self, filename: str) -> bool:
+        entry = self._entries.get(filename)
+        if entry is None:
+            return False
+
+        try:
+            st = self.dataset_path(filename).stat()
+        except FileNotFoundError:
+            return False
+
+        return (
+            entry["source_mtime_ns"] == st.st_mtime_ns
+            and entry["source_size"] == st.st_size
+        )
+
+    def _build_entry(self, filename: str, checksum: Optional[str] = None) -> Dict[str, Any]:
+        csv_path = self.data_dir / filename
+        st = csv_path.stat()
+
+        entry: Dict[str, Any] = {
+            "filename": filename,
+            "source_mtime_ns": st.st_mtime_ns,
+            "source_size": st.st_size,
+            "checksum": checksum or file_checksum(csv_path),
+        }
+
+        try:
+            prices = BinaryPriceLoader(csv_path, date_column=self.date_column, cache=None).load_prices()
+        except (DataLoaderError, ValueError) as e:
+            entry["error"] = str(e)
+            return entry
+
+        entry.update(
+            {
+                "tickers": list(prices.columns),
+                "start_date": str(prices.index[0].date()),
+                "end_date": str(prices.index[-1].date()),
+                "rows": len(prices),
+                "spot_prices": {k: float(v) for k, v in prices.iloc[-1].items()},
+                "binary_store": str(binary_store_path(csv_path).relative_to(self.data_dir)),
+            }
+        )
+
+        return entry
+
+    def register(self, filename: str, checksum: Optional[str] = None) -> Dict[str, Any]:
+        """
+        (Re)build and persist the entry for one dataset. `checksum` may
+        be passed when it was computed while the file was written.
+        """
+        self.dataset_path(filename)
+
+        with self._lock:
+            entry = self._build_entry(filename, checksum)
+            self._entries[filename] = entry
+            self._save()
+            return entry
+
+    def refresh(self) -> None:
+        """
+        Sync the catalog with the CSV files on disk.
+        """
+        with self._lock:
+            on_disk = set()
+            for f in os.listdir(self.data_dir):
+                try:
+                    if f.endswith(".csv") and self.dataset_path(f).is_file():
+                        on_disk.add(f)
+                except DataLoaderError:
+                    continue
+            changed = False
+
+            for filename in set(self._entries) - on_disk:
+                del self._entries[filename]
+                changed = True
+
+            for filename in sorted(on_disk):
+                if not self._is_current(filename):
+                    self._entries[filename] = self._build_entry(filename)
+                    changed = True
+
+            if changed:
+                self._save()
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Catalog entry for a dataset, or None if it does not exist.
+        Raises DataLoaderError for invalid names (see `dataset_path`).
+        """
+        path = self.dataset_path(filename)
+
+        with self._lock:
+            if self._is_current(filename):
+                return self._entries[filename]
+
+            if not path.is_file():
+                if self._entries.pop(filename, None) is not None:
+                    self._save()
+                return None
+
+            return self.register(filename)
+
+    def list(self) -> List[str]:
+        """
+        Dataset names from the index (no directory scan); files added or
+        removed outside the API show up after the next `refresh`.
+        """
+        with self._lock:
+            return sorted(self._entries)
@@ -1,29 +1,165 @@
 import pandas as pd
 import numpy as np
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Sequence
 
 
 class DataLoaderError(Exception):
     pass
 
 
+# --------------------------------------------
+# Process-wide parsed dataset cache
+# --------------------------------------------
+
+CacheKey = Tuple[str, int, int, str, Optional[Tuple[str, ...]]]
+
+
+@dataclass
+class CachedDataset:
+    """
+    Parsed, validated, date-sorted prices and (lazily) their log returns.
+
+    Cached frames are shared between requests and must be treated as
+    read-only.
+    """
+    prices: pd.DataFrame
+    returns: Optional[pd.DataFrame] = None
+
+    @property
+    def nbytes(self) -> int:
+        total = int(self.prices.memory_usage(index=True).sum())
+        if self.returns is not None:
+            total += int(self.returns.memory_usage(index=True).sum())
+        return total
+
+
+class DatasetCache:
+    """
+    Thread-safe LRU cache of parsed datasets with a memory cap.
+
+    Keys are (path, mtime_ns, size, date_column, columns), so a file
+    rewritten in place is re-parsed and its stale entries dropped. Least recently used
+    entries are evicted once the total size exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 ** 2):
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[CacheKey, CachedDataset]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: CacheKey) -> Optional[CachedDataset]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, entry: CachedDataset) -> CachedDataset:
+        with self._lock:
+            # Drop stale versions of the same file / date column / projection
+            for stale in [k for k in self._entries if k[0] == key[0] and k[3:] == key[3:]]:
+                self._bytes -= self._entries.pop(stale).nbytes
+
+            self._entries[key] = entry
+            self._bytes += entry.nbytes
+            self._evict()
+            return entry
+
+    def update_size(self, key: CacheKey, old_nbytes: int) -> None:
+        """
+        Re-account an entry whose lazily computed frames have grown.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            self._bytes += entry.nbytes - old_nbytes
+            self._evict()
+
+    def _evict(self) -> None:
+        # Always keep the most recent entry, even if it alone exceeds the cap
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+DATASET_CACHE = DatasetCache()
+
+
 class CSVPriceLoader:
     def __init__(
         self,
         path: str | Path,
         date_column: str = "Date",
         asof_date: Optional[str] = None,
+        cache: Optional[DatasetCache] = DATASET_CACHE,
+        columns: Optional[Sequence[str]] = None,
     ):
+        """
+        Parameters
+        ----------
+        columns : Optional[Sequence[str]]
+            Price columns to load (all if None). Only these are parsed,
+            so cost scales with the portfolio rather than the file.
+        """
         self.path = Path(path)
         self.date_column = date_column
         self.asof_date = pd.to_datetime(asof_date) if asof_date else None
+        self.cache = cache
+        self.columns = list(dict.fromkeys(columns)) if columns is not None else None
 
         if not self.path.exists():
             raise DataLoaderError(f"CSV file not found: {self.path}")
 
-    def load_prices(self, asof_date: Optional[str] = None) -> pd.DataFrame:
-        df = pd.read_csv(self.path)
+    # --------------------------------------------
+    # Parsing / caching
+    # --------------------------------------------
+
+    def _read_prices(self) -> pd.DataFrame:
+        usecols = None
+        if self.columns is not None:
+            header = pd.read_csv(self.path, nrows=0).columns
+            missing = [c for c in self.columns if c not in header]
+            if missing:
+                raise DataLoaderError(f"Columns not found in CSV: {missing}")
+            if self.date_column in header:
+                usecols = [self.date_column, *self.columns]
+
+        df = pd.read_csv(self.path, usecols=usecols)
         if self.date_column not in df.columns:
             raise DataLoaderError(
                 f"Date column '{self.date_column}' not found in CSV"
@@ -32,7 +168,42 @@ class CSVPriceLoader:
         df[self.date_column] = pd.to_datetime(df[self.date_column])
         df = df.set_index(self.date_column).sort_index()
 
-        effective_asof = pd.to_datetime(asof_date) if asof_date else self.asof_date
+        if self.columns is not None:
+            df = df[self.columns]
+
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+            raise DataLoaderError("All price columns must be numeric")
+
+        return df
+
+    def _cache_key(self) -> CacheKey:
+        st = self.path.stat()
+        columns = tuple(self.columns) if self.columns is not None else None
+        return (str(self.path.resolve()), st.st_mtime_ns, st.st_size, self.date_column, columns)
+
+    def _dataset(self) -> Tuple[Optional[CacheKey], CachedDataset]:
+        if self.cache is None:
+            return None, CachedDataset(prices=self._read_prices())
+
+        key = self._cache_key()
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self.cache.put(key, CachedDataset(prices=self._read_prices()))
+
+        return key, entry
+
+    def _effective_asof(self, asof_date: Optional[str]):
+        return pd.to_datetime(asof_date) if asof_date else self.asof_date
+
+    # --------------------------------------------
+    # Public API
+    # --------------------------------------------
+
+    def load_prices(self, asof_date: Optional[str] = None) -> pd.DataFrame:
+        _, entry = self._dataset()
+        df = entry.prices
+
+        effective_asof = self._effective_asof(asof_date)
         if effective_asof is not None:
             df = df.loc[df.index <= effective_asof]
             if df.empty:
@@ -40,14 +211,28 @@ class CSVPriceLoader:
                     f"No data available on or before asof_date={effective_asof.date()}"
                 )
 
-        if not all(np.issubdtype(dtype, np.number) for dtype in df.dtypes):
-            raise DataLoaderError("All price columns must be numeric")
-
         return df
 
     def load_returns(self, asof_date: Optional[str] = None) -> pd.DataFrame:
-        prices = self.load_prices(asof_date=asof_date)
-        returns = np.log(prices / prices.shift(1)).dropna()
+        key, entry = self._dataset()
+
+        if entry.returns is None:
+            old_nbytes = entry.nbytes
+            prices = entry.prices
+            entry.returns = np.log(prices / prices.shift(1)).dropna()
+            if key is not None:
+                self.cache.update_size(key, old_nbytes)
+
+        returns = entry.returns
+
+        effective_asof = self._effective_asof(asof_date)
+        if effective_asof is not None:
+            if entry.prices.empty or entry.prices.index[0] > effective_asof:
+                raise DataLoaderError(
+                    f"No data available on or before asof_date={effective_asof.date()}"
+                )
+            returns = returns.loc[returns.index <= effective_asof]
+
         if returns.empty:
             raise DataLoaderError("Return DataFrame is empty after processing")
         return returns
@@ -0,0 +1,349 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Any, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from var_engine.data_loader.binary_store import BinaryPriceLoader
+from var_engine.time_series.rolling import MomentState, EWMACovariance, ewma_cov_estimator
+
+
+@dataclass(frozen=True, eq=False)
+class MarketSnapshot:
+    """
+    Immutable market data for one (dataset, asof, window, columns).
+
+    Arrays are read-only and frames are shared between requests, so
+    models must treat them as read-only (they already copy before any
+    in-place work).
+
+    The dense covariance is built on first access to `cov`, so requests
+    that estimate their own (EWMA, PCA) never pay the O(T n^2) build.
+    """
+    assets: Tuple[str, ...]
+    spot: np.ndarray
+    returns: pd.DataFrame
+    vols: np.ndarray
+    asof: pd.Timestamp
+    # Window sums / cross-products, kept once a snapshot has been advanced
+    moments: Optional[MomentState] = field(default=None, repr=False)
+    # EWMA covariance state at the end of the window, per lambda
+    ewma: Dict[float, np.ndarray] = field(default_factory=dict, repr=False)
+    # Sample covariance, filled lazily by the `cov` property
+    _cov: Optional[pd.DataFrame] = field(default=None, repr=False)
+
+    @property
+    def cov(self) -> pd.DataFrame:
+        if self._cov is None:
+            object.__setattr__(self, "_cov", self.returns.cov())
+        return self._cov
+
+    def spot_dict(self) -> Dict[str, float]:
+        return {a: float(s) for a, s in zip(self.assets, self.spot)}
+
+    def ewma_cov(self, lam: float, returns: Optional[pd.DataFrame] = None) -> Optional[pd.DataFrame]:
+        """
+        EWMA covariance at the end of the window, computed once per
+        lambda and rolled forward by `MarketDataService.advance`.
+
+        If `returns` is given (e.g. factor returns labelled "spot:AAPL"),
+        the state is mapped onto its columns: each must be one of this
+        snapshot's series, by name or "kind:name", or all zeros. Returns
+        None if `returns` is not this snapshot's window.
+        """
+        state = self.ewma.get(lam)
+        if state is None:
+            state = ewma_cov_estimator(lam)(self.returns).to_numpy()
+            state.flags.writeable = False
+            self.ewma[lam] = state
+
+        if returns is None:
+            return pd.DataFrame(state, index=list(self.assets), columns=list(self.assets))
+
+        if not returns.index.equals(self.returns.index):
+            return None
+
+        position = {a: j for j, a in enumerate(self.assets)}
+        own = self.returns.to_numpy()
+
+        idx = []
+        for col in returns.columns:
+            values = returns[col].to_numpy(dtype=np.float64)
+            j = position.get(col, position.get(str(col).split(":", 1)[-1]))
+            if j is not None and np.array_equal(values, own[:, j]):
+                idx.append(j)
+            elif not values.any():
+                idx.append(-1)
+            else:
+                return None
+
+        # EWMA of a zero series is zero, so unmatched factors get zero rows
+        idx = np.array(idx, dtype=int)
+        out = np.zeros((len(idx), len(idx)))
+        live = idx >= 0
+        out[np.ix_(live, live)] = state[np.ix_(idx[live], idx[live])]
+
+        return pd.DataFrame(out, index=returns.columns, columns=returns.columns)
+
+    def to_market_data(self, horizon: float = 1.0 / 252, dense_cov: bool = True) -> Dict[str, Any]:
+        """
+        market_data dict compatible with VaR and Greeks models.
+
+        With dense_cov=False the "cov" entry is left out (per-asset
+        "vols" are always included) for models that estimate their own
+        covariance from the returns.
+        """
+        market_data = {
+            "spot": self.spot_dict(),
+            "returns": self.returns,
+            "vols": dict(zip(self.assets, self.vols.tolist())),
+            "ewma_cov": self.ewma_cov,
+            "horizon": horizon,
+        }
+        if dense_cov:
+            market_data["cov"] = self.cov
+        return market_data
+
+
+SnapshotKey = Tuple[str, int, int, str, Optional[str], Optional[int], Optional[Tuple[str, ...]]]
+
+
+class MarketDataService:
+    """
+    Builds market snapshots (spot, returns, covariance, vols) and caches
+    them per (dataset version, date column, asof, window, columns).
+
+    Concurrent requests for the same key share one build: the first
+    caller loads the window while the others wait on a per-key lock and
+    then reuse the cached snapshot.
+    """
+
+    def __init__(self, max_entries: int = 32, date_column: str = "Date"):
+        self.max_entries = int(max_entries)
+        self.date_column = date_column
+        self._snapshots: "OrderedDict[SnapshotKey, MarketSnapshot]" = OrderedDict()
+        self._building: Dict[SnapshotKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(
+        self,
+        path: Path,
+        asof_date: Optional[str],
+        window: Optional[int],
+        columns: Optional[Sequence[str]],
+    ) -> SnapshotKey:
+        st = path.stat()
+        asof = str(pd.to_datetime(asof_date).date()) if asof_date else None
+        cols = tuple(dict.fromkeys(columns)) if columns is not None else None
+        return (str(path.resolve()), st.st_mtime_ns, st.st_size, self.date_column, asof, window or None, cols)
+
+    def _build(
+        self,
+        path: Path,
+        asof_date: Optional[str],
+        window: Optional[int],
+        columns: Optional[Sequence[str]],
+    ) -> MarketSnapshot:
+        loader = BinaryPriceLoader(
+            path,
+            date_column=self.date_column,
+            asof_date=asof_date,
+            columns=columns,
+        )
+        prices = loader.load_prices()
+        returns = loader.load_returns()
+
+        if window:
+            returns = returns.tail(window)
+
+        spot = prices.iloc[-1].to_numpy(dtype=np.float64)
+        # Same ddof as returns.cov(), without building the n x n matrix
+        vols = returns.std().to_numpy(dtype=np.float64)
+        spot.flags.writeable = False
+        vols.flags.writeable = False
+
+        return MarketSnapshot(
+            assets=tuple(prices.columns),
+            spot=spot,
+            returns=returns,
+            vols=vols,
+            asof=prices.index[-1],
+        )
+
+    def snapshot(
+        self,
+        path: str | Path,
+        asof_date: Optional[str] = None,
+        window: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> MarketSnapshot:
+        """
+        Cached market snapshot for a dataset.
+
+        Parameters
+        ----------
+        path : str | Path
+            Dataset CSV (served through its binary store).
+        asof_date : Optional[str]
+            Last date to include.
+        window : Optional[int]
+            Estimation window in days (most recent returns).
+        columns : Optional[Sequence[str]]
+            Tickers to load (all if None).
+        """
+        path = Path(path)
+        key = self._key(path, asof_date, window, columns)
+
+        with self._lock:
+            snap = self._snapshots.get(key)
+            if snap is not None:
+                self.hits += 1
+                self._snapshots.move_to_end(key)
+                return snap
+            build_lock = self._building.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                snap = self._snapshots.get(key)
+                if snap is not None:
+                    self.hits += 1
+                    return snap
+                self.misses += 1
+
+            try:
+                snap = self._build(path, asof_date, window, columns)
+
+                with self._lock:
+                    # Drop snapshots of older versions of this dataset
+                    for stale in [
+                        k for k in self._snapshots
+                        if k[0] == key[0] and k[1:3] != key[1:3]
+                    ]:
+                        del self._snapshots[stale]
+
+                    self._snapshots[key] = snap
+                    while len(self._snapshots) > self.max_entries:
+                        self._snapshots.popitem(last=False)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+
+        return snap
+
+    def _advance_snapshot(
+        self,
+        path: Path,
+        snap: MarketSnapshot,
+        asof: Optional[str],
+        window: Optional[int],
+    ) -> MarketSnapshot:
+        loader = BinaryPriceLoader(
+            path,
+            date_column=self.date_column,
+            asof_date=asof,
+            columns=list(snap.assets),
+        )
+        prices = loader.load_prices()
+
+        # asof snapshots ending before the appended days are unchanged
+        if prices.index[-1] == snap.asof:
+            return snap
+
+        returns = loader.load_returns()
+        new_returns = returns.loc[returns.index > snap.asof]
+
+        moments = snap.moments.copy() if snap.moments is not None else MomentState.from_returns(snap.returns.to_numpy())
+        moments.add(new_returns.to_numpy())
+
+        window_returns = pd.concat([snap.returns, new_returns])
+        if window and len(window_returns) > window:
+            moments.drop(window_returns.iloc[:-window].to_numpy())
+            window_returns = window_returns.iloc[-window:]
+
+        # EWMA states continue their recursion over the new days
+        ewma = {}
+        for lam, state in snap.ewma.items():
+            stream = EWMACovariance(len(snap.assets), lam=lam, init=state)
+            for row in new_returns.to_numpy():
+                stream.update(row)
+            stream.state.flags.writeable = False
+            ewma[lam] = stream.state
+
+        cov = moments.cov()
+        if cov is None:
+            cov = np.full((len(snap.assets),) * 2, np.nan)
+        cov = pd.DataFrame(cov, index=list(snap.assets), columns=list(snap.assets))
+
+        spot = prices.iloc[-1].to_numpy(dtype=np.float64)
+        vols = np.sqrt(np.diag(cov.to_numpy()))
+        spot.flags.writeable = False
+        vols.flags.writeable = False
+
+        return MarketSnapshot(
+            assets=snap.assets,
+            spot=spot,
+            returns=window_returns,
+            vols=vols,
+            _cov=cov,
+            asof=prices.index[-1],
+            moments=moments,
+            ewma=ewma,
+        )
+
+    def advance(self, path: str | Path) -> int:
+        """
+        Roll cached snapshots of a dataset forward after rows were
+        appended to it.
+
+        Instead of rebuilding, each snapshot adds the new return rows to
+        its window sums / cross-products and drops the rows that fell out
+        of the window: O(k n^2) for k new days rather than O(T n^2).
+        Computed EWMA covariances take k more steps of their recursion.
+
+        Returns
+        -------
+        int
+            Number of snapshots carried over to the new dataset version.
+        """
+        path = Path(path)
+        resolved = str(path.resolve())
+        st = path.stat()
+        version = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            stale = [
+                (k, snap) for k, snap in self._snapshots.items()
+                if k[0] == resolved and k[1:3] != version
+            ]
+
+        advanced = {}
+        for key, snap in stale:
+            asof, window = key[4], key[5]
+            new_key = (resolved, *version, *key[3:])
+            advanced[new_key] = self._advance_snapshot(path, snap, asof, window)
+
+        with self._lock:
+            for key, _ in stale:
+                self._snapshots.pop(key, None)
+            for key, snap in advanced.items():
+                self._snapshots.setdefault(key, snap)
+
+        return len(advanced)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._snapshots),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,273 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from var_engine.data_loader.csv_loader import DataLoaderError
+from var_engine.data_loader.binary_store import BinaryPriceLoader
+
+
+# Source kind -> (factor name prefix, return transform)
+SOURCE_KINDS = {
+    "spot": ("", "log"),
+    "vol": ("vol:", "diff"),
+    "rate": ("rate:", "diff"),
+}
+
+
+@dataclass(frozen=True)
+class PanelSource:
+    name: str
+    path: Path
+    kind: str = "spot"
+
+
+@dataclass(frozen=True, eq=False)
+class AlignedPanel:
+    """
+    Factor levels of several sources on one calendar.
+
+    `levels` (T, n) and `returns` (T - 1, n) are read-only column-major
+    arrays; returns are log returns for spot factors and differences for
+    vol / rate factors. Rows before a source's first observation are NaN.
+    """
+    dates: pd.DatetimeIndex
+    factors: Tuple[str, ...]
+    kinds: Tuple[str, ...]
+    levels: np.ndarray
+    returns: np.ndarray
+
+    def factors_of(self, kind: str) -> List[str]:
+        return [f for f, k in zip(self.factors, self.kinds) if k == kind]
+
+    def returns_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.returns, index=self.dates[1:], columns=list(self.factors), copy=False)
+
+    def to_market_data(
+        self,
+        window: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        horizon: float = 1.0 / 252,
+    ) -> Dict[str, Any]:
+        """
+        market_data dict for VaR and Greeks models.
+
+        Spot factors (optionally restricted to `columns`) give "spot" and
+        "cov"; vol and rate factors only add return columns ("vol:X",
+        "rate" / "rate:X") picked up by factor-based models. A single
+        rate column also sets the "rate" level; several rate columns
+        (e.g. a zero curve by tenor) are listed with their last levels
+        under "rate_curve".
+        """
+        spot_factors = self.factors_of("spot")
+        if columns is not None:
+            missing = [c for c in columns if c not in spot_factors]
+            if missing:
+                raise DataLoaderError(f"Columns not found in dataset: {missing}")
+            spot_factors = list(dict.fromkeys(columns))
+
+        keep = spot_factors + [f for f, k in zip(self.factors, self.kinds) if k != "spot"]
+
+        returns = self.returns_frame()[keep].dropna()
+        if window:
+            returns = returns.tail(window)
+        if returns.empty:
+            raise DataLoaderError("Return DataFrame is empty after processing")
+
+        last = dict(zip(self.factors, self.levels[-1]))
+
+        market_data: Dict[str, Any] = {
+            "spot": {a: float(last[a]) for a in spot_factors},
+            "returns": returns,
+            "cov": returns[spot_factors].cov(),
+            "horizon": horizon,
+        }
+
+        rate_factors = self.factors_of("rate")
+        if len(rate_factors) == 1:
+            market_data["rate"] = float(last[rate_factors[0]])
+        elif rate_factors:
+            market_data["rate_curve"] = {
+                "factors": rate_factors,
+                "base": [float(last[f]) for f in rate_factors],
+            }
+
+        return market_data
+
+
+PanelKey = Tuple[Tuple[Tuple[str, str, str, int, int], ...], Optional[str], Optional[Tuple[str, ...]]]
+
+
+class MarketDataPanel:
+    """
+    Registry of market-data sources (equity prices, implied vols, rates)
+    that are aligned once onto a common calendar and cached.
+
+    The first source in a request defines the calendar; every other
+    source is as-of joined onto it (last observation on or before each
+    date, then forward-filled). The aligned panel is cached per (source
+    versions, asof, spot columns), so models read one contiguous array
+    instead of re-joining files per request.
+    """
+
+    def __init__(self, date_column: str = "Date", max_entries: int = 16):
+        self.date_column = date_column
+        self.max_entries = int(max_entries)
+        self._sources: Dict[str, PanelSource] = {}
+        self._panels: "OrderedDict[PanelKey, AlignedPanel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, name: str, path: str | Path, kind: str = "spot") -> PanelSource:
+        if kind not in SOURCE_KINDS:
+            raise ValueError(f"Unknown source kind: {kind}")
+
+        source = PanelSource(name=name, path=Path(path), kind=kind)
+        with self._lock:
+            self._sources[name] = source
+        return source
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._sources.pop(name, None)
+
+    def _resolve(self, names: Optional[Sequence[str]]) -> List[PanelSource]:
+        with self._lock:
+            if names is None:
+                return list(self._sources.values())
+            try:
+                return [self._sources[n] for n in names]
+            except KeyError as e:
+                raise DataLoaderError(f"Unknown market data source: {e.args[0]}") from None
+
+    def _key(
+        self,
+        sources: Sequence[PanelSource],
+        asof_date: Optional[str],
+        columns: Optional[Sequence[str]],
+    ) -> PanelKey:
+        stamps = []
+        for s in sources:
+            try:
+                st = s.path.stat()
+            except FileNotFoundError:
+                raise DataLoaderError(f"CSV file not found: {s.path}") from None
+            stamps.append((s.name, s.kind, str(s.path.resolve()), st.st_mtime_ns, st.st_size))
+
+        asof = str(pd.to_datetime(asof_date).date()) if asof_date else None
+        cols = tuple(dict.fromkeys(columns)) if columns is not None else None
+        return tuple(stamps), asof, cols
+
+    def _build(
+        self,
+        sources: Sequence[PanelSource],
+        asof_date: Optional[str],
+        columns: Optional[Sequence[str]],
+    ) -> AlignedPanel:
+        frames = []
+        factors: List[str] = []
+        kinds: List[str] = []
+
+        for s in sources:
+            # Spot sources only load the requested tickers they hold
+            load_columns = None
+            if columns is not None and s.kind == "spot":
+                stored = set(BinaryPriceLoader(s.path, date_column=self.date_column, cache=None).columns)
+                load_columns = [c for c in dict.fromkeys(columns) if c in stored]
+
+            prices = BinaryPriceLoader(
+                s.path,
+                date_column=self.date_column,
+                asof_date=asof_date,
+                columns=load_columns,
+            ).load_prices()
+            prefix, _ = SOURCE_KINDS[s.kind]
+
+            names = list(prices.columns)
+            if s.kind == "rate" and len(names) == 1:
+                renamed = ["rate"]
+            else:
+                renamed = [f"{prefix}{c}" for c in names]
+
+            frames.append(prices.set_axis(renamed, axis=1))
+            factors.extend(renamed)
+            kinds.extend([s.kind] * len(renamed))
+
+        if len(set(factors)) != len(factors):
+            raise DataLoaderError("Duplicate factor names across market data sources")
+
+        calendar = frames[0].index
+        levels = np.empty((len(calendar), len(factors)), dtype=np.float64, order="F")
+
+        col = 0
+        for frame in frames:
+            # As-of join: last observation on or before each calendar date
+            aligned = frame.ffill().reindex(calendar, method="ffill")
+            width = aligned.shape[1]
+            levels[:, col:col + width] = aligned.to_numpy(dtype=np.float64)
+            col += width
+
+        returns = np.empty((max(len(calendar) - 1, 0), len(factors)), dtype=np.float64, order="F")
+        is_log = np.array([SOURCE_KINDS[k][1] == "log" for k in kinds])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns[:, is_log] = np.log(levels[1:, is_log] / levels[:-1, is_log])
+        returns[:, ~is_log] = levels[1:, ~is_log] - levels[:-1, ~is_log]
+
+        levels.flags.writeable = False
+        returns.flags.writeable = False
+
+        return AlignedPanel(
+            dates=calendar,
+            factors=tuple(factors),
+            kinds=tuple(kinds),
+            levels=levels,
+            returns=returns,
+        )
+
+    def aligned(
+        self,
+        names: Optional[Sequence[str]] = None,
+        asof_date: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> AlignedPanel:
+        """
+        Cached aligned panel of the named sources (all registered sources
+        if None); the first one defines the calendar. `columns` limits
+        the spot tickers loaded (all if None).
+        """
+        sources = self._resolve(names)
+        if not sources:
+            raise DataLoaderError("No market data sources registered")
+
+        key = self._key(sources, asof_date, columns)
+
+        with self._lock:
+            panel = self._panels.get(key)
+            if panel is not None:
+                self._panels.move_to_end(key)
+                return panel
+
+        panel = self._build(sources, asof_date, columns)
+
+        with self._lock:
+            panel = self._panels.setdefault(key, panel)
+            while len(self._panels) > self.max_entries:
+                self._panels.popitem(last=False)
+
+        return panel
+
+    def market_data(
+        self,
+        names: Optional[Sequence[str]] = None,
+        asof_date: Optional[str] = None,
+        window: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        return self.aligned(names, asof_date, columns).to_market_data(window=window, columns=columns)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._panels.clear()
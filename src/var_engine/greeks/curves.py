@@ -10,6 +10,9 @@ class InterestRateCurve:
     def get_rate(self, maturity: float) -> float:
         raise NotImplementedError
 
+    def get_rates(self, maturities) -> np.ndarray:
+        return np.array([self.get_rate(m) for m in np.atleast_1d(maturities)], dtype=np.float64)
+
 
 @dataclass
 class FlatInterestRateCurve(InterestRateCurve):
@@ -18,6 +21,9 @@ class FlatInterestRateCurve(InterestRateCurve):
     def get_rate(self, maturity: float) -> float:
         return self.rate
 
+    def get_rates(self, maturities) -> np.ndarray:
+        return np.full(np.shape(np.atleast_1d(maturities)), self.rate, dtype=np.float64)
+
 
 @dataclass
 class PiecewiseInterestRateCurve(InterestRateCurve):
@@ -27,6 +33,31 @@ class PiecewiseInterestRateCurve(InterestRateCurve):
     def get_rate(self, maturity: float) -> float:
         return float(np.interp(maturity, self.tenors, self.rates))
 
+    def get_rates(self, maturities) -> np.ndarray:
+        return np.interp(np.atleast_1d(maturities), self.tenors, self.rates).astype(np.float64)
+
+    def interpolation_weights(self, maturities) -> np.ndarray:
+        """
+        (len(maturities), len(tenors)) matrix W with
+        rate(maturities) = W @ rates, matching np.interp (linear between
+        tenors, flat beyond the ends).
+        """
+        t = np.asarray(self.tenors, dtype=np.float64)
+        m = np.clip(np.atleast_1d(np.asarray(maturities, dtype=np.float64)), t[0], t[-1])
+
+        W = np.zeros((len(m), len(t)), dtype=np.float64)
+        if len(t) == 1:
+            W[:, 0] = 1.0
+            return W
+
+        k = np.clip(np.searchsorted(t, m, side="right") - 1, 0, len(t) - 2)
+        w = (m - t[k]) / (t[k + 1] - t[k])
+
+        rows = np.arange(len(m))
+        W[rows, k] = 1.0 - w
+        W[rows, k + 1] = w
+        return W
+
 
 # -------------------------
 # Volatility Curves
@@ -1,5 +1,51 @@
 import numpy as np
 
+from .curves import PiecewiseInterestRateCurve
+
+
+def key_rate_dv01(bonds, curve, buckets) -> np.ndarray:
+    """
+    Key-rate DV01 of every bond to every bucket tenor, shape
+    (n_bonds, n_buckets).
+
+    Cash flows of all bonds are stacked and discounted off `curve` with
+    each bond's own periodic compounding, (1 + r_t/f)^(-f t); a 1bp move at bucket k shifts the rate at time t by W[t, k] bp, W
+    being the linear interpolation weights onto the bucket tenors (flat
+    beyond the ends). So
+
+        KR[b, k] = 1e-4 * sum_{t in b} -t cf_t (1 + r_t/f)^(-f t - 1) W[t, k]
+
+    is one vectorised pass over the stacked cash flows and one weighted
+    (cashflows x buckets) reduction for the whole book.
+    The rows of W sum to one, so each row sums to the bond's parallel
+    DV01 (GreeksEngine.bond_dv01) on any curve.
+    """
+    buckets = np.asarray(buckets, dtype=np.float64)
+
+    times = [np.asarray(b.cashflow_times, dtype=np.float64) for b in bonds]
+    counts = np.array([len(t) for t in times], dtype=np.intp)
+
+    result = np.zeros((len(bonds), len(buckets)), dtype=np.float64)
+    if counts.sum() == 0:
+        return result
+
+    t = np.concatenate(times)
+    cf = np.concatenate([np.asarray(b.cashflows, dtype=np.float64) for b in bonds])
+    freq = np.repeat([float(b.frequency) for b in bonds], counts)
+
+    rates = curve.get_rates(t)
+    df = (1.0 + rates / freq) ** (-freq * t)
+
+    # dP/dr_t per cash flow (per bp), then onto the bucket tenors
+    grad = -1e-4 * t * cf * df / (1.0 + rates / freq)
+    W = PiecewiseInterestRateCurve(list(buckets), [0.0] * len(buckets)).interpolation_weights(t)
+
+    nonempty = counts > 0
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[nonempty]
+    result[nonempty] = np.add.reduceat(grad[:, None] * W, starts, axis=0)
+
+    return result
+
 
 class GreeksEngine:
 
@@ -18,33 +64,32 @@ class GreeksEngine:
         return quantity * spot
 
     # -------------------------
-    # Bond DV01 (finite diff)
+    # Bond DV01 (closed form)
     # -------------------------
 
     def bond_price(self, bond, rate):
         """
-        Simple fixed-rate bond pricer
+        Fixed-rate bond price at a flat rate, with the bond's compounding
         """
-        price = 0.0
-        for t, cf in zip(bond.cashflow_times, bond.cashflows):
-            price += cf * np.exp(-rate * t)
-        return price
+        t = np.asarray(bond.cashflow_times, dtype=np.float64)
+        f = float(bond.frequency)
+        return float(((1.0 + rate / f) ** (-f * t)) @ np.asarray(bond.cashflows, dtype=np.float64))
 
     def bond_dv01(self, bond):
         """
-        Parallel bump DV01
+        Parallel DV01: dP for a 1bp shift of the whole curve, each cash
+        flow discounted at its own zero rate with the bond's compounding.
+        Equals the sum of the bond's key-rate DV01s.
         """
-        bump = 0.0001
-
-        base_rate = self.ir_curve.get_rate(0)
-        bumped_rate = base_rate + bump
+        t = np.asarray(bond.cashflow_times, dtype=np.float64)
+        cf = np.asarray(bond.cashflows, dtype=np.float64)
 
-        base_price = self.bond_price(bond, base_rate)
-        bumped_price = self.bond_price(bond, bumped_rate)
+        f = float(bond.frequency)
 
-        dv01 = bumped_price - base_price
+        rates = self.ir_curve.get_rates(t)
+        df = (1.0 + rates / f) ** (-f * t)
 
-        return dv01
+        return float(-1e-4 * np.sum(t * cf * df / (1.0 + rates / f)))
 
     # -------------------------
     # Bucketed DV01
@@ -54,25 +99,5 @@ class GreeksEngine:
         """
         Buckets = list of tenor points e.g. [1,2,5,10]
         """
-        bump = 0.0001
-        bucket_results = {}
-
-        for bucket in buckets:
-            base_rate = self.ir_curve.get_rate(bucket)
-
-            bumped_curve = lambda m: (
-                base_rate + bump if abs(m - bucket) < 1e-8 else self.ir_curve.get_rate(m)
-            )
-
-            base_price = 0.0
-            bumped_price = 0.0
-
-            for t, cf in zip(bond.cashflow_times, bond.cashflows):
-                base_price += cf * np.exp(-self.ir_curve.get_rate(t) * t)
-
-                r = bumped_curve(t)
-                bumped_price += cf * np.exp(-r * t)
-
-            bucket_results[bucket] = bumped_price - base_price
-
-        return bucket_results
+        row = key_rate_dv01([bond], self.ir_curve, buckets)[0]
+        return dict(zip(buckets, row.tolist()))
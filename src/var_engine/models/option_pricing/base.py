@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import numpy as np
 
 class OptionPricingModel(ABC):
     """
@@ -53,4 +54,69 @@ class OptionPricingModel(ABC):
             Option price.
         """
         raise NotImplementedError
-        
\ No newline at end of file
+
+    def price_batch(
+        self,
+        spot: np.ndarray,
+        strike: float,
+        maturity: float,
+        vol: np.ndarray,
+        rate: np.ndarray,
+        option_type: str,
+    ) -> np.ndarray:
+        """
+        Price an option under many market states.
+
+        Default: element-wise loop over `price`. Models with a closed
+        form override this with an array implementation.
+
+        Returns
+        -------
+        np.ndarray
+            Option prices in the dtype of `spot`.
+        """
+        spot = np.asarray(spot)
+        vol = np.broadcast_to(vol, spot.shape)
+        rate = np.broadcast_to(rate, spot.shape)
+
+        return np.array(
+            [
+                self.price(float(s), strike, maturity, float(v), float(r), option_type)
+                for s, v, r in zip(spot, vol, rate)
+            ],
+            dtype=spot.dtype,
+        )
+
+    def greeks_batch(
+        self,
+        spot: np.ndarray,
+        strike: float,
+        maturity: float,
+        vol: np.ndarray,
+        rate: np.ndarray,
+        option_type: str,
+    ) -> dict:
+        """
+        Greeks under many market states.
+
+        Default: element-wise loop over `greeks`. Models with a closed
+        form override this with an array implementation.
+
+        Returns
+        -------
+        dict
+            greek name -> float64 array shaped like `spot`.
+        """
+        spot = np.asarray(spot, dtype=np.float64)
+        vol = np.broadcast_to(vol, spot.shape)
+        rate = np.broadcast_to(rate, spot.shape)
+
+        rows = [
+            self.greeks(float(s), strike, maturity, float(v), float(r), option_type)
+            for s, v, r in zip(spot, vol, rate)
+        ]
+        names = ("delta", "gamma", "vega", "theta", "rho")
+        return {
+            k: np.array([g[k] for g in rows], dtype=np.float64).reshape(spot.shape)
+            for k in names
+        }
@@ -1,5 +1,7 @@
 import math
+import numpy as np
 from scipy.stats import norm
+from scipy.special import ndtr
 
 from var_engine.models.option_pricing.base import OptionPricingModel
 
@@ -56,7 +58,117 @@ class BlackScholesModel(OptionPricingModel):
             raise ValueError("option_type must be 'call' or 'put'")
         
         return float(price)
-    
+
+    def price_batch(
+            self,
+            spot: np.ndarray,
+            strike: float,
+            maturity: float,
+            vol: np.ndarray,
+            rate: np.ndarray,
+            option_type: str,
+    ) -> np.ndarray:
+        """
+        Vectorised Black-Scholes price over arrays of spot / vol / rate.
+
+        Computation stays in the dtype of `spot` (float32 or float64).
+        """
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        spot = np.asarray(spot)
+        dtype = spot.dtype
+        vol = np.broadcast_to(np.asarray(vol, dtype=dtype), spot.shape)
+        rate = np.broadcast_to(np.asarray(rate, dtype=dtype), spot.shape)
+        k = dtype.type(strike)
+
+        if maturity <= 0.0:
+            if option_type == "call":
+                return np.maximum(spot - k, 0)
+            return np.maximum(k - spot, 0)
+
+        t = dtype.type(maturity)
+        sqrt_t = np.sqrt(t)
+        df = np.exp(-rate * t)
+
+        # Zero-vol states fall back to discounted forward intrinsic
+        pos = vol > 0
+        safe_vol = np.where(pos, vol, 1)
+
+        d1 = (np.log(spot / k) + (rate + 0.5 * safe_vol ** 2) * t) / (safe_vol * sqrt_t)
+        d2 = d1 - safe_vol * sqrt_t
+
+        if option_type == "call":
+            price = spot * ndtr(d1) - k * df * ndtr(d2)
+            intrinsic = df * np.maximum(spot / df - k, 0)
+        else:
+            price = k * df * ndtr(-d2) - spot * ndtr(-d1)
+            intrinsic = df * np.maximum(k - spot / df, 0)
+
+        return np.where(pos, price, intrinsic).astype(dtype, copy=False)
+
+    def greeks_batch(
+            self,
+            spot: np.ndarray,
+            strike: float,
+            maturity: float,
+            vol: np.ndarray,
+            rate: np.ndarray,
+            option_type: str,
+    ):
+        """
+        Vectorised Black-Scholes Greeks over arrays of spot / vol / rate
+        (float64). States with zero vol, or maturity <= 0, get zero
+        Greeks as in `greeks`.
+        """
+        option_type = option_type.lower()
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        spot = np.asarray(spot, dtype=np.float64)
+        vol = np.broadcast_to(np.asarray(vol, dtype=np.float64), spot.shape)
+        rate = np.broadcast_to(np.asarray(rate, dtype=np.float64), spot.shape)
+
+        if maturity <= 0:
+            zero = np.zeros(spot.shape)
+            return {k: zero.copy() for k in ("delta", "gamma", "vega", "theta", "rho")}
+
+        t = float(maturity)
+        sqrt_t = math.sqrt(t)
+
+        pos = vol > 0
+        safe_vol = np.where(pos, vol, 1.0)
+
+        d1 = (np.log(spot / strike) + (rate + 0.5 * safe_vol ** 2) * t) / (safe_vol * sqrt_t)
+        d2 = d1 - safe_vol * sqrt_t
+
+        pdf_d1 = np.exp(-0.5 * d1 ** 2) / math.sqrt(2.0 * math.pi)
+        disc_k = strike * np.exp(-rate * t)
+
+        gamma = pdf_d1 / (spot * safe_vol * sqrt_t)
+        vega = spot * pdf_d1 * sqrt_t
+        first_term = -(spot * pdf_d1 * safe_vol) / (2 * sqrt_t)
+
+        if option_type == "call":
+            delta = ndtr(d1)
+            theta = first_term - rate * disc_k * ndtr(d2)
+            rho = disc_k * t * ndtr(d2)
+        else:
+            delta = ndtr(d1) - 1
+            theta = first_term + rate * disc_k * ndtr(-d2)
+            rho = -disc_k * t * ndtr(-d2)
+
+        return {
+            k: np.where(pos, v, 0.0)
+            for k, v in (
+                ("delta", delta),
+                ("gamma", gamma),
+                ("vega", vega),
+                ("theta", theta),
+                ("rho", rho),
+            )
+        }
+
     def greeks(
             self,
             spot: float,
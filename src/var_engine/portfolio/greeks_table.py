@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from typing import List, Dict, Any, Sequence
+
+import numpy as np
+
+
+GREEK_NAMES = (
+    "dollar_delta",
+    "dollar_gamma",
+    "dollar_vega",
+    "dollar_theta",
+    "dollar_rho",
+)
+
+
+def greeks_from_sensitivities(sens: Dict[str, float]) -> Dict[str, float]:
+    """
+    $-delta / $-rho derived from factor sensitivities, for products
+    without full $-Greeks.
+    """
+    return {
+        "dollar_delta": sum(v for k, v in sens.items() if k.startswith("spot")),
+        "dollar_rho": sum(v for k, v in sens.items() if "rate" in k),
+    }
+
+
+@dataclass
+class GreeksTable:
+    """
+    Per-position $-Greeks and factor exposures for one scenario.
+
+    greeks    : (n_positions, len(GREEK_NAMES))
+    exposures : (n_positions, len(factors))
+    in_totals : positions with full $-Greeks (the others carry Greeks
+                derived from their sensitivities and are left out of
+                portfolio totals)
+    """
+    product_ids: List[str]
+    product_types: List[str]
+    greeks: np.ndarray
+    in_totals: np.ndarray
+    factors: List[str]
+    exposures: np.ndarray
+
+    @classmethod
+    def from_products(cls, products: Sequence[Any], scenario) -> "GreeksTable":
+        """
+        Evaluate every product once (`get_risk_record`) and pack the
+        results into arrays.
+        """
+        m = len(products)
+        greeks = np.zeros((m, len(GREEK_NAMES)), dtype=np.float64)
+        in_totals = np.zeros(m, dtype=bool)
+        records = []
+        factor_index: Dict[str, int] = {}
+
+        for i, product in enumerate(products):
+            g, sens = product.get_risk_record(scenario)
+
+            if g is not None:
+                in_totals[i] = True
+            else:
+                g = greeks_from_sensitivities(sens)
+
+            greeks[i] = [g.get(name, 0.0) for name in GREEK_NAMES]
+
+            for factor in sens:
+                factor_index.setdefault(factor, len(factor_index))
+            records.append(sens)
+
+        exposures = np.zeros((m, len(factor_index)), dtype=np.float64)
+        for i, sens in enumerate(records):
+            for factor, value in sens.items():
+                exposures[i, factor_index[factor]] = value
+
+        return cls(
+            product_ids=[p.product_id for p in products],
+            product_types=[p.__class__.__name__ for p in products],
+            greeks=greeks,
+            in_totals=in_totals,
+            factors=list(factor_index),
+            exposures=exposures,
+        )
+
+    # --------------------------------------------
+    # Views
+    # --------------------------------------------
+
+    def positions(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "product_id": pid,
+                "product_type": ptype,
+                "greeks": dict(zip(GREEK_NAMES, row.tolist())),
+            }
+            for pid, ptype, row in zip(self.product_ids, self.product_types, self.greeks)
+        ]
+
+    def totals(self) -> Dict[str, float]:
+        return dict(zip(GREEK_NAMES, self.greeks[self.in_totals].sum(axis=0).tolist()))
+
+    def factor_exposures(self) -> Dict[str, float]:
+        return dict(zip(self.factors, self.exposures.sum(axis=0).tolist()))
+
+
+@dataclass
+class GreeksHistory:
+    """
+    $-Greeks of every position on every date.
+
+    greeks    : (n_dates, n_positions, len(GREEK_NAMES))
+    in_totals : positions included in portfolio totals
+    """
+    dates: List[Any]
+    product_ids: List[str]
+    product_types: List[str]
+    greeks: np.ndarray
+    in_totals: np.ndarray
+
+    @classmethod
+    def from_products(cls, products: Sequence[Any], scenarios, dates: Sequence[Any]) -> "GreeksHistory":
+        """
+        One `dollar_greeks_batch` call per product over a ScenarioMatrix
+        with one row per date.
+        """
+        greeks = np.stack([p.dollar_greeks_batch(scenarios) for p in products], axis=1)
+
+        return cls(
+            dates=list(dates),
+            product_ids=[p.product_id for p in products],
+            product_types=[p.__class__.__name__ for p in products],
+            greeks=greeks,
+            in_totals=np.array([hasattr(p, "get_dollar_greeks") for p in products], dtype=bool),
+        )
+
+    def totals(self) -> np.ndarray:
+        """
+        (n_dates, len(GREEK_NAMES)) portfolio totals.
+        """
+        return self.greeks[:, self.in_totals].sum(axis=1)
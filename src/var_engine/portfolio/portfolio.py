@@ -1,8 +1,9 @@
-from typing import List, Dict, Any #,Optional
+from typing import List, Dict, Any, Tuple #,Optional
 from collections import defaultdict
 import numpy as np
 
 from var_engine.portfolio.product_factory import ProductFactory
+from var_engine.portfolio.greeks_table import GreeksTable, GreeksHistory
 # from var_engine.portfolio.products.base import Product
 
 # from .products.equity import StockProduct
@@ -53,6 +54,14 @@ class Portfolio:
         This ordering is the contract used by risk models.
         """
         return [p.product_id for p in self.products]        
+
+    @property
+    def tickers(self) -> List[str]:
+        """
+        Ordered, de-duplicated price series the portfolio depends on.
+        Used to load only the dataset columns a request needs.
+        """
+        return list(dict.fromkeys(t for p in self.products for t in p.tickers))
     
 
     def revalue(self, scenario):
@@ -67,6 +76,24 @@ class Portfolio:
         """
         return sum(p.revalue(scenario) for p in self.products)
 
+    def revalue_batch(self, scenarios) -> np.ndarray:
+        """
+        Full revaluation of the portfolio under every scenario of a
+        ScenarioMatrix.
+
+        Products may revalue in reduced precision (e.g. float32);
+        portfolio totals are always accumulated in float64.
+
+        Returns:
+            (n_scenarios,) float64 array of portfolio values.
+        """
+        total = np.zeros(len(scenarios), dtype=np.float64)
+
+        for p in self.products:
+            total += p.revalue_batch(scenarios)
+
+        return total
+
     def pnl(self, scenario, base_scenario) -> float:
         """
         Scenario P&L relative to current value.
@@ -100,6 +127,21 @@ class Portfolio:
 
         return dict(total)
 
+    def get_gamma_exposures(self, scenario) -> Dict[Tuple[str, str], float]:
+        """
+        Collect second-order (gamma) exposures from each product.
+
+        Returns:
+            (factor_i, factor_j) -> summed $-gamma
+        """
+        total = defaultdict(float)
+
+        for product in self.products:
+            for pair, value in product.get_gamma_exposures(scenario).items():
+                total[pair] += value
+
+        return dict(total)
+
     def attribute_scenario(
             self,
             scenario,
@@ -210,6 +252,21 @@ class Portfolio:
 
         return positions
 
+    def greeks_table(self, scenario) -> GreeksTable:
+        """
+        Per-position $-Greeks and factor exposures in one pass: each
+        product's Greeks are evaluated once, and positions, totals and
+        factor exposures are array reductions of the table.
+        """
+        return GreeksTable.from_products(self.products, scenario)
+
+    def greeks_history(self, scenarios, dates) -> GreeksHistory:
+        """
+        $-Greeks of every position under a ScenarioMatrix with one row
+        per date, each product evaluated in a single batched call.
+        """
+        return GreeksHistory.from_products(self.products, scenarios, dates)
+
     def get_portfolio_greeks(self, scenario):
         """
         Aggregate total portfolio dollar Greeks.
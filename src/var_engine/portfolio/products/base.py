@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List, Tuple, Optional
+import numpy as np
+
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.matrix import ScenarioMatrix
 
 class Product(ABC):
     """
@@ -9,6 +12,14 @@ class Product(ABC):
     def __init__(self, product_id: str):
         self.product_id = product_id
 
+    @property
+    def tickers(self) -> List[str]:
+        """
+        Price series (dataset columns) the product depends on.
+        Default: none (e.g. rate-only products).
+        """
+        return []
+
     @abstractmethod
     def revalue(self, scenario: Scenario) -> float:
         """
@@ -22,6 +33,21 @@ class Product(ABC):
         """
         pass
 
+    def revalue_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        Revalue the product under every scenario of a ScenarioMatrix.
+
+        Default: loop over materialised scenarios. Products with a
+        closed-form pricer override this with an array implementation.
+
+        Returns:
+            (n_scenarios,) array of market values in the matrix dtype
+        """
+        return np.array(
+            [self.revalue(s) for s in scenarios],
+            dtype=scenarios.dtype,
+        )
+
     @abstractmethod
     def get_sensitivities(self, scenario: Scenario) -> Dict[str, float]:
         """
@@ -32,6 +58,50 @@ class Product(ABC):
         """
         pass
 
+    def get_risk_record(self, scenario: Scenario) -> Tuple[Optional[Dict[str, float]], Dict[str, float]]:
+        """
+        ($-Greeks, factor sensitivities) for one scenario.
+
+        Default: the two separate calls (Greeks are None for products
+        without `get_dollar_greeks`). Products whose Greeks are costly
+        override this to evaluate them once.
+        """
+        greeks = self.get_dollar_greeks(scenario) if hasattr(self, "get_dollar_greeks") else None
+        return greeks, self.get_sensitivities(scenario)
+
+    def dollar_greeks_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        $-Greeks under every scenario of a ScenarioMatrix.
+
+        Default: loop over materialised scenarios (products without
+        `get_dollar_greeks` derive them from their sensitivities).
+        Products with closed-form Greeks override this.
+
+        Returns:
+            (n_scenarios, len(GREEK_NAMES)) float64 array
+        """
+        from var_engine.portfolio.greeks_table import GREEK_NAMES, greeks_from_sensitivities
+
+        out = np.zeros((len(scenarios), len(GREEK_NAMES)), dtype=np.float64)
+        for i, scenario in enumerate(scenarios):
+            g, sens = self.get_risk_record(scenario)
+            if g is None:
+                g = greeks_from_sensitivities(sens)
+            out[i] = [g.get(name, 0.0) for name in GREEK_NAMES]
+
+        return out
+
+    def get_gamma_exposures(self, scenario: Scenario) -> Dict[Tuple[str, str], float]:
+        """
+        Second-order factor exposures in currency units.
+
+        Mapping:
+            (factor_i, factor_j) -> d2V/(d return_i d return_j)
+            (each unordered pair listed once)
+        Default: none (linear products).
+        """
+        return {}
+
     def factor_pnl(self, scenario, base_scenario):
         """
         Optional exact factor decomposition.
@@ -1,5 +1,9 @@
-from typing import Dict
+from typing import Dict, Tuple, Optional
+import numpy as np
+
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.matrix import ScenarioMatrix
+from var_engine.greeks.curves import PiecewiseInterestRateCurve
 from .base import Product
 
 
@@ -25,41 +29,156 @@ class BondProduct(Product):
         self.maturity = float(maturity)
         self.frequency = int(frequency)
 
+        # Cash-flow schedule, fixed for the life of the product
+        n_payments = int(self.maturity * self.frequency)
+        times = np.arange(1, n_payments + 1, dtype=np.float64) / self.frequency
+        amounts = np.full(n_payments, self.notional * self.coupon / self.frequency)
+        if n_payments:
+            amounts[-1] += self.notional
+
+        times.flags.writeable = False
+        amounts.flags.writeable = False
+        self._cf_times = times
+        self._cf_amounts = amounts
+
+        # Curve interpolation weights per tenor grid
+        self._curve_weights: Dict[Tuple[float, ...], np.ndarray] = {}
+
+    # ---------------------------------------------------------
+    # Cash-flow schedule
+    # ---------------------------------------------------------
+
+    @property
+    def cashflow_times(self) -> np.ndarray:
+        """
+        Payment times in years: 1/f, 2/f, ..., n/f (read-only).
+        """
+        return self._cf_times
+
+    @property
+    def cashflows(self) -> np.ndarray:
+        """
+        Payment amounts aligned with cashflow_times, principal in the
+        last (read-only).
+        """
+        return self._cf_amounts
+
     # ---------------------------------------------------------
-    # Internal PV calculation
+    # PV calculation
     # ---------------------------------------------------------
 
+    def _discount_factors(self, rates: np.ndarray) -> np.ndarray:
+        """
+        Periodic-compounding discount factors (1 + r/f)^(-f t); `rates`
+        broadcasts against the cash-flow times.
+        """
+        return (1.0 + rates / self.frequency) ** (-self.frequency * self._cf_times)
+
     def _calculate_present_value(self, discount_rate: float) -> float:
-        n_payments = int(self.maturity * self.frequency)
-        coupon_payment = self.notional * self.coupon / self.frequency
+        return float(self._discount_factors(discount_rate) @ self._cf_amounts)
 
-        period_rate = discount_rate / self.frequency
+    def price_batch(self, rates: np.ndarray) -> np.ndarray:
+        """
+        PV under many flat rates: one (scenarios x cash flows) discount
+        matrix times the cash-flow vector.
+        """
+        rates = np.asarray(rates, dtype=np.float64)
+        return self._discount_factors(rates[:, None]) @ self._cf_amounts
 
-        if period_rate > 0:
-            pv_coupons = coupon_payment * (
-                1 - (1 + period_rate) ** (-n_payments)
-            ) / period_rate
-            pv_principal = self.notional / (1 + period_rate) ** n_payments
-        else:
-            pv_coupons = coupon_payment * n_payments
-            pv_principal = self.notional
+    def price_on_curves(self, tenors, curves: np.ndarray) -> np.ndarray:
+        """
+        PV under many zero curves sharing `tenors`.
+
+        curves : (n_scenarios, n_tenors) zero rates. Rates at the
+        cash-flow times are linear interpolations (flat beyond the end
+        tenors), taken for all scenarios as one matrix product.
+        """
+        key = tuple(float(t) for t in tenors)
+        W = self._curve_weights.get(key)
+        if W is None:
+            W = PiecewiseInterestRateCurve(list(key), [0.0] * len(key)).interpolation_weights(self._cf_times)
+            self._curve_weights[key] = W
+
+        rates = np.asarray(curves, dtype=np.float64) @ W.T
+
+        return (self._discount_factors(rates) * self._cf_amounts).sum(axis=1)
+
+    def rate_risk(self, discount_rate: float) -> Dict[str, float]:
+        """
+        Closed-form price, dP/dy, d2P/dy2, modified duration and
+        convexity under the same periodic compounding as
+        _calculate_present_value:
 
-        return pv_coupons + pv_principal
+            P      = sum cf (1 + y/f)^(-f t)
+            dP/dy  = -sum cf t (1 + y/f)^(-f t - 1)
+            d2P/dy2 = sum cf t (t + 1/f) (1 + y/f)^(-f t - 2)
+        """
+        t = self._cf_times
+        growth = 1.0 + discount_rate / self.frequency
+
+        pv = self._cf_amounts * self._discount_factors(discount_rate)
+        price = float(pv.sum())
+        dp = float(-(pv * t).sum() / growth)
+        d2p = float((pv * t * (t + 1.0 / self.frequency)).sum() / growth ** 2)
+
+        return {
+            "price": price,
+            "dp_dy": dp,
+            "d2p_dy2": d2p,
+            "modified_duration": -dp / price if price else 0.0,
+            "convexity": d2p / price if price else 0.0,
+        }
+
+    def _rate_for(self, scenario: Scenario) -> float:
+        try:
+            if isinstance(scenario.rate, dict):
+                return scenario.rate.get(self.issuer, 0.0)
+            return scenario.rate
+        except Exception:
+            return 0.0
 
     # ---------------------------------------------------------
     # Revaluation
     # ---------------------------------------------------------
 
     def revalue(self, scenario: Scenario) -> float:
-        try:
-            if isinstance(scenario.rate, dict):
-                rate = scenario.rate.get(self.issuer, 0.0)
-            else:
-                rate = scenario.rate
-        except Exception:
-            rate = 0.0
+        if scenario.curve is not None:
+            return float(self.price_on_curves(scenario.curve_tenors, np.array([scenario.curve]))[0])
+
+        return self._calculate_present_value(self._rate_for(scenario))
+
+    def revalue_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        Revalue bond under every scenario in the matrix.
+
+        Scenario zero curves, when present, are discounted per cash-flow
+        date; otherwise a scalar rate prices once and broadcasts and a
+        rate vector goes through price_batch.
+        """
+        if scenarios.curves is not None:
+            pv = self.price_on_curves(scenarios.curve_tenors, scenarios.curves)
+            return pv.astype(scenarios.dtype, copy=False)
 
-        return self._calculate_present_value(rate)
+        if np.ndim(scenarios.rate) == 0:
+            pv = self._calculate_present_value(float(scenarios.rate))
+            return np.full(len(scenarios), pv, dtype=scenarios.dtype)
+
+        return self.price_batch(scenarios.rate).astype(scenarios.dtype, copy=False)
+
+    def dollar_greeks_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        $-Greeks under every scenario: only $-rho (closed-form dP/dy at
+        each scenario rate).
+        """
+        rates = np.asarray(scenarios.rate_vector(), dtype=np.float64)
+        t = self._cf_times
+        growth = 1.0 + rates[:, None] / self.frequency
+
+        pv = self._cf_amounts * self._discount_factors(rates[:, None])
+
+        out = np.zeros((len(scenarios), 5), dtype=np.float64)
+        out[:, 4] = -(pv * t).sum(axis=1) / growth[:, 0]
+        return out
 
     # ---------------------------------------------------------
     # Factor Sensitivities (DV01-style)
@@ -67,26 +186,32 @@ class BondProduct(Product):
 
     def get_sensitivities(self, scenario: Scenario) -> Dict[str, float]:
         """
-        Return rate sensitivity (dollar change per 1bp).
+        Return rate sensitivity dP/dy (dollar change per unit rate;
+        multiply by 1e-4 for DV01), in closed form.
         """
-        try:
-            if isinstance(scenario.rate, dict):
-                rate = scenario.rate.get(self.issuer, 0.0)
-            else:
-                rate = scenario.rate
-        except Exception:
-            rate = 0.0
+        dp = self.rate_risk(self._rate_for(scenario))["dp_dy"]
 
-        base_pv = self._calculate_present_value(rate)
-        bump_pv = self._calculate_present_value(rate + 0.0001)
+        return {
+            f"rate:{self.issuer}": dp
+        }
 
-        # DV01 (change per 1bp)
-        dv01 = (bump_pv - base_pv) / 0.0001
+    def get_risk_record(self, scenario: Scenario) -> Tuple[Optional[Dict[str, float]], Dict[str, float]]:
+        """
+        $-Greeks and sensitivities from a single rate sensitivity.
+        """
+        sens = self.get_sensitivities(scenario)
+        rho = sens[f"rate:{self.issuer}"]
 
-        return {
-            f"rate:{self.issuer}": float(dv01)
+        greeks = {
+            "dollar_delta": 0.0,
+            "dollar_gamma": 0.0,
+            "dollar_vega": 0.0,
+            "dollar_theta": 0.0,
+            "dollar_rho": float(rho),
         }
 
+        return greeks, sens
+
     # ---------------------------------------------------------
     # Full Dollar Greeks
     # ---------------------------------------------------------
@@ -101,22 +226,9 @@ class BondProduct(Product):
             Theta = 0
             Rho = rate sensitivity
 
-        Rho = dollar change per 1 unit rate change
+        Rho = dollar change per 1 unit rate change (closed form)
         """
-
-        try:
-            if isinstance(scenario.rate, dict):
-                rate = scenario.rate.get(self.issuer, 0.0)
-            else:
-                rate = scenario.rate
-        except Exception:
-            rate = 0.0
-
-        base_pv = self._calculate_present_value(rate)
-        bump_pv = self._calculate_present_value(rate + 0.0001)
-
-        # Sensitivity per unit rate (not per bp)
-        rho = (bump_pv - base_pv) / 0.0001
+        rho = self.rate_risk(self._rate_for(scenario))["dp_dy"]
 
         return {
             "dollar_delta": 0.0,
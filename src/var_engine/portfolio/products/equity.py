@@ -1,5 +1,8 @@
-from typing import Dict
+from typing import Dict, List
+import numpy as np
+
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.matrix import ScenarioMatrix
 from .base import Product
 
 
@@ -14,6 +17,10 @@ class StockProduct(Product):
         self.ticker = ticker
         self.quantity = float(quantity)
 
+    @property
+    def tickers(self) -> List[str]:
+        return [self.ticker]
+
     # ---------------------------------------------------------
     # Revaluation
     # ---------------------------------------------------------
@@ -29,6 +36,23 @@ class StockProduct(Product):
 
         return self.quantity * new_spot
 
+    def revalue_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        Revalue stock under every scenario in the matrix.
+        """
+        j = scenarios.column(self.ticker)
+        return scenarios.spot[:, j] * scenarios.dtype.type(self.quantity)
+
+    def dollar_greeks_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        $-Greeks under every scenario: only $-delta (quantity * spot).
+        """
+        j = scenarios.column(self.ticker)
+
+        out = np.zeros((len(scenarios), 5), dtype=np.float64)
+        out[:, 0] = self.quantity * scenarios.spot[:, j]
+        return out
+
     # ---------------------------------------------------------
     # Factor Sensitivities (for VaR / attribution)
     # ---------------------------------------------------------
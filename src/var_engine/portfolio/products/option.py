@@ -1,6 +1,9 @@
-from typing import Dict
+from typing import Dict, List, Tuple, Optional
+import numpy as np
+
 from var_engine.portfolio.products.base import Product
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.matrix import ScenarioMatrix
 from var_engine.models.option_pricing.base import OptionPricingModel
 
 
@@ -50,6 +53,10 @@ class OptionProduct(Product):
 
         super().__init__(product_id)
 
+    @property
+    def tickers(self) -> List[str]:
+        return [self.underlying_ticker]
+
     def revalue(self, scenario: Scenario) -> float:
         """
         Revalue option under a market scenario.
@@ -67,12 +74,56 @@ class OptionProduct(Product):
             strike=self.strike,
             maturity=remaining_maturity,
             vol=vol,
-            rate=scenario.rate,
+            rate=scenario.zero_rate(remaining_maturity),
             option_type=self.option_type,
         )
 
         return self.quantity * price
 
+    def revalue_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        Revalue option under every scenario in the matrix in one
+        pricing-model call.
+        """
+        j = scenarios.column(self.underlying_ticker)
+        remaining_maturity = max(self.maturity - scenarios.dt, 0.0)
+
+        prices = self.pricing_model.price_batch(
+            spot=scenarios.spot[:, j],
+            strike=self.strike,
+            maturity=remaining_maturity,
+            vol=scenarios.vol[:, j],
+            rate=scenarios.zero_rates(remaining_maturity),
+            option_type=self.option_type,
+        )
+
+        return prices * scenarios.dtype.type(self.quantity)
+
+    def dollar_greeks_batch(self, scenarios: ScenarioMatrix) -> np.ndarray:
+        """
+        $-Greeks under every scenario in one pricing-model call.
+        """
+        j = scenarios.column(self.underlying_ticker)
+        remaining_maturity = max(self.maturity - scenarios.dt, 0.0)
+
+        spot = np.asarray(scenarios.spot[:, j], dtype=np.float64)
+
+        g = self.pricing_model.greeks_batch(
+            spot=spot,
+            strike=self.strike,
+            maturity=remaining_maturity,
+            vol=np.asarray(scenarios.vol[:, j], dtype=np.float64),
+            rate=np.asarray(scenarios.zero_rates(remaining_maturity), dtype=np.float64),
+            option_type=self.option_type,
+        )
+
+        return self.quantity * np.column_stack([
+            g["delta"] * spot,
+            g["gamma"] * spot ** 2,
+            g["vega"],
+            g["theta"],
+            g["rho"],
+        ])
 
     def get_sensitivities(self, scenario: Scenario) -> Dict[str, float]:
         """
@@ -80,6 +131,22 @@ class OptionProduct(Product):
 
         Exposure = delta * spot * quantity
         """
+        return self.get_risk_record(scenario)[1]
+
+    def get_gamma_exposures(self, scenario: Scenario) -> Dict[Tuple[str, str], float]:
+        """
+        $-gamma exposure for delta-gamma VaR.
+
+        Exposure = gamma * spot^2 * quantity
+        """
+        greeks, _ = self.get_risk_record(scenario)
+        factor = f"spot:{self.underlying_ticker}"
+        return {(factor, factor): float(greeks["dollar_gamma"])}
+
+    def get_risk_record(self, scenario: Scenario) -> Tuple[Optional[Dict[str, float]], Dict[str, float]]:
+        """
+        $-Greeks and factor sensitivities from one pricing-model call.
+        """
         try:
             spot = scenario.spot[self.underlying_ticker]
             vol = scenario.vol[self.underlying_ticker]
@@ -87,32 +154,34 @@ class OptionProduct(Product):
             raise KeyError(f"Scenario missing data for {self.underlying_ticker}") from e
         remaining_maturity = max(self.maturity - scenario.dt, 0.0)
 
-        greeks = self.pricing_model.greeks(
+        g = self.pricing_model.greeks(
             spot=spot,
             strike=self.strike,
             maturity=remaining_maturity,
             vol=vol,
-            rate=scenario.rate,
-            option_type=self.option_type
+            rate=scenario.zero_rate(remaining_maturity),
+            option_type=self.option_type,
         )
 
-        unit_delta = greeks["delta"]
-        dollar_delta = unit_delta * spot * self.quantity
+        dollar_delta = g["delta"] * spot * self.quantity
+        dollar_vega = g["vega"] * self.quantity
+        dollar_rho = g["rho"] * self.quantity
 
-        # exposure = delta * spot * self.quantity
-        
-        return {
-            # f"spot:{self.underlying_ticker}": greeks["delta"] * spot * self.quantity,
+        greeks = {
+            "dollar_delta": dollar_delta,
+            "dollar_gamma": g["gamma"] * (spot ** 2) * self.quantity,
+            "dollar_vega": dollar_vega,
+            "dollar_theta": g["theta"] * self.quantity,
+            "dollar_rho": dollar_rho,
+        }
+        sensitivities = {
             f"spot:{self.underlying_ticker}": float(dollar_delta),
-            f"vol:{self.underlying_ticker}": greeks["vega"] * self.quantity,
-            "rate": greeks["rho"] * self.quantity,
+            f"vol:{self.underlying_ticker}": dollar_vega,
+            "rate": dollar_rho,
         }
 
+        return greeks, sensitivities
 
-        # return {
-        #     f"spot:{self.underlying_ticker}": float(dollar_delta)
-        # }
-    
     # ---------------------------------------------------------
     # Optional: full $ Greeks (future use)
     # ---------------------------------------------------------
@@ -121,25 +190,4 @@ class OptionProduct(Product):
         Full dollar Greeks for advanced risk models.
         Not required for delta-normal VaR.
         """
-
-        spot = scenario.spot[self.underlying_ticker]
-        vol = scenario.vol[self.underlying_ticker]
-
-        remaining_maturity = max(self.maturity - scenario.dt, 0.0)
-
-        g = self.pricing_model.greeks(
-            spot=spot,
-            strike=self.strike,
-            maturity=remaining_maturity,
-            vol=vol,
-            rate=scenario.rate,
-            option_type=self.option_type,
-        )
-
-        return {
-            "dollar_delta": g["delta"] * spot * self.quantity,
-            "dollar_gamma": g["gamma"] * (spot ** 2) * self.quantity,
-            "dollar_vega": g["vega"] * self.quantity,
-            "dollar_theta": g["theta"] * self.quantity,
-            "dollar_rho": g["rho"] * self.quantity,
-        }    
\ No newline at end of file
+        return self.get_risk_record(scenario)[0]
@@ -0,0 +1,64 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+
+
+_MISSING = object()
+
+
+class ArtifactStore:
+    """
+    Heavy per-run outputs (P&L grids, correlation matrices) kept as
+    producers and built only when fetched by run id.
+
+    Each artifact is computed at most once: concurrent fetches of the
+    same artifact wait on its slot lock while the first one builds it.
+    The store keeps the most recent `max_runs` runs.
+    """
+
+    def __init__(self, max_runs: int = 256):
+        self.max_runs = int(max_runs)
+        self._runs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, producers: Dict[str, Callable[[], Any]]) -> str:
+        """
+        Register a run's artifact producers; returns its run id.
+        """
+        run_id = uuid.uuid4().hex
+        with self._lock:
+            self._runs[run_id] = {
+                name: [fn, _MISSING, threading.Lock()] for name, fn in producers.items()
+            }
+            while len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+        return run_id
+
+    def names(self, run_id: str) -> List[str]:
+        with self._lock:
+            return list(self._runs[run_id])
+
+    def get(self, run_id: str, name: str) -> Any:
+        """
+        Artifact value, built on first access. Raises KeyError for an
+        unknown (or evicted) run or artifact name.
+        """
+        with self._lock:
+            slot = self._runs[run_id][name]
+            self._runs.move_to_end(run_id)
+
+        value = slot[1]
+        if value is not _MISSING:
+            return value
+
+        with slot[2]:
+            # A producer that raised is kept, so a later fetch retries
+            if slot[1] is _MISSING:
+                slot[1] = slot[0]()
+                slot[0] = None
+            return slot[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
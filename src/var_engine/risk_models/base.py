@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, List, Dict
 import pandas as pd
 
 @dataclass
@@ -18,6 +18,8 @@ class VaRResult:
     pnl_distribution: Optional[pd.Series] = None
     scenario_values: Optional[pd.Series] = None
     metadata: Optional[dict] = None
+    # Rows of {horizon_days, confidence_level, var, es}
+    var_table: Optional[List[Dict[str, float]]] = None
 
 
 class ScenarioSet:
@@ -1,8 +1,14 @@
 from datetime import datetime
 from typing import Dict, Any, List
 
+import numpy as np
+import pandas as pd
+
 from var_engine.portfolio.portfolio import Portfolio
+from var_engine.portfolio.greeks_table import GreeksHistory
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.matrix import ScenarioMatrix
+from var_engine.time_series.rolling import rolling_covariance
 
 
 class GreeksEngine:
@@ -58,6 +64,48 @@ class GreeksEngine:
             },
         }
 
+    def run_historical(
+        self,
+        prices: pd.DataFrame,
+        returns: pd.DataFrame,
+        window: int,
+    ) -> GreeksHistory:
+        """
+        Position $-Greeks on every date with a full vol window.
+
+        Spots are the dataset's closes; vols are realised from the
+        rolling covariance of `returns` (as the single-date Greeks use
+        sqrt(diag(cov))). Rate and dt come from the engine's scenario.
+        All dates form one ScenarioMatrix, so each product evaluates its
+        Greeks in a single batched call.
+
+        Returns:
+            GreeksHistory with a (dates x positions x greeks) array.
+        """
+        assets = [a for a in returns.columns if a in prices.columns]
+        returns = returns[assets]
+
+        positions, vols = [], []
+        for pos, covs in rolling_covariance(returns, window):
+            positions.append(pos)
+            vols.append(np.sqrt(np.diagonal(covs, axis1=1, axis2=2)))
+
+        if not positions:
+            raise ValueError(f"Need at least {window} returns for a {window}-day vol window")
+
+        dates = returns.index[np.concatenate(positions)]
+
+        scenarios = ScenarioMatrix(
+            assets=assets,
+            spot=prices.loc[dates, assets].to_numpy(dtype=np.float64),
+            vol=np.vstack(vols),
+            rate=self.scenario.rate,
+            dt=self.scenario.dt,
+            labels=[str(d.date()) for d in dates],
+        )
+
+        return self.portfolio.greeks_history(scenarios, dates)
+
     # ==========================================================
     # Internal Helpers
     # ==========================================================
@@ -1,6 +1,11 @@
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Sequence
 from var_engine.scenarios.scenario import Scenario
+from var_engine.risk_models.ladder import (
+    spot_vol_ladder,
+    DEFAULT_SPOT_SHOCKS,
+    DEFAULT_VOL_SHOCKS,
+)
 
 
 class GreeksService:
@@ -9,7 +14,7 @@ class GreeksService:
         self.portfolio = portfolio
         self.rate = float(rate)
 
-    def compute(self, market_data: Dict[str, Any]):
+    def base_scenario(self, market_data: Dict[str, Any]) -> Scenario:
 
         if "spot" not in market_data:
             raise ValueError("Market data missing 'spot'")
@@ -35,28 +40,58 @@ class GreeksService:
         # ---------------------------------
         # Base scenario
         # ---------------------------------
-        base_scenario = Scenario(
+        return Scenario(
             spot=spot,
             vol=vol_map,
             rate=self.rate,
             dt=0.0
         )
 
+    def compute(self, market_data: Dict[str, Any]):
+
+        base_scenario = self.base_scenario(market_data)
+
         # ---------------------------------
-        # Delegate to Portfolio
+        # Delegate to Portfolio (one Greeks pass)
         # ---------------------------------
 
-        position_greeks = self.portfolio.get_position_greeks(base_scenario)
-        portfolio_greeks = self.portfolio.get_portfolio_greeks(base_scenario)
-        factor_exposures = self.portfolio.get_factor_exposures(base_scenario)
+        table = self.portfolio.greeks_table(base_scenario)
 
         return {
-            "positions": position_greeks,
-            "totals": portfolio_greeks,
-            "factor_exposures": factor_exposures,
+            "positions": table.positions(),
+            "totals": table.totals(),
+            "factor_exposures": table.factor_exposures(),
             "metadata": {
                 "vol_source": "realised_from_covariance",
                 "rate": self.rate,
                 "n_positions": len(self.portfolio.products)
             }
         }
+
+    def ladder(
+        self,
+        market_data: Dict[str, Any],
+        spot_shocks: Sequence[float] = DEFAULT_SPOT_SHOCKS,
+        vol_shocks: Sequence[float] = DEFAULT_VOL_SHOCKS,
+        underlyings: Optional[Sequence[str]] = None,
+    ):
+        """
+        Spot / vol P&L ladder around the base scenario, revalued as one
+        batched grid.
+        """
+        results = spot_vol_ladder(
+            self.portfolio,
+            self.base_scenario(market_data),
+            spot_shocks=spot_shocks,
+            vol_shocks=vol_shocks,
+            underlyings=underlyings,
+        )
+
+        results["metadata"] = {
+            "vol_source": "realised_from_covariance",
+            "shock_type": "relative",
+            "rate": self.rate,
+            "n_positions": len(self.portfolio.products),
+        }
+
+        return results
@@ -1,10 +1,15 @@
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Sequence
+from numpy.typing import DTypeLike
+from typing import Dict, Any, Optional, Sequence
 
 from .var_model import VaRModel
 from .base import VaRResult
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.matrix import ScenarioMatrix
+from var_engine.scenarios.generator import resolve_dtype
+from var_engine.scenarios.filtered_hs import FilteredHistSimGenerator, VOL_FILTERS
+from var_engine.scenarios.rate_curves import CurveHistory
 
 
 class HistSimVaR(VaRModel):
@@ -12,22 +17,58 @@ class HistSimVaR(VaRModel):
     Historical Simulation (HistSim) VaR model.
 
     Philosophy:
-    - Spot is shocked using historical returns
+    - Spot is shocked using historical log returns: S * exp(r)
+    - `horizon_days` > 1 uses overlapping h-day cumulative returns
+    - Scenarios come from FilteredHistSimGenerator (unfiltered when
+      `vol_filter` is None)
     - Vol is constant and derived from realised covariance
-    - Rate is constant
+    - Rate is constant, unless market data carries a zero curve: then
+      each scenario gets the curve shocked by its historical h-day change
     - Each scenario is a complete market state
+    - Scenarios are built and revalued in `dtype` precision
+      (float32 or float64); P&L is accumulated in float64
+    - Optional `vol_filter` ("ewma" / "garch") runs filtered HS:
+      returns are rescaled from their own conditional vol to today's
     """
 
     def __init__(
             self,
             confidence_level: float,
             hist_data_window_days: int = 252,
+            horizon_days: int = 1,
             rate: float = 0.0,
+            dtype: DTypeLike = np.float64,
+            vol_filter: Optional[str] = None,
+            ewma_lambda: float = 0.94,
+            garch_alpha: float = 0.06,
+            garch_beta: float = 0.93,
+            confidence_levels: Optional[Sequence[float]] = None,
+            horizons_days: Optional[Sequence[int]] = None,
             ):
-        super().__init__(confidence_level)
+        super().__init__(
+            confidence_level,
+            confidence_levels=confidence_levels,
+            horizons_days=horizons_days,
+        )
+
+        if horizon_days < 1:
+            raise ValueError("horizon_days must be at least 1")
+
+        if vol_filter is not None and vol_filter not in VOL_FILTERS:
+            raise ValueError(f"vol_filter must be one of {VOL_FILTERS} or None")
+
         self.hist_data_window_days = hist_data_window_days
+        self.horizon_days = horizon_days
         self.rate = rate
+        self.dtype = resolve_dtype(dtype)
+        self.vol_filter = vol_filter
+        self.ewma_lambda = ewma_lambda
+        self.garch_alpha = garch_alpha
+        self.garch_beta = garch_beta
+
 
+    def native_horizon_days(self) -> float:
+        return self.horizon_days
 
     def run(self, portfolio, market_data: Dict[str, Any]) -> VaRResult:
         base_scenario = self._create_base_scenario(market_data)
@@ -54,49 +95,56 @@ class HistSimVaR(VaRModel):
             for a, v in zip(assets, vols)
         }
 
+        curve = CurveHistory.from_market_data(market_data)
+
         return Scenario(
             spot=spot,
             vol=vol_map,
-            rate=self.rate,
+            rate=market_data.get("rate", self.rate),
             dt=0.0,
+            curve_tenors=tuple(curve.tenors.tolist()) if curve is not None else None,
+            curve=tuple(curve.base.tolist()) if curve is not None else None,
         )
 
 
-    def _create_scenarios(self, market_data: Dict[str, Any], base_scenario: Scenario) -> Sequence[Scenario]:
+    def _create_scenarios(self, market_data: Dict[str, Any], base_scenario: Scenario) -> ScenarioMatrix:
 
         spots = market_data["spot"]
-        returns = market_data["returns"]
-
         assets = list(spots.keys())
-        
-        returns = returns[assets]
-
-        scenarios = []
 
-        for _, row in returns.iterrows():
-            shocked_spots = {
-                a: spots[a] * (1.0 + float(row[a]))
-                for a in assets
-            }
+        # Plain or filtered HS over overlapping h-day log-return windows
+        generator = FilteredHistSimGenerator(
+            spot=spots,
+            returns=market_data["returns"],
+            vol={a: base_scenario.vol[a] for a in assets},
+            horizon=self.horizon_days / 252,
+            method=self.vol_filter,
+            lam=self.ewma_lambda,
+            alpha=self.garch_alpha,
+            beta=self.garch_beta,
+            rate=base_scenario.rate,
+            dtype=self.dtype,
+            horizon_days=self.horizon_days,
+        )
+        scenarios = generator.generate()
 
-            scenarios.append(
-                Scenario(
-                    spot=shocked_spots,
-                    vol=base_scenario.vol,     # optional for HistSim
-                    rate=self.rate,
-                    dt=1/252,
-                )
-            )
+        # Same windows of historical curve changes
+        curve = CurveHistory.from_market_data(market_data)
+        if curve is None:
+            return scenarios
 
-        return scenarios
+        return curve.attach(scenarios, curve.historical(self.horizon_days, dtype=self.dtype))
 
     def model_metadata(self) -> dict:
         meta = super().model_metadata()
         meta.update(
             {
                 "hist_data_window_days": self.hist_data_window_days,
+                "horizon_days": self.horizon_days,
                 "vol_assumption": "constant_realised",
+                "vol_filter": self.vol_filter,
                 "rate": self.rate,                
+                "dtype": self.dtype.name,
                 # "pnls": self._pnl_dist
                 # "volatility": self._volatility,
             }
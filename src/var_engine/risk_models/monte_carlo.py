@@ -1,15 +1,26 @@
 import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
 from typing import Dict, Any, Sequence, Optional
 
 from .var_model import VaRModel
 from .base import VaRResult
 from var_engine.scenarios.gbm import GBMScenarioGenerator
+from var_engine.scenarios.generator import resolve_dtype
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.rate_curves import CurveHistory
 
 class MonteCarloVaR(VaRModel):
     """
     Monte Carlo VaR model using multivariate normal simulation.
+
+    `dtype=np.float32` generates shocks and revalues products in single
+    precision (half the memory of float64); portfolio totals and P&L are
+    still accumulated in float64.
+
+    When market data carries a zero curve, every scenario also gets a
+    simulated curve: normal shocks to its leading `n_curve_factors`
+    principal components (level / slope / curvature).
     """
 
     def __init__(
@@ -22,9 +33,18 @@ class MonteCarloVaR(VaRModel):
             vol_of_vol: float = None,
             # cov_estimator: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
             use_mean: bool = True,
-            generator = GBMScenarioGenerator
+            generator = GBMScenarioGenerator,
+            dtype: DTypeLike = np.float64,
+            generator_kwargs: Optional[Dict[str, Any]] = None,
+            confidence_levels: Optional[Sequence[float]] = None,
+            horizons_days: Optional[Sequence[int]] = None,
+            n_curve_factors: int = 3,
             ):
-        super().__init__(confidence_level)
+        super().__init__(
+            confidence_level,
+            confidence_levels=confidence_levels,
+            horizons_days=horizons_days,
+        )
 
         if n_sims <= 0:
             raise ValueError("n_sims must be positive")
@@ -38,12 +58,18 @@ class MonteCarloVaR(VaRModel):
         self.use_mean = use_mean
         # self.cov_estimator = cov_estimator or (lambda r: r.cov())
         self.generator = generator
+        self.generator_kwargs = generator_kwargs or {}
+        self.dtype = resolve_dtype(dtype)
+        self.n_curve_factors = n_curve_factors
 
         self._volatility: Optional[float] = None
         # self._scenarios = None
         # self._pnl = None
     
 
+    def native_horizon_days(self) -> int:
+        return int(round(self.horizon * 252))
+
     def run(self, portfolio, market_data: Dict[str, Any]) -> VaRResult:
         """
         Run Monte Carlo VaR using full revaluation under scenarios.
@@ -58,17 +84,42 @@ class MonteCarloVaR(VaRModel):
         # print(np.sqrt(np.diag(market_data["cov"])))
 
          # Create scenario generator
-        generator = self.generator(
-            spot=market_data["spot"],
-            # vols=vols,
-            # corr=corr,
-            cov = market_data["cov"] * 252,
+        generator = self.generator.from_market_data(
+            market_data,
             horizon=self.horizon, #1.0/252,  # 1 day horizon
             seed=self.random_seed, #None #request.random_seed
             vol_of_vol=self.vol_of_vol,
+            dtype=self.dtype,
+            **{"rate": market_data.get("rate", 0.0), **self.generator_kwargs},
         )
 
-        return generator.generate(n=self.n_sims)
+        scenarios = generator.generate(n=self.n_sims)
+
+        curve = CurveHistory.from_market_data(market_data)
+        if curve is None:
+            return scenarios
+
+        # Curve shocks conditional on the simulated equity returns, so
+        # rates and equities keep their historical correlation
+        assets = list(scenarios.assets)
+        given = None
+        if assets:
+            spot0 = np.array([market_data["spot"][a] for a in assets], dtype=np.float64)
+            given = (
+                market_data["returns"][assets].to_numpy(dtype=np.float64),
+                np.log(scenarios.spot.astype(np.float64) / spot0),
+            )
+
+        curves = curve.simulate(
+            self.n_sims,
+            horizon_days=self.horizon * 252,
+            rng=generator.rng,
+            n_components=self.n_curve_factors,
+            dtype=self.dtype,
+            given=given,
+        )
+
+        return curve.attach(scenarios, curves)
     
     def _create_base_scenario(self, market_data: Dict[str, Any]) -> Scenario:
 
@@ -78,12 +129,16 @@ class MonteCarloVaR(VaRModel):
         vols = np.sqrt(np.diag(cov))
         assets = list(spot.keys())
 
+        curve = CurveHistory.from_market_data(market_data)
+
         return Scenario(
             spot=spot,
             vol={a: float(v) for a, v in zip(assets, vols)},
-            rate=0.0,
+            rate=market_data.get("rate", 0.0),
             dt=self.horizon,
             # dt=0.0,
+            curve_tenors=tuple(curve.tenors.tolist()) if curve is not None else None,
+            curve=tuple(curve.base.tolist()) if curve is not None else None,
         )
 
     def compute_es(self, pnl: pd.Series) -> float:
@@ -110,12 +165,15 @@ class MonteCarloVaR(VaRModel):
         meta.update(
             {
                 "model": "MonteCarloVaR",
+                "generator": self.generator.__name__,
                 "n_sims": self.n_sims,
                 # "parameter_estimation_window_days": self.parameter_estimation_window_days,
                 "use_mean": self.use_mean,
                 "volatility": self._volatility,
                 "random_seed": self.random_seed,
                 "vol_of_vol": self.vol_of_vol,
+                "dtype": self.dtype.name,
+                "n_curve_factors": self.n_curve_factors,
                 "pnls": self._pnl_dist,
             }
         )
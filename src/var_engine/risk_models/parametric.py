@@ -1,11 +1,36 @@
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from scipy.stats import norm
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Union, Sequence, List
 
 from .var_model import VaRModel
 from .base import VaRResult
+from .artifacts import ArtifactStore
 from var_engine.scenarios.scenario import Scenario
+from var_engine.time_series.factor_covariance import FactorCovariance
+
+
+@lru_cache(maxsize=8)
+def normal_quantile_grid(n_points: int) -> np.ndarray:
+    """
+    Read-only standard-normal quantiles on linspace(0.001, 0.999, n_points).
+    """
+    grid = norm.ppf(np.linspace(0.001, 0.999, n_points))
+    grid.flags.writeable = False
+    return grid
+
+
+@lru_cache(maxsize=8)
+def _normal_grid_moments(n_points: int) -> Dict[str, float]:
+    g = pd.Series(normal_quantile_grid(n_points))
+    return {
+        "mean": float(g.mean()),
+        "std": float(g.std(ddof=1)),
+        "skew": float(g.skew()),
+        "kurtosis": float(g.kurtosis()),
+    }
 
 
 class ParametricVaR(VaRModel):
@@ -13,19 +38,34 @@ class ParametricVaR(VaRModel):
     Variance-covariance (parametric) VaR model.
     Handles multiple factor types: spot, vol, DV01, etc.
     Assumes joint normality of returns.
+
+    cov_estimator may return a dense covariance DataFrame or a
+    FactorCovariance (B F B' + D); the latter is applied in O(n k)
+    without forming the n x n matrix.
+
+    With an ArtifactStore, the P&L grid and correlation matrix are not
+    built per run: metadata carries a run_id to fetch them on demand.
     """
 
     def __init__(
         self,
         confidence_level: float,
         cov_window_days: int = 252,
-        cov_estimator: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        cov_estimator: Optional[Callable[[pd.DataFrame], Union[pd.DataFrame, FactorCovariance]]] = None,
         n_points: int = 10001,
+        confidence_levels: Optional[Sequence[float]] = None,
+        horizons_days: Optional[Sequence[int]] = None,
+        artifacts: Optional[ArtifactStore] = None,
     ):
-        super().__init__(confidence_level)
+        super().__init__(
+            confidence_level,
+            confidence_levels=confidence_levels,
+            horizons_days=horizons_days,
+        )
         self.cov_window_days = cov_window_days
         self.cov_estimator = cov_estimator or (lambda r: r.cov())
         self.n_points = n_points
+        self.artifacts = artifacts
 
     def run(self, portfolio, market_data: Dict[str, Any]) -> VaRResult:
 
@@ -46,11 +86,11 @@ class ParametricVaR(VaRModel):
         cov_matrix = self.cov_estimator(returns_df.tail(self.cov_window_days))
 
         # --- Portfolio variance and volatility ---
-        port_var = w.T @ cov_matrix @ w
-        port_vol = np.sqrt(port_var)
+        w_vec = w.to_numpy(dtype=np.float64)
+        sigma_w = self._cov_dot(cov_matrix, w_vec)
 
-        # --- Correlation matrix for metadata ---
-        correlation = self._correlation_from_cov(cov_matrix)
+        port_var = float(w_vec @ sigma_w)
+        port_vol = np.sqrt(port_var)
 
         # --- Compute VaR ---
         z = norm.ppf(self.confidence_level)
@@ -58,21 +98,34 @@ class ParametricVaR(VaRModel):
         var_dol = VaR
         var_pct = VaR / portfolio_value
 
-        # --- P&L distribution ---
-        pnl_dist = self._build_pnl_distribution(port_vol)
+        # --- Marginal / component VaR (components sum to VaR) ---
+        marginal = -z * sigma_w / port_vol if port_vol > 0 else np.zeros_like(sigma_w)
+        component = w_vec * marginal
 
         meta = {
             **super().model_metadata(),
             "cov_window_days": self.cov_window_days,
             "volatility": port_vol,
-            "correlation_matrix": correlation,
-            "pnls": pnl_dist,
+            "marginal_var": dict(zip(w.index, marginal.tolist())),
+            "component_var": dict(zip(w.index, component.tolist())),
         }
 
-        diagnostics_core = self._compute_diagnostics(
-            pnl=pd.Series(pnl_dist),
+        # --- Heavy outputs: inline, or lazily by run id ---
+        producers = {
+            "pnls": lambda: self._build_pnl_distribution(port_vol),
+            # dense n x n matrix is never formed for a factor covariance
+            "correlation_matrix": (
+                (lambda: None) if isinstance(cov_matrix, FactorCovariance)
+                else (lambda: self._correlation_from_cov(cov_matrix))
+            ),
+        }
+        artifacts = self._publish_artifacts(producers, meta)
+
+        diagnostics_core = self._analytic_diagnostics(
+            distribution=self._normal_distribution(port_vol),
             var=var_dol,
             es=var_dol,  # ES proxy for now
+            pnls=artifacts.get("pnls"),
         )
 
         diagnostics_combined = {
@@ -80,14 +133,114 @@ class ParametricVaR(VaRModel):
             **diagnostics_core,
         }
 
+        var_table = self.normal_var_table(port_vol) if self._wants_var_table() else None
+        if var_table is not None:
+            diagnostics_combined["var_table"] = var_table
+
         return VaRResult(
             portfolio_value=float(portfolio_value),
             var_dollar=float(var_dol),
             var_percent=float(var_pct),
             confidence_level=self.confidence_level,
+            volatility=float(port_vol),
             metadata=diagnostics_combined,
+            var_table=var_table,
         )
 
+    def normal_var_table(self, port_vol: float) -> List[Dict[str, float]]:
+        """
+        VaR / ES per (horizon, confidence level) from one daily volatility,
+        scaled by sqrt(h). Same tail convention as run: confidence_level
+        is the tail probability, VaR = -z sigma and ES = phi(z) / level
+        sigma with z = ppf(level).
+        """
+        levels, horizons = self._table_axes()
+
+        tail = np.asarray(levels, dtype=np.float64)
+        z = norm.ppf(tail)
+        es_z = norm.pdf(z) / tail
+
+        return [
+            {
+                "horizon_days": h,
+                "confidence_level": level,
+                "var": float(-zi * port_vol * np.sqrt(h)),
+                "es": float(ei * port_vol * np.sqrt(h)),
+            }
+            for h in horizons
+            for level, zi, ei in zip(levels, z, es_z)
+        ]
+
+    def run_batch(self, portfolios: Dict[str, Any], market_data: Dict[str, Any]) -> Dict[str, VaRResult]:
+        """
+        Parametric VaR for many portfolios against one shared covariance.
+
+        Exposures are stacked into an (m, n) matrix W over the union of
+        factors, and every portfolio variance comes from
+        diag(W Sigma W') = rowsum((W Sigma) * W) in one matrix product.
+        Results carry volatility and component VaR; the per-portfolio
+        P&L grid and correlation matrix are left out.
+        """
+        names = list(portfolios)
+        if not names:
+            raise ValueError("No portfolios given")
+
+        base_scenario = self._create_base_scenario(market_data)
+        values = [portfolios[n].revalue(base_scenario) for n in names]
+        exposures = [portfolios[n].get_sensitivities(base_scenario) for n in names]
+
+        factors = list(dict.fromkeys(f for e in exposures for f in e))
+        if not factors:
+            raise ValueError("Portfolio sensitivities are empty")
+        col = {f: j for j, f in enumerate(factors)}
+
+        W = np.zeros((len(names), len(factors)), dtype=np.float64)
+        for i, e in enumerate(exposures):
+            for f, x in e.items():
+                W[i, col[f]] = x
+
+        returns_df = self._build_factor_returns(market_data, factors)
+        cov_matrix = self.cov_estimator(returns_df.tail(self.cov_window_days))
+
+        sigma_w = self._cov_dot(cov_matrix, W.T).T
+        port_vol = np.sqrt(np.clip(np.einsum("ij,ij->i", W, sigma_w), 0.0, None))
+
+        z = norm.ppf(self.confidence_level)
+        var_dol = -z * port_vol
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            marginal = np.where(port_vol[:, None] > 0, -z * sigma_w / port_vol[:, None], 0.0)
+        component = W * marginal
+
+        results = {}
+        for i, name in enumerate(names):
+            held = np.flatnonzero(W[i])
+            results[name] = VaRResult(
+                portfolio_value=float(values[i]),
+                var_dollar=float(var_dol[i]),
+                var_percent=float(var_dol[i] / values[i]),
+                confidence_level=self.confidence_level,
+                volatility=float(port_vol[i]),
+                var_table=self.normal_var_table(port_vol[i]) if self._wants_var_table() else None,
+                metadata={
+                    **super().model_metadata(),
+                    "cov_window_days": self.cov_window_days,
+                    "volatility": float(port_vol[i]),
+                    "component_var": {factors[j]: float(component[i, j]) for j in held},
+                },
+            )
+
+        return results
+
+    @staticmethod
+    def _cov_dot(cov_matrix, x: np.ndarray) -> np.ndarray:
+        """
+        Sigma @ x for a dense or factor covariance; x is (n,) or (n, m).
+        """
+        if isinstance(cov_matrix, FactorCovariance):
+            return cov_matrix.dot(x)
+        return cov_matrix.to_numpy(dtype=np.float64) @ x
+
     def _build_factor_returns(self, market_data: Dict[str, Any], factor_keys):
         """
         Align historical returns DataFrame to factor exposures.
@@ -97,7 +250,7 @@ class ParametricVaR(VaRModel):
         Returns:
             pd.DataFrame with columns matching factor_keys
         """
-        returns_df = market_data["returns"].copy()
+        returns_df = market_data["returns"]
 
         # Map factor_keys to underlying columns in returns_df
         factor_map = {}
@@ -114,15 +267,14 @@ class ParametricVaR(VaRModel):
                 factor_map[f] = f  # fallback
 
         # Subset and rename to factor_keys
-        df = pd.DataFrame()
-        for fk, col in factor_map.items():
-            if col not in returns_df.columns:
-                # Fill missing factors with 0 returns
-                df[fk] = 0.0
-            else:
-                df[fk] = returns_df[col]
-
-        return df
+        # (missing factors are filled with 0 returns)
+        return pd.DataFrame(
+            {
+                fk: returns_df[col] if col in returns_df.columns else 0.0
+                for fk, col in factor_map.items()
+            },
+            index=returns_df.index,
+        )
 
     def _create_base_scenario(self, market_data: Dict[str, Any]) -> Scenario:
         """
@@ -130,11 +282,15 @@ class ParametricVaR(VaRModel):
         Currently supports spot and vol; rate defaults to 0.0
         """
         spot = market_data.get("spot", {})
-        cov = market_data.get("cov", np.array([]))
-
-        vols = np.sqrt(np.diag(cov)) if cov.size else {a: 0.2 for a in spot.keys()}
         assets = list(spot.keys())
 
+        # Per-asset vols, so the dense covariance is not needed here
+        if "vols" in market_data:
+            vols = [market_data["vols"][a] for a in assets]
+        else:
+            cov = market_data.get("cov", np.array([]))
+            vols = np.sqrt(np.diag(cov)) if cov.size else [0.2] * len(assets)
+
         return Scenario(
             spot=spot,
             vol={a: float(v) for a, v in zip(assets, vols)},
@@ -143,9 +299,62 @@ class ParametricVaR(VaRModel):
         )
 
     def _build_pnl_distribution(self, port_vol: float):
-        probs = np.linspace(0.001, 0.999, self.n_points)
-        z = norm.ppf(probs)
-        return pd.Series(z * port_vol).tolist()
+        return (normal_quantile_grid(self.n_points) * port_vol).tolist()
+
+    def _publish_artifacts(self, producers: Dict[str, Callable[[], Any]], meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Without a store, build every artifact into `meta` (and return
+        them); with one, register the producers and record the run id.
+        """
+        if self.artifacts is None:
+            built = {name: fn() for name, fn in producers.items()}
+            meta.update(built)
+            return built
+
+        meta["run_id"] = self.artifacts.put(producers)
+        meta["artifacts"] = list(producers)
+        return {}
+
+    def _normal_distribution(self, port_vol: float) -> Dict[str, float]:
+        """
+        Summary stats of the n_points normal P&L grid, from cached grid
+        moments scaled by port_vol.
+        """
+        m = _normal_grid_moments(self.n_points)
+        grid = normal_quantile_grid(self.n_points)
+
+        return {
+            "mean": float(m["mean"] * port_vol),
+            "std": float(m["std"] * port_vol),
+            "min": float(grid[0] * port_vol),
+            "max": float(grid[-1] * port_vol),
+            "skew": m["skew"],
+            "kurtosis": m["kurtosis"],
+        }
+
+    def _analytic_diagnostics(self, distribution: Dict[str, float], var: float, es: float, pnls=None) -> dict:
+        """
+        Same layout as _compute_diagnostics, without materialising the
+        P&L grid (included only if already built).
+        """
+        diag = {
+            "distribution": distribution,
+            "tail": {
+                "var": float(var),
+                "es": float(es),
+            },
+            "scenarios": {
+                "n_total": int(self.n_points),
+                "n_selected": 0,
+            },
+            "model": self.__class__.__name__,
+            "selected_scenarios": [],
+        }
+
+        if pnls is not None:
+            diag["pnls"] = pnls
+
+        return diag
 
     @staticmethod
     def _correlation_from_cov(cov: pd.DataFrame):
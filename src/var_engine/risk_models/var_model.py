@@ -5,6 +5,7 @@ import numpy as np
 
 from .base import VaRResult, ScenarioSet
 from var_engine.scenarios.scenario import Scenario
+from var_engine.scenarios.matrix import ScenarioMatrix
 
 class VaRModel(ABC):
     """
@@ -22,13 +23,22 @@ class VaRModel(ABC):
             enable_attribution: bool = True,
             n_tail: int = 20,
             n_var_near: int = 10,
+            confidence_levels: Optional[Sequence[float]] = None,
+            horizons_days: Optional[Sequence[int]] = None,
             ):
         if not 0 < confidence_level < 1:
             raise ValueError("confidence_level must be between 0 and 1")
+        if confidence_levels is not None and not all(0 < c < 1 for c in confidence_levels):
+            raise ValueError("confidence_levels must be between 0 and 1")
+        if horizons_days is not None and not all(h >= 1 for h in horizons_days):
+            raise ValueError("horizons_days must be at least 1")
         self.confidence_level = confidence_level
         self.enable_attribution = enable_attribution
         self.n_tail = n_tail
         self.n_var_near = n_var_near
+        # VaR term structure (one row per horizon x level)
+        self.confidence_levels = list(confidence_levels) if confidence_levels else None
+        self.horizons_days = list(horizons_days) if horizons_days else None
 
     def run(self, portfolio, base_scenario: ScenarioSet = None, scenarios: Optional[Sequence[ScenarioSet]] = None) -> VaRResult:
         """
@@ -43,13 +53,17 @@ class VaRModel(ABC):
         # ---------------------------
         # Revaluation loop
         # ---------------------------        
-        scenario_values = []
-        pnls = []
-
-        for s in scenarios:
-            v = portfolio.revalue(s)
-            scenario_values.append(v)
-            pnls.append(v - portfolio_value)
+        if isinstance(scenarios, ScenarioMatrix):
+            scenario_values = portfolio.revalue_batch(scenarios)
+            pnls = scenario_values - portfolio_value
+        else:
+            scenario_values = []
+            pnls = []
+
+            for s in scenarios:
+                v = portfolio.revalue(s)
+                scenario_values.append(v)
+                pnls.append(v - portfolio_value)
 
         pnl = pd.Series(pnls)
 
@@ -59,6 +73,7 @@ class VaRModel(ABC):
         var_dol = self.compute_var(pnl)
         es = self.compute_es(pnl)
         var_pct = var_dol / portfolio_value
+        var_table = self.compute_var_table(pnl) if self._wants_var_table() else None
 
         # ---------------------------
         # Scenario selection
@@ -104,6 +119,8 @@ class VaRModel(ABC):
             selected=selected,
             # scenario_values=scenario_values.tolist(),
         )
+        if var_table is not None:
+            diagnostics["var_table"] = var_table
 
         # meta = self.model_metadata()
 
@@ -119,6 +136,7 @@ class VaRModel(ABC):
             var_percent=float(var_pct),
             confidence_level=self.confidence_level,
             metadata=diagnostics,
+            var_table=var_table,
         )
     
     def revalue_portfolio(self, portfolio, scenarios: ScenarioSet) -> pd.Series:
@@ -212,6 +230,53 @@ class VaRModel(ABC):
         tail = pnl[pnl <= q]
         return float(-tail.mean())
 
+    # =====================================================
+    # VaR term structure
+    # =====================================================
+
+    def _wants_var_table(self) -> bool:
+        return self.confidence_levels is not None or self.horizons_days is not None
+
+    def _table_axes(self):
+        levels = self.confidence_levels or [self.confidence_level]
+        horizons = self.horizons_days or [self.native_horizon_days()]
+        return levels, horizons
+
+    def native_horizon_days(self) -> float:
+        """
+        Horizon (in days) of the model's own P&L. Subclasses override.
+        """
+        return 1
+
+    def compute_var_table(self, pnl) -> List[Dict[str, float]]:
+        """
+        VaR / ES for every (horizon, confidence level) from one sorted
+        P&L array (same conventions as compute_var / compute_es).
+
+        Horizons other than the native one are scaled by
+        sqrt(h / native_horizon_days).
+        """
+        levels, horizons = self._table_axes()
+
+        x = np.sort(np.asarray(pnl, dtype=np.float64))
+        tail_sums = np.cumsum(x)
+        quantiles = np.quantile(x, levels)
+
+        rows = []
+        for h in horizons:
+            scale = np.sqrt(h / self.native_horizon_days())
+            for level, q in zip(levels, quantiles):
+                k = int(np.searchsorted(x, q, side="right"))
+                tail_mean = tail_sums[k - 1] / k if k else q
+                rows.append({
+                    "horizon_days": h,
+                    "confidence_level": level,
+                    "var": float(-q * scale),
+                    "es": float(-tail_mean * scale),
+                })
+
+        return rows
+
 
     # =====================================================
     # Scenario selection around VaR
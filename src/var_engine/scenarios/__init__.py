@@ -1,5 +1,19 @@
 from .scenario import Scenario
+from .matrix import ScenarioMatrix
 from .generator import ScenarioGenerator
 from .gbm import GBMScenarioGenerator
+from .filtered_hs import FilteredHistSimGenerator
+from .bootstrap import BlockBootstrapGenerator
+from .student_t import StudentTScenarioGenerator
+from .rate_curves import CurveHistory
 
-__all__ = ["Scenario", "ScenarioGenerator", "GBMScenarioGenerator"]
\ No newline at end of file
+__all__ = [
+    "Scenario",
+    "ScenarioMatrix",
+    "ScenarioGenerator",
+    "GBMScenarioGenerator",
+    "FilteredHistSimGenerator",
+    "BlockBootstrapGenerator",
+    "StudentTScenarioGenerator",
+    "CurveHistory",
+]
\ No newline at end of file
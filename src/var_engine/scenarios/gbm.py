@@ -1,8 +1,9 @@
-from typing import Dict, Sequence, Optional
+from typing import Dict, Optional
 import numpy as np
+from numpy.typing import DTypeLike
 
-from var_engine.scenarios.scenario import Scenario
-from var_engine.scenarios.generator import ScenarioGenerator
+from var_engine.scenarios.matrix import ScenarioMatrix
+from var_engine.scenarios.generator import ScenarioGenerator, covariance_factor
 
 
 class GBMScenarioGenerator(ScenarioGenerator):
@@ -23,6 +24,8 @@ class GBMScenarioGenerator(ScenarioGenerator):
         drifts: Optional[Dict[str, float]] = None,
         seed: Optional[int] = None,
         vol_of_vol: Optional[float] = None,
+        dtype: DTypeLike = np.float64,
+        rate: float = 0.0,
     ):
         """
         Parameters
@@ -43,8 +46,12 @@ class GBMScenarioGenerator(ScenarioGenerator):
             RNG seed.
         vol_of_vol : Optional[float]
             Default annualised vol of vol.
+        dtype : np.float32 or np.float64
+            Precision of shocks and simulated spot / vol matrices.
+        rate : float
+            Flat rate carried by every scenario.
         """
-        super().__init__(horizon=horizon, seed=seed)
+        super().__init__(horizon=horizon, seed=seed, dtype=dtype)
 
         self.assets = list(spot.keys())
 
@@ -65,10 +72,12 @@ class GBMScenarioGenerator(ScenarioGenerator):
 
         self._validate_inputs(cov)
 
-        # Cholesky factor for covariance
-        self._chol = np.linalg.cholesky(cov)
+        # Cached covariance factor (factorised in float64,
+        # stored in the simulation dtype)
+        self._chol = covariance_factor(cov).astype(self.dtype)
 
         self.vol_of_vol = vol_of_vol
+        self.rate = float(rate)
 
 
     def _validate_inputs(self, cov: np.ndarray) -> None:
@@ -87,65 +96,62 @@ class GBMScenarioGenerator(ScenarioGenerator):
             raise ValueError("Covariance diagonal must be non-negative")
 
 
-    def generate(self, n: int) -> Sequence[Scenario]:
+    def generate(self, n: int) -> ScenarioMatrix:
         """
         Generate n independent GBM market scenarios.
         """
-        dim = len(self.assets)
         sqrt_t = np.sqrt(self.horizon)
 
-        # Independent standard normals
-        z = self.rng.standard_normal(size=(n, dim))
-
         # Correlated shocks
-        z_corr = z @ self._chol.T
+        z_corr = self._correlated_shocks(n)
 
-        diffusion = sqrt_t * z_corr
-        drift_term = (self.drifts - 0.5 * self.vols ** 2) * self.horizon
+        diffusion = self.dtype.type(sqrt_t) * z_corr
+        drift_term = ((self.drifts - 0.5 * self.vols ** 2) * self.horizon).astype(self.dtype)
         # diffusion = self.vols * sqrt_t * z_corr
 
-        spot_t = self.spot * np.exp(drift_term + diffusion)
+        spot_t = self.spot.astype(self.dtype) * np.exp(drift_term + diffusion)
 
         vol_t = self._simulate_vols(n)
 
-        scenarios = []
+        return ScenarioMatrix(
+            assets=self.assets,
+            spot=spot_t,
+            vol=vol_t,
+            rate=self.rate,
+            dt=self.horizon,
+        )
+
 
-        for i in range(n):
-            scenarios.append(
-                Scenario(
-                    spot={
-                        asset: float(spot_t[i, j])
-                        for j, asset in enumerate(self.assets)
-                    },
-                    vol={
-                        asset: float(vol_t[i, j])
-                        # asset: float(self.vols[j])
-                        for j, asset in enumerate(self.assets)
-                    },
-                    rate=0.0,
-                    dt=self.horizon,
-                )
-            )
+    def _correlated_shocks(self, n: int) -> np.ndarray:
+        """
+        (n, assets) shocks with covariance equal to the input
+        covariance (per unit time).
+        """
+        dim = len(self.assets)
 
-        return scenarios
+        # Independent standard normals
+        z = self.rng.standard_normal(size=(n, dim), dtype=self.dtype)
 
+        return z @ self._chol.T
 
     def _simulate_vols(self, n: int):
         """
         Generate n independent GBM vol scenarios.
         """
+        vols = self.vols.astype(self.dtype)
+
         if self.vol_of_vol is None:
-            return np.tile(self.vols, (n, 1))
+            return np.tile(vols, (n, 1))
 
         sqrt_t = np.sqrt(self.horizon)
 
-        z = self.rng.standard_normal((n, len(self.assets)))
+        z = self.rng.standard_normal((n, len(self.assets)), dtype=self.dtype)
 
         eta = self.vol_of_vol
 
-        drift = -0.5 * eta**2 * self.horizon
-        diffusion = eta * sqrt_t * z
+        drift = self.dtype.type(-0.5 * eta**2 * self.horizon)
+        diffusion = self.dtype.type(eta * sqrt_t) * z
 
-        vol_t = self.vols * np.exp(drift + diffusion)
+        vol_t = vols * np.exp(drift + diffusion)
 
         return vol_t
\ No newline at end of file
@@ -1,10 +1,64 @@
 from abc import ABC, abstractmethod
-from typing import Sequence, Optional
+from collections import OrderedDict
+from typing import Sequence, Optional, Dict, Any, Iterator
+import hashlib
 import numpy as np
+from numpy.typing import DTypeLike
 
 from var_engine.scenarios.scenario import Scenario
 
 
+SUPPORTED_DTYPES = (np.float32, np.float64)
+
+
+def resolve_dtype(dtype: DTypeLike) -> np.dtype:
+    """
+    Validate a scenario precision ("float32" / "float64" or numpy type).
+    """
+    resolved = np.dtype(dtype)
+    if resolved.type not in SUPPORTED_DTYPES:
+        raise ValueError("dtype must be float32 or float64")
+    return resolved
+
+
+_FACTOR_CACHE: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_FACTOR_CACHE_SIZE = 16
+
+
+def covariance_factor(cov) -> np.ndarray:
+    """
+    Factor L with L @ L.T == cov, cached per process.
+
+    Cholesky (lower triangular), with an eigen-decomposition fallback
+    for positive semi-definite matrices. Generators built repeatedly on the same
+    covariance (e.g. one request per confidence level or generator
+    type) reuse the factor instead of refactorising.
+    """
+    cov = np.ascontiguousarray(cov, dtype=np.float64)
+    key = hashlib.blake2b(cov.tobytes(), digest_size=16).hexdigest() + str(cov.shape)
+
+    factor = _FACTOR_CACHE.get(key)
+    if factor is not None:
+        _FACTOR_CACHE.move_to_end(key)
+        return factor
+
+    try:
+        factor = np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        eigvals, eigvecs = np.linalg.eigh(cov)
+        if np.any(eigvals < -1e-10):
+            raise ValueError("Covariance matrix is not positive semi-definite")
+
+        factor = eigvecs * np.sqrt(np.clip(eigvals, 0.0, None))
+
+    factor.setflags(write=False)
+    _FACTOR_CACHE[key] = factor
+    if len(_FACTOR_CACHE) > _FACTOR_CACHE_SIZE:
+        _FACTOR_CACHE.popitem(last=False)
+
+    return factor
+
+
 class ScenarioGenerator(ABC):
     """
     Abstract base class for all market scenario generators.
@@ -13,7 +67,13 @@ class ScenarioGenerator(ABC):
     future horizon. It is model-aware but portfolio-agnostic.
     """
 
-    def __init__(self, horizon: float, seed: Optional[int] = None, vol_of_vol: Optional[float] = None):
+    def __init__(
+        self,
+        horizon: float,
+        seed: Optional[int] = None,
+        vol_of_vol: Optional[float] = None,
+        dtype: DTypeLike = np.float64,
+    ):
         """
         Parameters
         ----------
@@ -21,13 +81,42 @@ class ScenarioGenerator(ABC):
             Time horizon of each scenario (in years).
         seed : Optional[int]
             Random seed for reproducibility.
+        dtype : np.float32 or np.float64
+            Precision of generated shocks and scenario matrices.
         """
         if horizon <= 0.0:
             raise ValueError("Scenario horizon must be positive")
 
         self.horizon = horizon
+        self.dtype = resolve_dtype(dtype)
         self._rng = np.random.default_rng(seed)
 
+    @classmethod
+    def from_market_data(
+        cls,
+        market_data: Dict[str, Any],
+        horizon: float,
+        seed: Optional[int] = None,
+        vol_of_vol: Optional[float] = None,
+        dtype: DTypeLike = np.float64,
+        **kwargs,
+    ) -> "ScenarioGenerator":
+        """
+        Build a generator from a market_data dict.
+
+        Default: spot levels and annualised covariance. Generators that
+        need other inputs (e.g. historical returns) override this.
+        """
+        return cls(
+            spot=market_data["spot"],
+            cov=market_data["cov"] * 252,
+            horizon=horizon,
+            seed=seed,
+            vol_of_vol=vol_of_vol,
+            dtype=dtype,
+            **kwargs,
+        )
+
     @property
     def rng(self) -> np.random.Generator:
         """
@@ -55,6 +144,21 @@ class ScenarioGenerator(ABC):
 
         raise NotImplementedError
 
+    def generate_chunks(self, n: int, chunk_size: int) -> Iterator[Sequence[Scenario]]:
+        """
+        Generate n scenarios as consecutive batches of at most
+        chunk_size, so callers can revalue and discard each batch
+        without holding all n scenarios in memory.
+        """
+        if n <= 0 or chunk_size <= 0:
+            raise ValueError("n and chunk_size must be positive")
+
+        remaining = n
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            yield self.generate(size)
+            remaining -= size
+
     def reset_rng(self, seed: Optional[int] = None) -> None:
         """
         Reset the random number generator.
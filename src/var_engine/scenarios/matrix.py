@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from typing import Sequence, Optional, Union, Iterator
+import numpy as np
+
+from var_engine.scenarios.scenario import Scenario
+from var_engine.greeks.curves import PiecewiseInterestRateCurve
+
+
+@dataclass(frozen=True, eq=False)
+class ScenarioMatrix:
+    """
+    Array-backed set of market scenarios used for batched revaluation.
+
+    Row i of each array is one scenario, so the matrix behaves as a
+    Sequence[Scenario]: indexing materialises a single Scenario for
+    drilldowns and attribution, while products revalue the whole set
+    at once via `revalue_batch`.
+
+    Attributes
+    ----------
+    assets
+        Column labels shared by `spot` and `vol`.
+
+    spot
+        (n_scenarios, n_assets) absolute spot levels.
+
+    vol
+        (n_scenarios, n_assets) absolute volatilities.
+
+    rate
+        Scalar rate or (n_scenarios,) rate per scenario.
+
+    dt
+        Scenario horizon in years.
+
+    curve_tenors, curves
+        Optional zero curves: (n_scenarios, n_tenors) rates on shared
+        tenors (years). Rate products discount off these when present.
+    """
+
+    assets: Sequence[str]
+    spot: np.ndarray
+    vol: np.ndarray
+    rate: Union[float, np.ndarray]
+    dt: float
+
+    labels: Optional[Sequence[str]] = None
+
+    curve_tenors: Optional[Sequence[float]] = None
+    curves: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        if self.dt < 0.0:
+            raise ValueError("Scenario dt must be non-negative")
+
+        if self.spot.ndim != 2 or self.spot.shape[1] != len(self.assets):
+            raise ValueError("Spot matrix must have shape (n_scenarios, n_assets)")
+
+        if self.vol.shape != self.spot.shape:
+            raise ValueError("Vol matrix must match spot matrix shape")
+
+        if np.ndim(self.rate) not in (0, 1):
+            raise ValueError("Rate must be a scalar or a per-scenario vector")
+
+        if np.ndim(self.rate) == 1 and len(self.rate) != len(self.spot):
+            raise ValueError("Rate vector must have one entry per scenario")
+
+        if (self.curves is None) != (self.curve_tenors is None):
+            raise ValueError("curves and curve_tenors must be given together")
+
+        if self.curves is not None and self.curves.shape != (len(self.spot), len(self.curve_tenors)):
+            raise ValueError("Curve matrix must have shape (n_scenarios, n_tenors)")
+
+        # Column lookup used by products
+        object.__setattr__(
+            self, "_index", {a: j for j, a in enumerate(self.assets)}
+        )
+
+    def __len__(self) -> int:
+        return self.spot.shape[0]
+
+    def __iter__(self) -> Iterator[Scenario]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> Scenario:
+        """
+        Materialise scenario i as a Scenario (float64 values).
+        """
+        return Scenario(
+            spot={a: float(self.spot[i, j]) for j, a in enumerate(self.assets)},
+            vol={a: float(self.vol[i, j]) for j, a in enumerate(self.assets)},
+            rate=self.rate_at(i),
+            dt=self.dt,
+            label=self.labels[i] if self.labels is not None else None,
+            curve_tenors=tuple(float(t) for t in self.curve_tenors) if self.curves is not None else None,
+            curve=tuple(float(r) for r in self.curves[i]) if self.curves is not None else None,
+        )
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.spot.dtype
+
+    def column(self, asset: str) -> int:
+        """
+        Column index of an asset in the spot / vol matrices.
+        """
+        try:
+            return self._index[asset]
+        except KeyError:
+            raise KeyError(f"Scenario missing data for {asset}")
+
+    def rate_at(self, i: int) -> float:
+        if np.ndim(self.rate) == 0:
+            return float(self.rate)
+        return float(self.rate[i])
+
+    def rate_vector(self) -> np.ndarray:
+        """
+        Rate broadcast to one value per scenario.
+        """
+        return np.broadcast_to(
+            np.asarray(self.rate, dtype=self.dtype), (len(self),)
+        )
+
+    def zero_rates(self, maturity: float) -> np.ndarray:
+        """
+        (n_scenarios,) zero rate at `maturity` (years): the scenario
+        curves interpolated in one matrix-vector product when present,
+        else the flat rate vector.
+        """
+        if self.curves is None:
+            return self.rate_vector()
+
+        w = PiecewiseInterestRateCurve(
+            list(self.curve_tenors), [0.0] * len(self.curve_tenors)
+        ).interpolation_weights([maturity])[0]
+
+        return (self.curves @ w).astype(self.dtype, copy=False)
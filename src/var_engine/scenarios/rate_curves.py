@@ -0,0 +1,180 @@
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from var_engine.time_series.aggregation import overlapping_returns
+
+
+TENOR_UNITS = {"D": 1.0 / 365, "W": 7.0 / 365, "M": 1.0 / 12, "Y": 1.0}
+
+
+def parse_tenor(label: str) -> float:
+    """
+    Tenor label in years: "3M" -> 0.25, "2Y" -> 2.0, "10" -> 10.0.
+    """
+    text = str(label).strip().upper()
+    unit = TENOR_UNITS.get(text[-1:])
+    try:
+        return float(text[:-1]) * unit if unit is not None else float(text)
+    except ValueError:
+        raise ValueError(f"Cannot parse tenor label: {label!r}")
+
+
+@dataclass(frozen=True, eq=False)
+class CurveHistory:
+    """
+    Zero curve on fixed tenors: today's levels and daily level changes.
+
+    Rate scenarios are (n_scenarios, n_tenors) arrays, base + shock;
+    products interpolate them at their own dates (see
+    ScenarioMatrix.zero_rates and BondProduct.price_on_curves). A single
+    rate series is a one-tenor, i.e. flat, curve.
+
+    Attributes
+    ----------
+    tenors
+        (k,) tenors in years, ascending.
+    base
+        (k,) current zero rates (decimals).
+    changes
+        (T, k) daily changes in zero rates.
+    """
+    tenors: np.ndarray
+    base: np.ndarray
+    changes: np.ndarray
+
+    def __post_init__(self):
+        if self.changes.ndim != 2 or self.changes.shape[1] != len(self.tenors):
+            raise ValueError("Curve changes must have shape (n_days, n_tenors)")
+        if self.base.shape != self.tenors.shape:
+            raise ValueError("Base curve must have one rate per tenor")
+
+    @classmethod
+    def from_market_data(cls, market_data: Dict[str, Any]) -> Optional["CurveHistory"]:
+        """
+        Curve from a market_data dict carrying a multi-tenor rate source
+        ("rate_curve": factors and last levels; daily changes are the
+        factors' columns in "returns"), or a single rate series ("rate"
+        level with a "rate" column of changes) as a flat curve. None when
+        rates are not historical.
+        """
+        spec = market_data.get("rate_curve")
+        if spec is None:
+            returns = market_data.get("returns")
+            if "rate" not in market_data or returns is None or "rate" not in returns.columns:
+                return None
+
+            return cls(
+                tenors=np.zeros(1),
+                base=np.array([float(market_data["rate"])]),
+                changes=returns[["rate"]].to_numpy(dtype=np.float64),
+            )
+
+        factors = list(spec["factors"])
+        tenors = np.array([parse_tenor(f.split(":", 1)[-1]) for f in factors])
+        order = np.argsort(tenors, kind="stable")
+
+        changes = market_data["returns"][factors].to_numpy(dtype=np.float64)
+
+        return cls(
+            tenors=tenors[order],
+            base=np.asarray(spec["base"], dtype=np.float64)[order],
+            changes=changes[:, order],
+        )
+
+    # -----------------------------------------------------
+    # Historical curve scenarios
+    # -----------------------------------------------------
+
+    def historical(self, horizon_days: int = 1, dtype: DTypeLike = np.float64) -> np.ndarray:
+        """
+        (T - h + 1, k) curves: base + every overlapping h-day change,
+        in the same windows as HistSim's spot returns.
+        """
+        shocks = overlapping_returns(self.changes, horizon_days)
+        return (self.base + shocks).astype(dtype, copy=False)
+
+    # -----------------------------------------------------
+    # PCA (level / slope / curvature) scenarios
+    # -----------------------------------------------------
+
+    def principal_components(self, n_components: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Leading eigenvectors of the daily-change covariance, as
+        ((k, c) loadings, (c,) daily standard deviations). For a yield
+        curve the first three are level, slope and curvature.
+        """
+        c = min(int(n_components), len(self.tenors))
+        if c < 1:
+            raise ValueError("n_components must be at least 1")
+
+        cov = np.atleast_2d(np.cov(self.changes, rowvar=False))
+        eigvals, eigvecs = np.linalg.eigh(cov)
+
+        top = np.argsort(eigvals)[::-1][:c]
+        return eigvecs[:, top], np.sqrt(np.clip(eigvals[top], 0.0, None))
+
+    def simulate(
+        self,
+        n: int,
+        horizon_days: float,
+        rng: np.random.Generator,
+        n_components: int = 3,
+        dtype: DTypeLike = np.float64,
+        given: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """
+        (n, k) curves: base + normal shocks to the leading principal
+        components, scaled by sqrt(horizon_days).
+
+        Without `given` the shocks are independent of everything else.
+        `given` = ((T, a) daily returns of other factors on the same
+        rows as the curve changes, (n, a) their simulated h-day returns)
+        draws the components from the normal conditional on those
+        draws,
+
+            s | x ~ N(B (x - h mu), h (C_ss - B C_xs)),  B = C_sx C_xx^-1,
+
+        so the historical curve / factor correlation carries over to
+        scenarios from any factor generator.
+        """
+        loadings, std = self.principal_components(n_components)
+
+        z = rng.standard_normal((n, len(std)))
+
+        if given is None:
+            shocks = (z * (std * np.sqrt(horizon_days))) @ loadings.T
+            return (self.base + shocks).astype(dtype, copy=False)
+
+        hist, draws = (np.asarray(a, dtype=np.float64) for a in given)
+        if len(hist) != len(self.changes) or len(draws) != n:
+            raise ValueError("given must hold (T, a) history and (n, a) draws")
+
+        x = hist - hist.mean(axis=0)
+        scores = (self.changes - self.changes.mean(axis=0)) @ loadings
+        m = max(len(x) - 1, 1)
+
+        c_xx = x.T @ x / m
+        c_sx = scores.T @ x / m
+        B = c_sx @ np.linalg.pinv(c_xx)
+
+        # Residual covariance root (clipped: it is PSD up to rounding)
+        resid = np.diag(std ** 2) - B @ c_sx.T
+        s, u = np.linalg.eigh((resid + resid.T) / 2.0)
+        root = u * np.sqrt(np.clip(s, 0.0, None))
+
+        mean = (draws - horizon_days * hist.mean(axis=0)) @ B.T
+        pcs = mean + np.sqrt(horizon_days) * z @ root.T
+
+        return (self.base + pcs @ loadings.T).astype(dtype, copy=False)
+
+    def attach(self, scenarios, curves: np.ndarray):
+        """
+        ScenarioMatrix with `curves` on this curve's tenors. A flat
+        (single-series) curve also sets the per-scenario rate, for
+        products that read the rate rather than the curve.
+        """
+        extra = {"rate": curves[:, 0].astype(scenarios.dtype)} if len(self.tenors) == 1 else {}
+        return replace(scenarios, curve_tenors=tuple(self.tenors.tolist()), curves=curves, **extra)
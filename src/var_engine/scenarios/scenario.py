@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
-from typing import Mapping, Optional, Any
+from typing import Mapping, Optional, Any, Tuple
 import uuid
 
+import numpy as np
+
 @dataclass(frozen=True)
 class Scenario:
     """
@@ -22,6 +24,10 @@ class Scenario:
     metadata
         Optional free-form metadata for diagnostics.
         (e.g. percentile, source, regime tag).
+
+    curve_tenors, curve
+        Optional zero curve (tenors in years, rates). Rate products
+        discount off it when present instead of the flat `rate`.
     """
 
     spot: Mapping[str, float]
@@ -33,6 +39,9 @@ class Scenario:
     label: Optional[str] = None
     metadata: Optional[Mapping[str, Any]] = None
 
+    curve_tenors: Optional[Tuple[float, ...]] = None
+    curve: Optional[Tuple[float, ...]] = None
+
     def __post_init__(self):
         if self.dt < 0.0:
             raise ValueError("Scenario dt must be non-negative")
@@ -45,6 +54,21 @@ class Scenario:
         
         if not isinstance(self.id, str):
             raise ValueError("Scenario id must be a string")
+
+        if (self.curve is None) != (self.curve_tenors is None):
+            raise ValueError("curve and curve_tenors must be given together")
+
+        if self.curve is not None and len(self.curve) != len(self.curve_tenors):
+            raise ValueError("Curve must have one rate per tenor")
+
+    def zero_rate(self, maturity: float) -> float:
+        """
+        Zero rate at `maturity` (years): interpolated off the curve
+        when present, else the flat rate.
+        """
+        if self.curve is None:
+            return self.rate
+        return float(np.interp(maturity, self.curve_tenors, self.curve))
         
     def with_label(self, label: str) -> "Scenario":
         """Return a copy with a new label."""
@@ -56,6 +80,8 @@ class Scenario:
             id=self.id,
             label=label,
             metadata=self.metadata,
+            curve_tenors=self.curve_tenors,
+            curve=self.curve,
         )
 
     def with_metadata(self, metadata: Mapping[str, Any]) -> "Scenario":
@@ -68,4 +94,6 @@ class Scenario:
             id=self.id,
             label=self.label,
             metadata=metadata,
+            curve_tenors=self.curve_tenors,
+            curve=self.curve,
         )        
\ No newline at end of file
@@ -0,0 +1,43 @@
+import numpy as np
+
+
+def overlapping_returns(returns: np.ndarray, horizon_days: int) -> np.ndarray:
+    """
+    Overlapping h-day cumulative log returns from daily log returns.
+
+    Uses one prefix sum over the time axis, so every window is a single
+    subtraction regardless of h:
+
+        R[t] = C[t + h] - C[t],   C = [0, cumsum(r)]
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        (T, n) daily log returns.
+    horizon_days : int
+        Window length h in days.
+
+    Returns
+    -------
+    np.ndarray
+        (T - h + 1, n) overlapping h-day returns, in the input dtype.
+        Row t covers days t .. t + h - 1.
+    """
+    if horizon_days < 1:
+        raise ValueError("horizon_days must be at least 1")
+
+    returns = np.asarray(returns)
+
+    if horizon_days == 1:
+        return returns
+
+    if horizon_days > returns.shape[0]:
+        raise ValueError(
+            f"Not enough returns ({returns.shape[0]}) for a {horizon_days}-day horizon"
+        )
+
+    # Accumulate in float64 so long windows do not drift in float32
+    prefix = np.zeros((returns.shape[0] + 1,) + returns.shape[1:], dtype=np.float64)
+    np.cumsum(returns, axis=0, dtype=np.float64, out=prefix[1:])
+
+    return (prefix[horizon_days:] - prefix[:-horizon_days]).astype(returns.dtype, copy=False)
@@ -0,0 +1,102 @@
+from typing import Optional, Sequence
+import numpy as np
+import pandas as pd
+
+
+class FactorCovariance:
+    """
+    Covariance in low-rank-plus-diagonal form:
+
+        Sigma = B F B' + diag(d)
+
+    with B (n, k) loadings, F (k, k) factor covariance and d (n,)
+    specific variances. Products with Sigma cost O(n k), so portfolio
+    variance and risk contributions never need the dense n x n matrix.
+    """
+
+    def __init__(
+        self,
+        loadings: np.ndarray,
+        factor_cov: np.ndarray,
+        specific_var: np.ndarray,
+        index: Optional[Sequence[str]] = None,
+    ):
+        self.loadings = np.asarray(loadings, dtype=np.float64)
+        self.factor_cov = np.atleast_2d(np.asarray(factor_cov, dtype=np.float64))
+        self.specific_var = np.asarray(specific_var, dtype=np.float64)
+        self.index = list(index) if index is not None else list(range(len(self.specific_var)))
+
+        n, k = self.loadings.shape
+        if self.factor_cov.shape != (k, k) or self.specific_var.shape != (n,):
+            raise ValueError("Inconsistent factor covariance shapes")
+
+    @property
+    def n_factors(self) -> int:
+        return self.loadings.shape[1]
+
+    def dot(self, w: np.ndarray) -> np.ndarray:
+        """
+        Sigma @ w for w of shape (n,) or (n, m).
+        """
+        w = np.asarray(w, dtype=np.float64)
+        d = self.specific_var if w.ndim == 1 else self.specific_var[:, None]
+        return d * w + self.loadings @ (self.factor_cov @ (self.loadings.T @ w))
+
+    def quad(self, w: np.ndarray) -> float:
+        """
+        w' Sigma w.
+        """
+        w = np.asarray(w, dtype=np.float64)
+        bw = self.loadings.T @ w
+        return float(w @ (self.specific_var * w) + bw @ self.factor_cov @ bw)
+
+    def diag(self) -> np.ndarray:
+        return self.specific_var + np.einsum("ik,kl,il->i", self.loadings, self.factor_cov, self.loadings)
+
+    def to_dense(self) -> pd.DataFrame:
+        dense = self.loadings @ self.factor_cov @ self.loadings.T + np.diag(self.specific_var)
+        return pd.DataFrame(dense, index=self.index, columns=self.index)
+
+
+def pca_factor_covariance(returns_df: pd.DataFrame, n_factors: int = 10) -> FactorCovariance:
+    """
+    k-factor statistical model of the sample covariance.
+
+    The leading k principal components of the demeaned returns (thin SVD,
+    no n x n matrix) give the loadings and factor variances; the rest of
+    each asset's sample variance becomes its specific variance.
+
+    Parameters
+    ----------
+    returns_df : pd.DataFrame
+        (T, n) returns.
+    n_factors : int
+        Number of factors k (capped at min(T - 1, n)).
+    """
+    x = returns_df.to_numpy(dtype=np.float64)
+    T, n = x.shape
+    if T < 2:
+        raise ValueError("At least two return observations are required")
+
+    x = x - x.mean(axis=0)
+    _, s, vt = np.linalg.svd(x, full_matrices=False)
+
+    k = max(1, min(int(n_factors), T - 1, n))
+    loadings = vt[:k].T
+    factor_var = s[:k] ** 2 / (T - 1)
+
+    total_var = (x * x).sum(axis=0) / (T - 1)
+    common_var = (loadings ** 2) @ factor_var
+    specific_var = np.clip(total_var - common_var, 0.0, None)
+
+    return FactorCovariance(loadings, np.diag(factor_var), specific_var, index=returns_df.columns)
+
+
+def pca_cov_estimator(n_factors: int = 10):
+    """
+    cov_estimator for ParametricVaR returning a FactorCovariance.
+    """
+    def estimate(returns_df: pd.DataFrame) -> FactorCovariance:
+        return pca_factor_covariance(returns_df, n_factors=n_factors)
+
+    return estimate
@@ -0,0 +1,296 @@
+from typing import Optional, Iterator, Tuple, Callable
+import numpy as np
+import pandas as pd
+
+
+class MomentState:
+    """
+    Running sums and cross-products of a set of return rows.
+
+    Adding or dropping k rows costs O(k n^2), so a rolling-window
+    covariance advances by one day without revisiting the window:
+
+        cov = (X'X - s s' / m) / (m - ddof),   s = sum of rows, m = count
+    """
+
+    def __init__(self, n: int):
+        self.count = 0
+        self.sum = np.zeros(n, dtype=np.float64)
+        self.cross = np.zeros((n, n), dtype=np.float64)
+
+    @classmethod
+    def from_returns(cls, returns: np.ndarray) -> "MomentState":
+        x = np.asarray(returns, dtype=np.float64)
+        state = cls(x.shape[1])
+        state.add(x)
+        return state
+
+    def copy(self) -> "MomentState":
+        state = MomentState(len(self.sum))
+        state.count = self.count
+        state.sum = self.sum.copy()
+        state.cross = self.cross.copy()
+        return state
+
+    def add(self, rows: np.ndarray) -> None:
+        """
+        Add (k, n) rows (or a single (n,) row).
+        """
+        x = np.atleast_2d(np.asarray(rows, dtype=np.float64))
+        self.count += len(x)
+        self.sum += x.sum(axis=0)
+        self.cross += x.T @ x
+
+    def drop(self, rows: np.ndarray) -> None:
+        """
+        Remove (k, n) rows previously added.
+        """
+        x = np.atleast_2d(np.asarray(rows, dtype=np.float64))
+        if len(x) > self.count:
+            raise ValueError("Cannot drop more rows than were added")
+        self.count -= len(x)
+        self.sum -= x.sum(axis=0)
+        self.cross -= x.T @ x
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.sum / self.count
+
+    def cov(self, ddof: int = 1) -> Optional[np.ndarray]:
+        """
+        Sample covariance of the current rows (None if too few rows).
+        """
+        if self.count <= ddof:
+            return None
+        return (self.cross - np.outer(self.sum, self.sum) / self.count) / (self.count - ddof)
+
+
+class RollingCovariance:
+    """
+    Fixed-window sample covariance advanced one day at a time.
+
+    Keeps the last `window` rows in a ring buffer and their MomentState;
+    each update is a rank-1 add plus a rank-1 drop, O(n^2).
+    """
+
+    def __init__(self, n: int, window: int, ddof: int = 1):
+        if window <= ddof:
+            raise ValueError("window must exceed ddof")
+
+        self.window = int(window)
+        self.ddof = ddof
+        self.moments = MomentState(n)
+        self._buffer = np.empty((self.window, n), dtype=np.float64)
+        self._pos = 0
+
+    def update(self, row: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Add one day of returns; returns the current covariance.
+        """
+        row = np.asarray(row, dtype=np.float64)
+
+        if self.moments.count == self.window:
+            self.moments.drop(self._buffer[self._pos])
+
+        self._buffer[self._pos] = row
+        self.moments.add(row)
+        self._pos = (self._pos + 1) % self.window
+
+        return self.cov()
+
+    def cov(self) -> Optional[np.ndarray]:
+        return self.moments.cov(self.ddof)
+
+
+class EWMACovariance:
+    """
+    RiskMetrics EWMA covariance (zero mean), one day at a time:
+
+        S[t] = lam * S[t-1] + (1 - lam) * r[t] r[t]'
+    """
+
+    def __init__(self, n: int, lam: float = 0.94, init: Optional[np.ndarray] = None):
+        if not 0.0 < lam < 1.0:
+            raise ValueError("EWMA lambda must be between 0 and 1")
+
+        self.lam = lam
+        self.state = (
+            np.zeros((n, n), dtype=np.float64) if init is None
+            else np.array(init, dtype=np.float64)
+        )
+
+    def update(self, row: np.ndarray) -> np.ndarray:
+        row = np.asarray(row, dtype=np.float64)
+        self.state *= self.lam
+        self.state += (1.0 - self.lam) * np.outer(row, row)
+        return self.state
+
+    def cov(self) -> np.ndarray:
+        return self.state
+
+
+# --------------------------------------------
+# Batched covariance streams over a history
+# --------------------------------------------
+
+# Memory budget for one (block, n, n) batch of covariances
+_BLOCK_BYTES = 64 << 20
+
+
+def _block_rows(n: int, block_size: Optional[int]) -> int:
+    fit = max(1, _BLOCK_BYTES // (3 * 8 * n * n))
+    return fit if block_size is None else max(1, min(block_size, fit))
+
+
+def _outer_rows(x: np.ndarray) -> np.ndarray:
+    return x[:, :, None] * x[:, None, :]
+
+
+def rolling_covariance(
+    returns,
+    window: int,
+    ddof: int = 1,
+    block_size: Optional[int] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Sample covariance over a trailing window for every date, as a
+    stream of (positions, covs) blocks.
+
+    Within a block, window sums and cross-products for all dates come
+    from one cumulative sum of (added - dropped) outer products, so the
+    cost is O(n^2) per date instead of O(window * n^2). Sums are
+    re-anchored exactly at each block start so rounding does not
+    accumulate across a long history.
+
+    Parameters
+    ----------
+    returns : pd.DataFrame or np.ndarray
+        (T, n) returns.
+    window : int
+        Window length in days.
+    ddof : int
+        Delta degrees of freedom.
+    block_size : Optional[int]
+        Dates per block (default: as many as fit in ~64 MB).
+
+    Yields
+    ------
+    (np.ndarray, np.ndarray)
+        Row positions t (window - 1 <= t < T) and their (k, n, n)
+        covariances over rows t - window + 1 .. t.
+    """
+    x = np.asarray(returns, dtype=np.float64)
+    T, n = x.shape
+
+    if window <= ddof:
+        raise ValueError("window must exceed ddof")
+    if T < window:
+        return
+
+    b = _block_rows(n, block_size)
+
+    for start in range(window - 1, T, b):
+        stop = min(start + b, T)
+
+        # Exact (window - 1)-row window ending just before the block:
+        # its first date only adds, later dates add one row and drop one
+        base = x[start - window + 1:start]
+        s0 = base.sum(axis=0)
+        c0 = base.T @ base
+
+        add = x[start:stop]
+        drop = np.vstack([np.zeros((1, n)), x[start - window + 1:stop - window]])
+
+        sums = s0 + np.cumsum(add - drop, axis=0)
+        cross = c0 + np.cumsum(_outer_rows(add) - _outer_rows(drop), axis=0)
+
+        covs = (cross - _outer_rows(sums) / window) / (window - ddof)
+
+        yield np.arange(start, stop), covs
+
+
+def ewma_covariance(
+    returns,
+    lam: float = 0.94,
+    init: Optional[np.ndarray] = None,
+    block_size: Optional[int] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    EWMA (RiskMetrics, zero-mean) covariance for every date, as a stream
+    of (positions, covs) blocks.
+
+    Within a block the recursion is solved in closed form,
+
+        S[a+j] = lam^(j+1) S[a-1] + (1 - lam) sum_i lam^(j-i) r r'[a+i],
+
+    as a single weighted cumulative sum. Block length is capped so the
+    lam^-j weights stay well conditioned.
+
+    Parameters
+    ----------
+    returns : pd.DataFrame or np.ndarray
+        (T, n) returns.
+    lam : float
+        Decay factor in (0, 1).
+    init : Optional[np.ndarray]
+        (n, n) seed covariance. Defaults to the mean of r r' over the
+        whole sample, as in `ewma_variance`.
+    block_size : Optional[int]
+        Dates per block (default: as many as fit in ~64 MB).
+
+    Yields
+    ------
+    (np.ndarray, np.ndarray)
+        Row positions t and their (k, n, n) covariances, including row t.
+    """
+    if not 0.0 < lam < 1.0:
+        raise ValueError("EWMA lambda must be between 0 and 1")
+
+    x = np.asarray(returns, dtype=np.float64)
+    T, n = x.shape
+    if T == 0:
+        return
+
+    state = (x.T @ x) / T if init is None else np.array(init, dtype=np.float64)
+
+    # Keep lam^-b below 1e4
+    b = min(_block_rows(n, block_size), max(1, int(4 * np.log(10) / -np.log(lam))))
+
+    for start in range(0, T, b):
+        stop = min(start + b, T)
+        j = np.arange(stop - start)
+
+        growth = lam ** -j.astype(np.float64)
+        weighted = np.cumsum(_outer_rows(x[start:stop]) * growth[:, None, None], axis=0)
+
+        covs = (
+            (lam ** (j + 1))[:, None, None] * state
+            + (1.0 - lam) * (lam ** j)[:, None, None] * weighted
+        )
+        state = covs[-1]
+
+        yield np.arange(start, stop), covs
+
+
+def ewma_cov_estimator(lam: float = 0.94, cached: Optional[Callable] = None):
+    """
+    cov_estimator for ParametricVaR / VarianceCovarianceVaR returning
+    the EWMA covariance at the end of the returns window.
+
+    `cached(lam, returns_df)` may supply a maintained state (e.g.
+    MarketSnapshot.ewma_cov); it returns None for windows it does not
+    hold, and the recursion is then run over returns_df.
+    """
+    def estimate(returns_df: pd.DataFrame) -> pd.DataFrame:
+        if cached is not None:
+            cov = cached(lam, returns_df)
+            if cov is not None:
+                return cov
+
+        cov = None
+        for _, covs in ewma_covariance(returns_df, lam=lam):
+            cov = covs[-1]
+
+        return pd.DataFrame(cov, index=returns_df.columns, columns=returns_df.columns)
+
+    return estimate